@@ -1,14 +1,30 @@
 import streamlit as st
-import pandas as pd
+import os
+import tempfile
 from datetime import datetime, timedelta
+from functools import partial
 from io import BytesIO
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-import numpy as np
-import math
+
+from astro_gann import PLANETS, format_report_frame, get_market_hours, is_trading_day
+from astro_gann.cache import cache_from_env
+from astro_gann.diagnostics import StageTimer, stage
+from astro_gann.export import write_excel, write_pdf
+from astro_gann.intraday import downsample, intraday_grid
+from astro_gann.ladder import LadderBook
+from astro_gann.live import LiveFeed, csv_tail_source, socket_source
+from astro_gann.report import report_frame
+from astro_gann.rules import get_rules, reload_rules
+from astro_gann.screener import load_watchlist, screen
+from astro_gann.store import store_from_env
+from astro_gann.stream import iter_report_frames, parse_symbols, write_csv, write_parquet
+from astro_gann.styles import frame_page, page_count, style_frame
+from astro_gann.trading_calendar import get_calendar
+
+# Rows styled and sent to the browser per table page
+TABLE_PAGE_SIZE = 500
+
+# Stored history rows shown in the sidebar panel
+HISTORY_LIMIT = 200
 
 # Set page config for a wider layout
 st.set_page_config(
@@ -408,237 +424,306 @@ with st.sidebar:
     font_size = st.slider("Table Font Size", min_value=12, max_value=24, value=16, step=1)
     box_bg_color = st.color_picker("Background Color for Tables", "#e8eaf6")
     swing_range_multiplier = st.slider("Swing Range Multiplier", min_value=0.5, max_value=3.0, value=1.0, step=0.1)
+    show_diagnostics = st.checkbox("Show Diagnostics", value=False)
+    
+    st.markdown("### 📆 Report Mode")
+    report_mode = st.radio("Report Mode", ["Single Day", "Date Range", "Watchlist Screener"], label_visibility="collapsed")
+    if report_mode == "Date Range":
+        range_end_date = st.date_input("End Date", datetime.today() + timedelta(days=90))
+        range_step_days = st.number_input("Step (days)", min_value=1, max_value=30, value=1, step=1)
+        range_extra_symbols = st.text_area("Additional Symbols (SYMBOL:CMP, one per line)", "")
+        range_format = st.radio("Export Format", ["CSV", "Excel", "Parquet", "PDF"], horizontal=True)
+    elif report_mode == "Watchlist Screener":
+        watchlist_file = st.file_uploader("Watchlist (symbol, cmp[, volatility])", type=["csv", "parquet"])
+        screener_top = st.number_input("Top Symbols", min_value=5, max_value=500, value=50, step=5)
+        screener_follow = st.checkbox("Screen at the current time (every minute)", value=False)
+    
+    st.markdown("### 📡 Live CMP Feed")
+    live_source = st.selectbox("Tick Source", ["Off", "Tailed CSV", "Socket"])
+    if live_source != "Off":
+        live_address = st.text_input(
+            "CSV Path" if live_source == "Tailed CSV" else "Host:Port",
+            "ticks.csv" if live_source == "Tailed CSV" else "127.0.0.1:9009",
+        )
+        live_rate = st.slider("UI Updates per Second", min_value=1, max_value=10, value=2, step=1)
 
 # Generate button
 generate_report = st.button("🔮 Generate Astro-Gann Report", use_container_width=True)
 
 # Define market hours
-if market == "Indian Market":
-    market_start = datetime.strptime("09:15", "%H:%M").time()
-    market_end = datetime.strptime("15:15", "%H:%M").time()
-else:
-    market_start = datetime.strptime("05:00", "%H:%M").time()
-    market_end = datetime.strptime("23:35", "%H:%M").time()
-
-# Function to determine the important planet for the day
-def get_important_planet(date):
-    day_of_week = date.weekday()  # Monday is 0, Sunday is 6
-    day_rulers = {
-        0: "Moon",      # Monday
-        1: "Mars",      # Tuesday
-        2: "Mercury",   # Wednesday
-        3: "Jupiter",   # Thursday
-        4: "Venus",     # Friday
-        5: "Saturn",    # Saturday
-        6: "Sun"        # Sunday
-    }
-    return day_rulers.get(day_of_week, "Moon")
-
-# Function to check if time is within market hours
-def is_within_market_hours(time):
-    return market_start <= time <= market_end
-
-# Function to adjust timing to market hours
-def adjust_timing_to_market(start_time, end_time):
-    if market == "Global Market":
-        return start_time, end_time
-        
-    if start_time.time() < market_start:
-        start_time = datetime.combine(start_time.date(), market_start)
-    if end_time.time() > market_end:
-        end_time = datetime.combine(end_time.date(), market_end)
-    
-    if start_time >= end_time:
-        return None, None
-    
-    return start_time, end_time
-
-# Function to determine if a planet's transit is favorable or negative
-def get_transit_nature(planet, degree):
-    favorable_degrees = {
-        "Sun": [(0, 30), (120, 150), (240, 270)],
-        "Moon": [(60, 90), (150, 180), (270, 300)],
-        "Mercury": [(60, 90), (180, 210), (300, 330)],
-        "Venus": [(30, 60), (150, 180), (270, 300)],
-        "Mars": [(0, 30), (90, 120), (240, 270)],
-        "Jupiter": [(0, 30), (120, 150), (240, 270)],
-        "Saturn": [(60, 90), (210, 240), (300, 330)]
-    }
-    
-    for start, end in favorable_degrees.get(planet, []):
-        if start <= degree <= end:
-            return "Favorable"
-    
-    unfavorable_degrees = {
-        "Sun": [(90, 120), (210, 240), (330, 360)],
-        "Moon": [(0, 30), (120, 150), (210, 240)],
-        "Mercury": [(0, 30), (120, 150), (210, 240)],
-        "Venus": [(120, 150), (210, 240), (330, 360)],
-        "Mars": [(60, 90), (180, 210), (300, 330)],
-        "Jupiter": [(90, 120), (210, 240), (330, 360)],
-        "Saturn": [(0, 30), (120, 150), (240, 270)]
-    }
-    
-    for start, end in unfavorable_degrees.get(planet, []):
-        if start <= degree <= end:
-            return "Negative"
-    
-    return "Neutral"
-
-# Function to calculate Moon-Rahu and Moon-Ketu transit times
-def calculate_moon_nodes_transit(dt, moon_degree):
-    rahu_degree = 90
-    ketu_degree = 270
-    moon_speed = 0.5
-    
-    moon_rahu_aspects = []
-    for aspect in [0, 60, 90, 120, 180]:
-        target_degree = (rahu_degree + aspect) % 360
-        diff = (target_degree - moon_degree) % 360
-        if diff > 180:
-            diff -= 360
-        
-        hours_to_aspect = diff / moon_speed
-        
-        if hours_to_aspect > 0:
-            aspect_time = dt + timedelta(hours=hours_to_aspect)
-            moon_rahu_aspects.append({
-                "aspect": f"Moon-Rahu {aspect}°",
-                "time": aspect_time.strftime('%I:%M %p')
-            })
-    
-    moon_ketu_aspects = []
-    for aspect in [0, 60, 90, 120, 180]:
-        target_degree = (ketu_degree + aspect) % 360
-        diff = (target_degree - moon_degree) % 360
-        if diff > 180:
-            diff -= 360
-        
-        hours_to_aspect = diff / moon_speed
-        
-        if hours_to_aspect > 0:
-            aspect_time = dt + timedelta(hours=hours_to_aspect)
-            moon_ketu_aspects.append({
-                "aspect": f"Moon-Ketu {aspect}°",
-                "time": aspect_time.strftime('%I:%M %p')
-            })
-    
-    return moon_rahu_aspects, moon_ketu_aspects
+# Session hours for the selected date from the trading calendar; special
+# sessions (e.g. Muhurat trading) have their own hours
+trading_calendar = get_calendar()[market]
+market_start, market_end = trading_calendar.session(date_input) or get_market_hours(market)
+special_session = trading_calendar.special_session_name(date_input)
 
 # Combine date and time
 dt = datetime.combine(date_input, time_input)
 
-# Mock planetary positions calculation
-def get_planetary_positions(dt):
-    base_positions = {
-        "Sun": 120.54,
-        "Moon": 183.77,
-        "Mercury": 45.32,
-        "Venus": 210.65,
-        "Mars": 95.78,
-        "Jupiter": 310.22,
-        "Saturn": 275.43
-    }
-    
-    time_factor = (dt.hour * 60 + dt.minute) / (24 * 60)
-    positions = {}
-    for planet, base_pos in base_positions.items():
-        movement = {
-            "Sun": 0.04,
-            "Moon": 0.5,
-            "Mercury": 0.3,
-            "Venus": 0.2,
-            "Mars": 0.1,
-            "Jupiter": 0.05,
-            "Saturn": 0.03
-        }
-        positions[planet] = (base_pos + movement[planet] * dt.hour) % 360
-    
-    return positions
-
-# Get nakshatra based on moon's position
-def get_nakshatra(degree):
-    nakshatras = [
-        "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu",
-        "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta",
-        "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
-        "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
-        "Uttara Bhadrapada", "Revati"
-    ]
-    index = int(degree / (360/27)) % 27
-    return nakshatras[index]
-
-# Calculate Gann price levels based on planet's degree
-def calculate_gann_levels(cmp, planet_degree, planet_name):
-    zodiac_index = int(planet_degree / 30) % 12
-    
-    zodiac_volatility = {
-        0: 1.2, 1: 0.8, 2: 1.1, 3: 0.9, 4: 1.3, 5: 1.0,
-        6: 1.0, 7: 1.1, 8: 0.7, 9: 0.9, 10: 1.2, 11: 0.8
-    }
-    
-    planet_multipliers = {
-        "Sun": 1.0, "Moon": 0.8, "Mercury": 1.1, "Venus": 0.7,
-        "Mars": 1.3, "Jupiter": 1.2, "Saturn": 0.9
-    }
-    
-    degree_in_sign = planet_degree % 30
-    volatility_factor = zodiac_volatility[zodiac_index] * planet_multipliers[planet_name]
-    
-    if degree_in_sign < 5 or degree_in_sign > 25:
-        volatility_factor *= 1.2
-    
-    base_range_percent = 0.01 * swing_range_multiplier
-    range_percent = base_range_percent * volatility_factor
-    
-    range_size = cmp * range_percent
-    swing_low = cmp - range_size
-    swing_high = cmp + range_size
-    
-    degree_range = 3 * volatility_factor
-    degree_low = (planet_degree - degree_range) % 360
-    degree_high = (planet_degree + degree_range) % 360
-    
-    return swing_low, swing_high, degree_low, degree_high
-
-# Calculate timing window
-def calculate_timing(dt, planet):
-    base_duration = {
-        "Sun": 30, "Moon": 90, "Mercury": 45, "Venus": 60,
-        "Mars": 75, "Jupiter": 120, "Saturn": 150
-    }
+# Report cache shared by every session on this server
+@st.cache_resource
+def get_report_cache():
+    return cache_from_env()
+
+report_cache = get_report_cache()
+
+# History of every generated report, in the user's data directory
+# (ASTRO_GANN_STORE overrides the path; ASTRO_GANN_STORE=off disables it)
+@st.cache_resource
+def get_report_store():
+    return store_from_env()
+
+report_store = get_report_store()
+
+# Square-of-Nine ladders, reused across reruns until a planet changes degree bucket
+@st.cache_resource
+def get_ladder_book():
+    return LadderBook()
+
+ladder_book = get_ladder_book()
+
+# Active astro rule set; its key is part of every cached stage below so a
+# reload from the sidebar invalidates them
+rules = get_rules()
+
+# Cached stages keyed only on their real inputs. The engine (positions, Moon
+# nodes, timing windows) is keyed on date/time, market and multiplier inside
+# the report cache; levels, frames and export files add symbol and CMP. A
+# cosmetic widget (font size, colours) reruns the script but hits all of them.
+@st.cache_data(max_entries=64, show_spinner=False)
+def report_frames(dt, cmp, symbol, market, swing_range_multiplier, now, rules_key, _timer=None):
+    report = report_cache.get_report(dt, cmp, symbol, market, swing_range_multiplier, now=now, timer=_timer)
+    # A new ``now`` misses this cache every minute, but the store skips a report
+    # it already holds, so only a new date, CMP, symbol or setting is written
+    if report_store is not None:
+        with stage(_timer, "store"):
+            report_store.add([report])
+    report_df = report.to_frame()
+    return report, report_df, format_report_frame(report_df)
+
+# Export files are built only when their download button is clicked, and are
+# keyed on what they render -- the report inputs and its current-transit
+# flags -- rather than on the minute, which only ever moves those flags.
+@st.cache_data(max_entries=64, show_spinner=False)
+def report_export(fmt, dt, cmp, symbol, market, swing_range_multiplier, rules_key, current_flags, _report_df, _df):
+    if fmt == "csv":
+        return _df.to_csv(index=False).encode("utf-8")
+    buffer = BytesIO()
+    if fmt == "excel":
+        write_excel([_df], buffer)
+    elif fmt == "pdf":
+        write_pdf([_df], buffer, title=f"Astro-Gann Swing Report — {symbol} — {dt.strftime('%d %B %Y')}")
+    else:
+        # Parquet keeps the numeric, datetime and categorical column types
+        _report_df.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+def read_file(path):
+    with open(path, "rb") as fh:
+        return fh.read()
+
+# Minute-by-minute levels and nature for the whole session, thinned to a few
+# hundred points per planet before they reach the chart
+@st.cache_data(max_entries=32, show_spinner=False)
+def intraday_chart_frame(day, cmp, market, swing_range_multiplier, rules_key, max_points=240):
+    grid = intraday_grid(day, cmp, market, swing_range_multiplier)
+    frame = downsample(grid, max_points).to_frame()
+    frame["time_end"] = frame.groupby("planet", observed=True)["time"].shift(-1).fillna(frame["time"])
+    return frame, len(grid)
+
+def intraday_chart(frame, planet):
+    import altair as alt
+
+    data = frame[frame["planet"] == planet]
+    x = alt.X("time:T", title="Time (IST)", axis=alt.Axis(format="%I:%M %p"))
+    levels = alt.Chart(data).encode(x=x)
+    band = levels.mark_area(opacity=0.15, color="#4a90e2").encode(
+        y=alt.Y("swing_low:Q", title="Price (₹)", scale=alt.Scale(zero=False)), y2="swing_high:Q")
+    low = levels.mark_line(color="#e74c3c").encode(y="swing_low:Q", tooltip=["time:T", "swing_low:Q", "nakshatra:N"])
+    high = levels.mark_line(color="#27ae60").encode(y="swing_high:Q", tooltip=["time:T", "swing_high:Q", "degree:Q"])
+    nature = alt.Chart(data).mark_rect().encode(
+        x=x, x2="time_end:T",
+        color=alt.Color("transit_nature:N", title="Transit Nature",
+                        scale=alt.Scale(domain=["Favorable", "Neutral", "Negative"],
+                                        range=["#27ae60", "#bdc3c7", "#e74c3c"])),
+        tooltip=["time:T", "transit_nature:N", "nakshatra:N"],
+    ).properties(height=30)
+    return alt.vconcat((band + low + high).properties(height=280), nature).resolve_scale(x="shared")
+
+# Live CMP feed: ticks are consumed on a background thread and only the live
+# panel below re-renders, at most live_rate times a second
+if live_source != "Off":
+    live_key = (live_source, live_address, dt, market, swing_range_multiplier)
+    if st.session_state.get("live_feed_key") != live_key:
+        if "live_feed" in st.session_state:
+            st.session_state.live_feed.stop()
+        if live_source == "Tailed CSV":
+            tick_source = csv_tail_source(live_address, from_start=True)
+        else:
+            host, _, port = live_address.rpartition(":")
+            tick_source = socket_source(host or "127.0.0.1", int(port))
+        st.session_state.live_feed = LiveFeed(tick_source, dt, market, swing_range_multiplier,
+                                              max_rate=live_rate).start()
+        st.session_state.live_feed_key = live_key
+    live_feed = st.session_state.live_feed
+    live_feed.max_rate = live_rate
+    
+    @st.fragment(run_every=1.0 / live_rate)
+    def live_panel():
+        st.markdown('<div class="sub-header">📡 Live Swing Levels</div>', unsafe_allow_html=True)
+        snapshot = live_feed.snapshot()
+        stats = live_feed.stats()
+        if not snapshot:
+            st.info(f"Waiting for ticks from {live_address}…" + (f" ({stats['error']})" if stats["error"] else ""))
+            return
+        live_df = format_report_frame(report_frame(row for report in snapshot.values() for row in report.rows))
+        st.dataframe(style_frame(frame_page(live_df, 1, TABLE_PAGE_SIZE)), use_container_width=True)
+        st.dataframe([{
+            "Symbol": live_symbol,
+            "CMP": f"₹{snapshot[live_symbol].cmp:.2f}",
+            "Square-of-Nine Support": f"₹{support.price:.2f} ({support.planet} {support.angle:g}°)" if support else "—",
+            "Square-of-Nine Resistance": f"₹{resistance.price:.2f} ({resistance.planet} {resistance.angle:g}°)" if resistance else "—",
+        } for live_symbol, (support, resistance) in live_feed.brackets().items()], use_container_width=True, hide_index=True)
+        st.caption(f"{stats['symbols']} symbol(s) · {stats['ticks']} ticks · {stats['publishes']} updates")
+    
+    live_panel()
+elif "live_feed" in st.session_state:
+    st.session_state.pop("live_feed").stop()
+    st.session_state.pop("live_feed_key", None)
+
+# Screener mode ranks the uploaded watchlist by proximity to the active
+# planets' levels; following the clock rescreens it every minute
+@st.cache_data(max_entries=4, show_spinner=False)
+def watchlist_from_upload(data, name):
+    return load_watchlist(BytesIO(data), name)
+
+if report_mode == "Watchlist Screener":
+    if watchlist_file is None:
+        st.info("Upload a watchlist CSV or Parquet file with symbol and cmp columns (volatility optional) to screen it.")
+        st.stop()
+    try:
+        watchlist = watchlist_from_upload(watchlist_file.getvalue(), watchlist_file.name)
+    except ValueError as exc:
+        st.markdown(f'''
+        <div class="error-message">
+            <strong>🚫 Invalid Watchlist</strong><br>
+            {exc}
+        </div>
+        ''', unsafe_allow_html=True)
+        st.stop()
     
-    duration = base_duration.get(planet, 60)
+    @st.fragment(run_every=60 if screener_follow else None)
+    def screener_panel():
+        screen_dt = datetime.now().replace(second=0, microsecond=0) if screener_follow else dt
+        st.markdown('<div class="sub-header">🔎 Watchlist Screener</div>', unsafe_allow_html=True)
+        screen_timer = StageTimer("screen")
+        with screen_timer.stage("screen"):
+            ranked = screen(watchlist, screen_dt, market, swing_range_multiplier, top=int(screener_top), rules=rules)
+        screen_timer.finish()
+        screen_timer.log(market=market, dt=screen_dt.isoformat(), symbols=len(watchlist), rows=len(ranked))
+        if ranked.empty:
+            st.info(f"No planetary timing window is active at {screen_dt:%d %B %Y, %I:%M %p}.")
+            return
+        st.dataframe([{
+            "Rank": row.rank,
+            "Symbol": row.symbol,
+            "CMP": f"₹{row.cmp:.2f}",
+            "Planet": f"⭐ {row.planet}" if row.important else row.planet,
+            "Transit Nature": row.transit_nature,
+            "Nearest Level": f"₹{row.level:.2f} ({row.angle:g}°)",
+            "Distance": f"{row.distance_pct:.3f}%",
+            "Swing Low": f"₹{row.swing_low:.2f}",
+            "Swing High": f"₹{row.swing_high:.2f}",
+            "Window Ends": f"{row.window_end:%I:%M %p}",
+            "Score": round(row.score, 3),
+        } for row in ranked.itertuples(index=False)], use_container_width=True, hide_index=True)
+        st.caption(f"{len(watchlist)} symbols screened at {screen_dt:%d %B %Y, %I:%M %p} "
+                   f"in {screen_timer.total_seconds * 1000:.0f} ms · rule set {rules.version}")
+    
+    screener_panel()
+    st.stop()
+
+# Date range mode streams one chunk per trading day to a temporary file
+if generate_report and report_mode == "Date Range":
+    try:
+        range_symbols = {symbol: cmp, **parse_symbols(range_extra_symbols)}
+    except ValueError as exc:
+        st.markdown(f'''
+        <div class="error-message">
+            <strong>🚫 Invalid Symbols</strong><br>
+            {exc}
+        </div>
+        ''', unsafe_allow_html=True)
+        st.stop()
     
-    if market == "Indian Market":
-        if dt.time() < market_start:
-            center_time = datetime.combine(dt.date(), market_start)
-        elif dt.time() > market_end:
-            center_time = datetime.combine(dt.date(), market_end)
+    range_end = datetime.combine(range_end_date, time_input)
+    frames = iter_report_frames(dt, range_end, range_symbols, int(range_step_days), market, swing_range_multiplier,
+                                display=range_format != "Parquet", store=report_store)
+    suffix = {"CSV": ".csv", "Excel": ".xlsx", "Parquet": ".parquet", "PDF": ".pdf"}[range_format]
+    # The file stays on disk and is only read when its download is clicked;
+    # each new range replaces (and deletes) the session's previous file
+    previous_path = st.session_state.pop("range_export_path", None)
+    if previous_path and os.path.exists(previous_path):
+        os.remove(previous_path)
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        range_path = tmp.name
+    try:
+        if range_format == "CSV":
+            row_count = write_csv(frames, range_path)
+        elif range_format == "Excel":
+            row_count = write_excel(frames, range_path, sheet_by="Symbol")
+        elif range_format == "Parquet":
+            row_count = write_parquet(frames, range_path)
         else:
-            center_time = dt
-    else:
-        center_time = dt
-    
-    start_time = center_time - timedelta(minutes=duration//2)
-    end_time = center_time + timedelta(minutes=duration//2)
+            row_count = write_pdf(frames, range_path)
+    except BaseException:
+        os.remove(range_path)
+        raise
+    st.session_state.range_export_path = range_path
     
-    return start_time, end_time
-
-# Generate report only when button is clicked
+    st.markdown(f'''
+    <div class="success-message">
+        <strong>✅ Date Range Report Generated!</strong><br>
+        {row_count} rows for {len(range_symbols)} symbol(s) from {date_input.strftime("%d %B %Y")} to {range_end_date.strftime("%d %B %Y")}.
+    </div>
+    ''', unsafe_allow_html=True)
+    st.download_button(
+        label=f"📄 Download Date Range as {range_format}",
+        data=partial(read_file, range_path),
+        on_click="ignore",
+        file_name=f"astro_gann_report_{date_input.strftime('%Y-%m-%d')}_{range_end_date.strftime('%Y-%m-%d')}{suffix}",
+        mime={
+            "CSV": "text/csv",
+            "Excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            "Parquet": "application/octet-stream",
+            "PDF": "application/pdf",
+        }[range_format],
+        use_container_width=True
+    )
+    st.stop()
+
+# Generate report when the button is clicked; it then stays on screen so
+# presentation-only widgets re-render it from the cached stages
 if generate_report:
+    st.session_state.single_day_report = True
+if report_mode == "Single Day" and st.session_state.get("single_day_report"):
     # Check if the selected date is a weekend (for Indian Market)
-    if market == "Indian Market" and date_input.weekday() >= 5:
-        st.markdown('''
+    if not is_trading_day(date_input, market):
+        closed_reason = trading_calendar.holiday_name(date_input)
+        if closed_reason == "Weekend":
+            closed_message = f"The selected date is a weekend. {market} is closed on Saturdays and Sundays. Please select a weekday."
+        else:
+            closed_message = f"The selected date is an exchange holiday ({closed_reason}). Please select another trading day."
+        st.markdown(f'''
         <div class="error-message">
             <strong>🚫 Market Closed</strong><br>
-            The selected date is a weekend. Indian Market is closed on Saturdays and Sundays. Please select a weekday.
+            {closed_message}
         </div>
         ''', unsafe_allow_html=True)
         st.stop()
     
     # Check if the selected time is outside market hours (for Indian Market)
-    if market == "Indian Market" and not is_within_market_hours(time_input):
+    if market == "Indian Market" and not trading_calendar.is_trading_minute(dt):
         st.markdown(f'''
         <div class="warning-message">
             <strong>⚠️ Outside Market Hours</strong><br>
@@ -651,17 +736,24 @@ if generate_report:
     st.markdown(f'''
     <div class="market-status">
         <h3>📊 Market Status</h3>
-        <p><strong>{market} Hours:</strong> {market_start.strftime("%I:%M %p")} – {market_end.strftime("%I:%M %p")}</p>
+        <p><strong>{market} Hours:</strong> {market_start.strftime("%I:%M %p")} – {market_end.strftime("%I:%M %p")}{f" ({special_session})" if special_session else ""}</p>
         <p><strong>Selected Date & Time:</strong> {dt.strftime("%d %B %Y, %I:%M %p")}</p>
         <p><strong>Location:</strong> {location_input}</p>
+        <p><strong>Rule Set:</strong> {rules.version}</p>
     </div>
     ''', unsafe_allow_html=True)
     
-    # Get planetary positions
-    planetary_positions = get_planetary_positions(dt)
+    # Per-stage timings, logged as JSON and optionally shown below the report
+    timer = StageTimer("generate", trace_memory=show_diagnostics)
+    
+    # Build the report from the cached stages; current transits are evaluated per minute
+    report_now = datetime.combine(dt.date(), datetime.now().time().replace(second=0, microsecond=0))
+    with timer.stage("report"):
+        report, report_df, df = report_frames(dt, cmp, symbol, market, swing_range_multiplier, report_now, rules.key,
+                                              _timer=timer)
     
     # Get important planet for the day
-    important_planet = get_important_planet(date_input)
+    important_planet = report.important_planet
     
     # Display the important planet information
     st.markdown(f'''
@@ -671,9 +763,8 @@ if generate_report:
     </div>
     ''', unsafe_allow_html=True)
     
-    # Calculate Moon-Rahu and Moon-Ketu transits
-    moon_degree = planetary_positions.get("Moon", 0)
-    moon_rahu_aspects, moon_ketu_aspects = calculate_moon_nodes_transit(dt, moon_degree)
+    # Moon-Rahu and Moon-Ketu transits
+    moon_rahu_aspects, moon_ketu_aspects = report.moon_rahu_aspects, report.moon_ketu_aspects
     
     # Display Moon-Nodes Transit
     st.markdown('<div class="sub-header">🌙 Moon-Nodes Transit</div>', unsafe_allow_html=True)
@@ -684,7 +775,7 @@ if generate_report:
         st.markdown('<div class="transit-box"><h4>🔴 Moon-Rahu Transit</h4>', unsafe_allow_html=True)
         if moon_rahu_aspects:
             for aspect in moon_rahu_aspects:
-                st.markdown(f'<p>{aspect["aspect"]}: {aspect["time"]}</p>', unsafe_allow_html=True)
+                st.markdown(f'<p>{aspect["aspect"]}: {aspect["time"]:%I:%M %p}</p>', unsafe_allow_html=True)
         else:
             st.markdown('<p>No Moon-Rahu aspects today</p>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
@@ -693,65 +784,31 @@ if generate_report:
         st.markdown('<div class="transit-box"><h4>🟡 Moon-Ketu Transit</h4>', unsafe_allow_html=True)
         if moon_ketu_aspects:
             for aspect in moon_ketu_aspects:
-                st.markdown(f'<p>{aspect["aspect"]}: {aspect["time"]}</p>', unsafe_allow_html=True)
+                st.markdown(f'<p>{aspect["aspect"]}: {aspect["time"]:%I:%M %p}</p>', unsafe_allow_html=True)
         else:
             st.markdown('<p>No Moon-Ketu aspects today</p>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
     
-    # Prepare data for each planet
-    results = []
-    for planet, degree in planetary_positions.items():
-        swing_low, swing_high, degree_low, degree_high = calculate_gann_levels(cmp, degree, planet)
-        start_time, end_time = calculate_timing(dt, planet)
-        adj_start_time, adj_end_time = adjust_timing_to_market(start_time, end_time)
-        
-        if market == "Indian Market" and (adj_start_time is None or adj_end_time is None):
-            continue
-            
-        timing_str = f"{adj_start_time.strftime('%I:%M %p')} – {adj_end_time.strftime('%I:%M %p')}"
-        
-        if planet == "Moon":
-            nakshatra = get_nakshatra(degree)
-            planet_display = f"Moon in {nakshatra}"
-        else:
-            planet_display = planet
-        
-        is_important = (planet == important_planet)
-        
-        current_time = datetime.now().time()
-        current_dt = datetime.combine(date_input, current_time)
-        is_current_transit = adj_start_time <= current_dt <= adj_end_time
-        
-        transit_nature = get_transit_nature(planet, degree)
-        
-        results.append({
-            "Symbol": symbol,
-            "CMP": f"₹{cmp:.2f}",
-            "Swing Low": f"₹{swing_low:.2f}",
-            "Swing High": f"₹{swing_high:.2f}",
-            "Degree Range": f"{degree_low:.2f}°–{degree_high:.2f}°",
-            "Key Planet": planet_display,
-            "Timing (IST)": timing_str,
-            "Transit Nature": transit_nature,
-            "Important": "Yes" if is_important else "No",
-            "Current Transit": "Yes" if is_current_transit else "No"
-        })
-    
-    # Create DataFrame
-    df = pd.DataFrame(results)
+    # Planet-to-planet aspects within orb during the day
+    st.markdown('<div class="sub-header">🪐 Planetary Aspects</div>', unsafe_allow_html=True)
+    if report.planet_aspects:
+        st.dataframe([{
+            "Aspect": aspect["aspect"],
+            "In Orb (IST)": f'{aspect["start"]:%I:%M %p} – {aspect["end"]:%I:%M %p}',
+            "Closest (IST)": f'{aspect["peak"]:%I:%M %p}',
+            "Orb": f'{aspect["orb"]:.2f}°',
+        } for aspect in report.planet_aspects], use_container_width=True, hide_index=True)
+    else:
+        st.markdown('<p>No planetary aspects within orb today</p>', unsafe_allow_html=True)
     
     # Check if DataFrame is empty
     if df.empty:
         if market == "Indian Market":
-            st.markdown('''
+            st.markdown(f'''
             <div class="error-message">
                 <strong>🚫 No Planetary Transits During Market Hours</strong><br>
-                There are no planetary transits within market hours for the selected date. This could be due to:
-                <ul>
-                    <li>The selected date is a market holiday</li>
-                    <li>All planetary transits fall outside market hours</li>
-                </ul>
-                Please try a different date.
+                All planetary transit windows fall outside the session ({market_start.strftime("%I:%M %p")} – {market_end.strftime("%I:%M %p")}) for the selected date and time.
+                Please try a different time.
             </div>
             ''', unsafe_allow_html=True)
         else:
@@ -775,32 +832,22 @@ if generate_report:
         .dataframe {{
             font-size: {font_size}px !important;
         }}
+        [data-testid="stDataFrame"] {{
+            background-color: {box_bg_color};
+            border-radius: 10px;
+            padding: 0.5rem;
+        }}
     </style>
     """, unsafe_allow_html=True)
     
-    # Display the dataframe with conditional formatting
-    def highlight_rows(row):
-        styles = [''] * len(row)
-        
-        important = row['Important'] == 'Yes'
-        current_transit = row['Current Transit'] == 'Yes'
-        transit_nature = row['Transit Nature']
-        
-        if important and current_transit:
-            styles = ['background-color: #ff9800; font-weight: bold; border: 2px solid #f44336;'] * len(row)
-        elif current_transit:
-            styles = ['background-color: #ffeb3b; border: 2px solid #ff9800;'] * len(row)
-        elif important:
-            styles = ['background-color: #4caf50; font-weight: bold;'] * len(row)
-        elif transit_nature == 'Favorable':
-            styles = ['background-color: #c8e6c9; border-left: 4px solid #4caf50;'] * len(row)
-        elif transit_nature == 'Negative':
-            styles = ['background-color: #ffcdd2; border-left: 4px solid #f44336;'] * len(row)
-        
-        return styles
-    
-    styled_df = df.style.apply(highlight_rows, axis=1)
-    st.dataframe(styled_df, use_container_width=True)
+    # Display the dataframe with conditional formatting, one page at a time
+    total_pages = page_count(df, TABLE_PAGE_SIZE)
+    page = 1
+    if total_pages > 1:
+        page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, step=1)
+    with timer.stage("styler"):
+        styled_df = style_frame(frame_page(df, page, TABLE_PAGE_SIZE))
+        st.dataframe(styled_df, use_container_width=True)
     
     # Success message
     st.markdown('''
@@ -811,31 +858,131 @@ if generate_report:
     ''', unsafe_allow_html=True)
     
     # Download buttons
-    col1, col2 = st.columns(2)
+    export_key = (dt, cmp, symbol, market, swing_range_multiplier, rules.key,
+                  tuple(row.current_transit for row in report.rows), report_df, df)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        # PDF generation (simplified for demo)
-        csv_data = df.to_csv(index=False)
         st.download_button(
             label="📄 Download as CSV",
-            data=csv_data,
+            data=partial(report_export, "csv", *export_key),
+            on_click="ignore",
             file_name=f"astro_gann_report_{date_input.strftime('%Y-%m-%d')}.csv",
             mime="text/csv",
             use_container_width=True
         )
     
     with col2:
-        # Excel generation
-        excel_buffer = BytesIO()
-        df.to_excel(excel_buffer, index=False, engine='openpyxl')
-        excel_buffer.seek(0)
         st.download_button(
             label="📊 Download as Excel",
-            data=excel_buffer,
+            data=partial(report_export, "excel", *export_key),
+            on_click="ignore",
             file_name=f"astro_gann_report_{date_input.strftime('%Y-%m-%d')}.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             use_container_width=True
         )
+    
+    with col3:
+        st.download_button(
+            label="📕 Download as PDF",
+            data=partial(report_export, "pdf", *export_key),
+            on_click="ignore",
+            file_name=f"astro_gann_report_{date_input.strftime('%Y-%m-%d')}.pdf",
+            mime="application/pdf",
+            use_container_width=True
+        )
+    
+    with col4:
+        st.download_button(
+            label="🧱 Download as Parquet",
+            data=partial(report_export, "parquet", *export_key),
+            on_click="ignore",
+            file_name=f"astro_gann_report_{date_input.strftime('%Y-%m-%d')}.parquet",
+            mime="application/vnd.apache.parquet",
+            use_container_width=True
+        )
+
+    # Intraday minute grid
+    with st.expander("⏱️ Intraday Minute Grid"):
+        with timer.stage("intraday"):
+            intraday_df, grid_minutes = intraday_chart_frame(date_input, cmp, market, swing_range_multiplier, rules.key)
+        planet_names = list(intraday_df["planet"].cat.categories)
+        chart_planet = st.selectbox("Planet", planet_names, index=planet_names.index(important_planet))
+        st.caption(f"{grid_minutes} session minutes, {int((intraday_df['planet'] == chart_planet).sum())} points charted")
+        st.altair_chart(intraday_chart(intraday_df, chart_planet), use_container_width=True)
+
+    # Square-of-Nine price ladder around the CMP
+    with st.expander("🔢 Square-of-Nine Ladder"):
+        ladder = ladder_book.get(cmp, report.positions, symbol)
+        support, resistance = ladder.nearest_below(cmp), ladder.nearest_above(cmp)
+        col1, col2 = st.columns(2)
+        if support:
+            col1.metric("Nearest Support", f"₹{support.price:.2f}", f"{support.planet} {support.angle:g}°", delta_color="off")
+        if resistance:
+            col2.metric("Nearest Resistance", f"₹{resistance.price:.2f}", f"{resistance.planet} {resistance.angle:g}°", delta_color="off")
+        ladder_band = st.slider("Band (± % of CMP)", min_value=0.5, max_value=5.0, value=1.0, step=0.5)
+        st.dataframe([{
+            "Level": f"₹{level.price:.2f}",
+            "Planet": level.planet,
+            "Angle": f"{level.angle:g}°",
+            "Side": "Support" if level.price < cmp else "Resistance",
+        } for level in ladder.levels(cmp * (1 - ladder_band / 100), cmp * (1 + ladder_band / 100))],
+            use_container_width=True, hide_index=True)
+
+    # Stage timings
+    timer.finish()
+    timer.log(symbol=symbol, market=market, dt=dt.isoformat(), rows=len(df))
+    if show_diagnostics:
+        with st.expander("🩺 Diagnostics", expanded=True):
+            st.dataframe(timer.stages, use_container_width=True)
+            st.json(timer.to_dict(symbol=symbol, market=market, dt=dt.isoformat(), rows=len(df)))
+
+# Report cache counters for sizing ASTRO_GANN_CACHE_MB
+with st.sidebar.expander("🗄️ Report Cache"):
+    st.json(report_cache.stats())
+
+# Astro rule tables; reloading swaps them in for every session on this server
+with st.sidebar.expander("📜 Rule Set"):
+    st.json({"version": rules.version, "fingerprint": rules.fingerprint, "path": rules.path})
+    if st.button("Reload Rules", use_container_width=True):
+        try:
+            reload_rules()
+        except (OSError, ValueError) as exc:
+            st.error(f"Rules not reloaded: {exc}")
+        else:
+            st.rerun()
+
+# Stored report history, queried without regenerating anything
+if report_store is not None:
+    with st.sidebar.expander("🗃️ Report History"):
+        history_symbols = report_store.symbols()
+        history_symbol = st.selectbox("History Symbol", ["Any"] + history_symbols,
+                                      index=history_symbols.index(symbol) + 1 if symbol in history_symbols else 0)
+        history_planet = st.selectbox("History Planet", ["Any", *PLANETS])
+        history_nature = st.selectbox("History Transit Nature", ["Any", "Favorable", "Neutral", "Negative"])
+        history_start = st.date_input("History From", date_input.replace(month=1, day=1))
+        history_end = st.date_input("History To", date_input.replace(month=12, day=31))
+        history_important = st.checkbox("Important planet only", value=False)
+        history = report_store.query(
+            start=history_start, end=history_end,
+            symbol=None if history_symbol == "Any" else history_symbol,
+            planet=None if history_planet == "Any" else history_planet,
+            transit_nature=None if history_nature == "Any" else history_nature,
+            important=True if history_important else None,
+            limit=HISTORY_LIMIT + 1,
+        )
+        st.caption(f"{min(len(history), HISTORY_LIMIT)}{'+' if len(history) > HISTORY_LIMIT else ''} stored row(s)")
+        if len(history):
+            st.dataframe([{
+                "Date": f"{row.report_time:%d %b %Y %I:%M %p}",
+                "Symbol": row.symbol,
+                "Planet": row.planet,
+                "Nature": row.transit_nature,
+                "Swing Low": f"₹{row.swing_low:.2f}",
+                "Swing High": f"₹{row.swing_high:.2f}",
+                "Window": f"{row.window_start:%I:%M %p} – {row.window_end:%I:%M %p}",
+            } for row in history.head(HISTORY_LIMIT).itertuples(index=False)], use_container_width=True, hide_index=True)
+        st.json(report_store.stats(), expanded=False)
 
 # Footer
 st.markdown('''
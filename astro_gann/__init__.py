@@ -0,0 +1,55 @@
+"""Headless compute core for the Intraday Astro-Gann Swing Tool."""
+
+from .core import (
+    GLOBAL_MARKET,
+    INDIAN_MARKET,
+    MARKET_HOURS,
+    NAKSHATRAS,
+    PLANETS,
+    adjust_timing_to_market,
+    calculate_gann_levels,
+    calculate_moon_nodes_transit,
+    calculate_timing,
+    get_important_planet,
+    get_market_hours,
+    get_nakshatra,
+    get_planetary_positions,
+    get_transit_nature,
+    is_trading_day,
+    is_within_market_hours,
+)
+from .report import (
+    REPORT_COLUMNS,
+    REPORT_SCHEMA,
+    Report,
+    ReportRow,
+    format_report_frame,
+    generate_report,
+    report_frame,
+)
+
+__all__ = [
+    "GLOBAL_MARKET",
+    "INDIAN_MARKET",
+    "MARKET_HOURS",
+    "NAKSHATRAS",
+    "PLANETS",
+    "REPORT_COLUMNS",
+    "REPORT_SCHEMA",
+    "Report",
+    "ReportRow",
+    "adjust_timing_to_market",
+    "calculate_gann_levels",
+    "calculate_moon_nodes_transit",
+    "calculate_timing",
+    "format_report_frame",
+    "generate_report",
+    "get_important_planet",
+    "get_market_hours",
+    "get_nakshatra",
+    "get_planetary_positions",
+    "get_transit_nature",
+    "is_trading_day",
+    "is_within_market_hours",
+    "report_frame",
+]
@@ -0,0 +1,358 @@
+"""HTTP/JSON API over the report engine, for systems that cannot drive the UI.
+
+Endpoints (all JSON unless noted):
+
+``GET /report``  (or ``POST`` with a JSON body)
+    One report. Parameters: ``date`` (YYYY-MM-DD, required), ``cmp``
+    (required), ``time`` (HH:MM, default market open), ``symbol`` (default
+    Nifty), ``market``, ``multiplier``, ``now`` (ISO datetime deciding the
+    current transit; default the wall clock on ``date``).
+``POST /batch``
+    ``{"requests": [<report params>, ...]}`` -> ``{"reports": [...]}`` in order.
+``GET /stream``
+    NDJSON, one report per line for every trading day from ``start`` to
+    ``end`` and every symbol in ``symbols`` (``SYM:CMP,...``), flushed per day.
+``GET /history``
+    Stored report rows (see :mod:`astro_gann.store`) filtered by ``symbol``,
+    ``planet``, ``transit_nature`` (comma-separated for several), ``start``
+    and ``end`` (dates or ISO datetimes), ``important``, ``current``,
+    ``market`` and ``limit`` (default 1000) -- without regenerating anything.
+``GET /rules``, ``POST /rules/reload``
+    Active rule-set version; reload re-reads the rules file and swaps it in.
+``GET /stats``, ``GET /health``
+
+Identical requests that arrive while one is being computed share its result,
+and finished results are kept in an LRU of serialized responses on top of
+the :class:`~astro_gann.cache.ReportCache` engine cache. Every computed
+report is also added to the report store (``ASTRO_GANN_STORE``). Serving needs
+``starlette`` and ``uvicorn``::
+
+    python -m astro_gann.api --host 127.0.0.1 --port 8765
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timezone
+
+from .cache import bucket_time, cache_from_env
+from .core import INDIAN_MARKET, MARKET_HOURS, get_market_hours
+from .ephemeris import LOCAL_UTC_OFFSET
+from .rules import get_rules, reload_rules
+from .store import store_from_env
+from .stream import iter_instants, parse_symbols
+
+MAX_BATCH = 1000
+MAX_HISTORY = 10_000
+
+
+def _param(params, name, default=None, required=False):
+    value = params.get(name)
+    if value is None or value == "":
+        if required:
+            raise ValueError(f"missing parameter {name!r}")
+        return default
+    return value
+
+
+def _local(dt):
+    """``dt`` as a naive IST datetime; offset-aware values are converted."""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone(LOCAL_UTC_OFFSET)).replace(tzinfo=None)
+
+
+def parse_report_params(params):
+    """Normalize report parameters into ``(dt, cmp, symbol, market, multiplier, now)``.
+
+    Times with a UTC offset are converted to naive IST. Raises
+    ``ValueError`` with a client-facing message on bad input.
+    """
+    if not isinstance(params, dict):
+        raise ValueError(f"expected an object of report parameters, got {type(params).__name__}")
+    market = _param(params, "market", INDIAN_MARKET)
+    if market not in MARKET_HOURS:
+        raise ValueError(f"unknown market {market!r}")
+    day = date.fromisoformat(str(_param(params, "date", required=True)))
+    clock = _param(params, "time")
+    clock = time.fromisoformat(str(clock)) if clock is not None else get_market_hours(market)[0]
+    cmp = float(_param(params, "cmp", required=True))
+    symbol = str(_param(params, "symbol", "Nifty"))
+    multiplier = float(_param(params, "multiplier", 1.0))
+    now = _param(params, "now")
+    dt = _local(datetime.combine(day, clock))
+    if now is not None:
+        now = _local(datetime.fromisoformat(str(now)))
+    else:
+        now = datetime.combine(day, datetime.now().time())
+    return dt, cmp, symbol, market, multiplier, now.replace(second=0, microsecond=0)
+
+
+class ReportService:
+    """Transport-independent request handling: coalescing, result cache, thread offload.
+
+    ``cache`` is the engine-level :class:`~astro_gann.cache.ReportCache`;
+    ``result_entries`` bounds the LRU of serialized reports; ``store`` is
+    the :class:`~astro_gann.store.ReportStore` computed reports are added
+    to (default from the environment). Must be used from a single event loop.
+    """
+
+    def __init__(self, cache=None, result_entries=10_000, workers=None, store=None):
+        self.cache = cache if cache is not None else cache_from_env()
+        self.store = store if store is not None else store_from_env()
+        self.result_entries = result_entries
+        self._results = OrderedDict()
+        self._inflight = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1),
+                                            thread_name_prefix="astro-gann-api")
+        self.requests = 0
+        self.result_hits = 0
+        self.coalesced = 0
+        self.computed = 0
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "result_hits": self.result_hits,
+            "coalesced": self.coalesced,
+            "computed": self.computed,
+            "inflight": len(self._inflight),
+            "results": len(self._results),
+            "rule_version": get_rules().version,
+            "engine_cache": self.cache.stats(),
+            "store": self.store.stats() if self.store is not None else None,
+        }
+
+    def _compute(self, dt, cmp, symbol, market, multiplier, now, rules):
+        report = self.cache.get_report(dt, cmp, symbol, market, multiplier, now=now, rules=rules)
+        if self.store is not None:
+            self.store.add([report])
+        return json.dumps(report.to_dict(), separators=(",", ":")).encode("utf-8")
+
+    async def report(self, params):
+        """Serialized JSON bytes of one report."""
+        rules = get_rules()
+        args = (*parse_report_params(params), rules)
+        dt, cmp, symbol, market, multiplier, now, _ = args
+        key = (bucket_time(dt, self.cache.bucket_minutes), cmp, symbol, market, multiplier, now, rules.key)
+        self.requests += 1
+
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            self.result_hits += 1
+            return result
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._run(key, args))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())  # no "never retrieved" noise
+            self._inflight[key] = task
+        # Shielded so one client disconnecting doesn't cancel the shared computation
+        return await asyncio.shield(task)
+
+    async def _run(self, key, args):
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._executor, self._compute, *args)
+        finally:
+            del self._inflight[key]
+        self.computed += 1
+        self._results[key] = result
+        if len(self._results) > self.result_entries:
+            self._results.popitem(last=False)
+        return result
+
+    async def batch(self, requests):
+        """JSON bytes of ``{"reports": [...]}`` for a list of report parameter dicts."""
+        if not isinstance(requests, list):
+            raise ValueError("expected a list of requests")
+        if len(requests) > MAX_BATCH:
+            raise ValueError(f"batch too large ({len(requests)} > {MAX_BATCH})")
+        for index, params in enumerate(requests):
+            try:
+                parse_report_params(params)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"request {index}: {exc}") from exc
+        results = await asyncio.gather(*(self.report(params) for params in requests))
+        return b'{"reports":[' + b",".join(results) + b"]}"
+
+    async def stream(self, params):
+        """Yield NDJSON lines for every trading day and symbol in the requested range."""
+        market = _param(params, "market", INDIAN_MARKET)
+        if market not in MARKET_HOURS:
+            raise ValueError(f"unknown market {market!r}")
+        start = date.fromisoformat(str(_param(params, "start", required=True)))
+        end = date.fromisoformat(str(_param(params, "end", required=True)))
+        symbols = parse_symbols(str(_param(params, "symbols", required=True)))
+        step = int(_param(params, "step", 1))
+        clock = _param(params, "time")
+        clock = time.fromisoformat(str(clock)) if clock is not None else get_market_hours(market)[0]
+        shared = {name: params[name] for name in ("market", "multiplier", "now") if name in params}
+
+        for dt in iter_instants(datetime.combine(start, clock), datetime.combine(end, clock), step, market):
+            lines = await asyncio.gather(*(
+                self.report({**shared, "date": dt.date().isoformat(), "time": clock.isoformat(),
+                             "symbol": symbol, "cmp": cmp})
+                for symbol, cmp in symbols.items()
+            ))
+            yield b"\n".join(lines) + b"\n"
+
+    async def history(self, params):
+        """JSON bytes of ``{"rows": [...]}`` for the stored rows matching ``params``."""
+        if self.store is None:
+            raise ValueError("the report store is disabled")
+
+        def listed(name):
+            value = _param(params, name)
+            return value.split(",") if isinstance(value, str) else value
+
+        def flag(name):
+            value = _param(params, name)
+            return None if value is None else str(value).lower() in ("1", "true", "yes")
+
+        limit = int(_param(params, "limit", 1000))
+        if not 0 < limit <= MAX_HISTORY:
+            raise ValueError(f"limit must be between 1 and {MAX_HISTORY}")
+        filters = {
+            "start": _param(params, "start"),
+            "end": _param(params, "end"),
+            "symbol": listed("symbol"),
+            "planet": listed("planet"),
+            "transit_nature": listed("transit_nature"),
+            "market": _param(params, "market"),
+            "important": flag("important"),
+            "current_transit": flag("current"),
+        }
+        loop = asyncio.get_running_loop()
+        frame = await loop.run_in_executor(self._executor, lambda: self.store.query(limit=limit, **filters))
+        rows = frame.to_json(orient="records", date_format="iso")
+        return ('{"rows":' + rows + "}").encode("utf-8")
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.cache.close()
+        if self.store is not None:
+            self.store.close()
+
+
+def create_app(service=None):
+    """Starlette ASGI app exposing a :class:`ReportService`."""
+    try:
+        from starlette.applications import Starlette
+        from starlette.responses import JSONResponse, Response, StreamingResponse
+        from starlette.routing import Route
+    except ImportError as exc:
+        raise ImportError("the HTTP API requires starlette and uvicorn: pip install starlette uvicorn") from exc
+
+    service = service if service is not None else ReportService()
+
+    def error(exc, status=400):
+        return JSONResponse({"error": str(exc)}, status_code=status)
+
+    async def report(request):
+        try:
+            params = dict(request.query_params)
+            if request.method == "POST":
+                params.update(await request.json())
+            body = await service.report(params)
+        except (TypeError, ValueError) as exc:
+            return error(exc)
+        return Response(body, media_type="application/json")
+
+    async def batch(request):
+        try:
+            payload = await request.json()
+            requests = payload.get("requests") if isinstance(payload, dict) else payload
+            body = await service.batch(requests)
+        except (TypeError, ValueError) as exc:
+            return error(exc)
+        return Response(body, media_type="application/json")
+
+    async def stream(request):
+        params = dict(request.query_params)
+        chunks = service.stream(params)
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = b""
+        except (TypeError, ValueError) as exc:
+            return error(exc)
+
+        async def body():
+            if first:
+                yield first
+            async for chunk in chunks:
+                yield chunk
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    async def history(request):
+        try:
+            body = await service.history(dict(request.query_params))
+        except (TypeError, ValueError) as exc:
+            return error(exc)
+        return Response(body, media_type="application/json")
+
+    async def stats(request):
+        return JSONResponse(service.stats())
+
+    def rules_info(rules):
+        return {"version": rules.version, "fingerprint": rules.fingerprint, "path": rules.path}
+
+    async def rules(request):
+        return JSONResponse(rules_info(get_rules()))
+
+    async def rules_reload(request):
+        try:
+            rules = reload_rules()
+        except (OSError, ValueError) as exc:
+            return error(exc, status=422)
+        return JSONResponse(rules_info(rules))
+
+    async def health(request):
+        return JSONResponse({"status": "ok"})
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        yield
+        service.close()
+
+    app = Starlette(routes=[
+        Route("/report", report, methods=["GET", "POST"]),
+        Route("/batch", batch, methods=["POST"]),
+        Route("/stream", stream, methods=["GET"]),
+        Route("/history", history, methods=["GET"]),
+        Route("/rules", rules, methods=["GET"]),
+        Route("/rules/reload", rules_reload, methods=["POST"]),
+        Route("/stats", stats, methods=["GET"]),
+        Route("/health", health, methods=["GET"]),
+    ], lifespan=lifespan)
+    app.state.service = service
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Astro-Gann reports over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--result-entries", type=int, default=10_000, help="serialized reports kept in memory")
+    parser.add_argument("--log-level", default="warning")
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError as exc:
+        raise ImportError("the HTTP API requires starlette and uvicorn: pip install starlette uvicorn") from exc
+    app = create_app(ReportService(result_entries=args.result_entries))
+    uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level)
+
+
+if __name__ == "__main__":
+    main()
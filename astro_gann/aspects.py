@@ -0,0 +1,285 @@
+"""Exact aspect event search between planets and lunar nodes.
+
+Longitudes are sampled on a coarse grid, every sign change of the
+separation-minus-aspect function is bracketed in one vectorized pass, and
+all brackets are then refined together by regula falsi (Illinois variant)
+against the ephemeris. Event times are returned as UTC epoch seconds; turning
+them into display strings is left to the caller.
+
+:func:`separation_matrix` and :func:`find_orb_events` cover every pair of
+bodies at once: the ``(times, bodies, bodies)`` separation matrix is one
+broadcast subtraction, and the periods each pair spends within orb of an
+aspect are cut from the ``(times, pairs, aspects)`` mask with run-length
+edges instead of a per-pair loop.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
+
+from .core import ASPECTS, PLANETS
+from .ephemeris import NODES, from_unix_seconds, positions_array, to_unix_seconds
+
+EVENT_DTYPE = np.dtype([
+    ("time", np.float64),
+    ("body_a", "U16"),
+    ("body_b", "U16"),
+    ("aspect", np.float64),
+])
+
+ORB_EVENT_DTYPE = np.dtype([
+    ("start", np.float64),
+    ("end", np.float64),
+    ("peak", np.float64),
+    ("body_a", "U16"),
+    ("body_b", "U16"),
+    ("aspect", np.float64),
+    ("orb", np.float64),
+])
+
+ASPECT_BODIES = PLANETS + ("Rahu", "Ketu")
+
+# Orb (degrees either side of exact) allowed for each classical aspect.
+DEFAULT_ORBS = {0: 8.0, 60: 5.0, 90: 7.0, 120: 7.0, 180: 8.0}
+
+MOON_NODE_PAIRS = {
+    "mean": (("Moon", "Rahu"), ("Moon", "Ketu")),
+    "true": (("Moon", "True Rahu"), ("Moon", "True Ketu")),
+}
+
+
+def _wrap180(x):
+    return (x + 180.0) % 360.0 - 180.0
+
+
+def _targets(aspects):
+    """Expand each aspect to the separations that realise it, e.g. 60 -> 60 and 300."""
+    aspect_of, target = [], []
+    for aspect in aspects:
+        for separation in sorted({aspect % 360.0, (360.0 - aspect) % 360.0}):
+            aspect_of.append(aspect)
+            target.append(separation)
+    return np.array(aspect_of, dtype=np.float64), np.array(target, dtype=np.float64)
+
+
+def _separation(unix_seconds, body_a, body_b):
+    lon = positions_array(unix_seconds, (body_a, body_b))
+    return lon[:, 0] - lon[:, 1]
+
+
+def find_aspect_events(start, end, pairs, aspects=ASPECTS, step_minutes=60.0, iterations=8):
+    """Find every exact aspect between each ``(body_a, body_b)`` in ``pairs``.
+
+    ``start``/``end`` are datetimes or epoch seconds. ``step_minutes`` must be
+    short enough that no aspect is crossed twice between samples; an hour is
+    ample even for the Moon (about 0.55° per hour). Returns a structured
+    array with ``EVENT_DTYPE`` sorted by time.
+    """
+    t0 = float(to_unix_seconds(start))
+    t1 = float(to_unix_seconds(end))
+    step = step_minutes * 60.0
+    grid = np.append(np.arange(t0, t1, step), t1)
+    aspect_of, target = _targets(aspects)
+
+    chunks = []
+    for body_a, body_b in pairs:
+        separation = _separation(grid, body_a, body_b)
+        f = _wrap180(separation[:, None] - target[None, :])
+
+        # A root lies between samples k and k+1 when the sign flips without
+        # the ±180° wrap-around jump in between.
+        lo_f, hi_f = f[:-1], f[1:]
+        crossing = (np.signbit(lo_f) != np.signbit(hi_f)) & (np.abs(hi_f - lo_f) < 180.0)
+        sample, column = np.nonzero(crossing)
+        if not len(sample):
+            continue
+
+        t_lo, t_hi = grid[sample], grid[sample + 1]
+        f_lo, f_hi = lo_f[sample, column], hi_f[sample, column]
+        goal = target[column]
+        t_mid = t_lo
+        for _ in range(iterations):
+            denom = np.where(f_hi != f_lo, f_hi - f_lo, 1.0)
+            t_mid = np.where(f_hi != f_lo, t_lo - f_lo * (t_hi - t_lo) / denom, t_lo)
+            f_mid = _wrap180(_separation(t_mid, body_a, body_b) - goal)
+            left = np.signbit(f_mid) == np.signbit(f_lo)
+            # Illinois step: halve the stale endpoint so the bracket keeps shrinking.
+            f_hi = np.where(left, f_hi * 0.5, f_mid)
+            t_hi = np.where(left, t_hi, t_mid)
+            f_lo = np.where(left, f_mid, f_lo * 0.5)
+            t_lo = np.where(left, t_mid, t_lo)
+
+        events = np.empty(len(t_mid), dtype=EVENT_DTYPE)
+        events["time"] = t_mid
+        events["body_a"] = body_a
+        events["body_b"] = body_b
+        events["aspect"] = aspect_of[column]
+        chunks.append(events)
+
+    if not chunks:
+        return np.empty(0, dtype=EVENT_DTYPE)
+    events = np.concatenate(chunks)
+    return events[np.argsort(events["time"], kind="stable")]
+
+
+def separation_matrix(longitudes):
+    """Angular separation in ``[0, 180]`` between every pair of bodies.
+
+    ``longitudes`` is ``(times, bodies)``; the result is ``(times, bodies,
+    bodies)`` and symmetric in the last two axes.
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    return np.abs(_wrap180(longitudes[:, :, None] - longitudes[:, None, :]))
+
+
+def aspect_pairs(bodies=ASPECT_BODIES):
+    """Index arrays ``(a, b)`` of the body pairs worth checking, ``a < b``.
+
+    The two nodes are always opposite each other, so that pair is skipped.
+    """
+    a, b = np.triu_indices(len(bodies), 1)
+    nodes = np.array([body in NODES for body in bodies])
+    keep = ~(nodes[a] & nodes[b])
+    return a[keep], b[keep]
+
+
+def _orb_array(aspects, orbs):
+    if isinstance(orbs, dict):
+        return np.array([orbs[aspect] for aspect in aspects], dtype=np.float64)
+    return np.full(len(aspects), float(orbs))
+
+
+def _cross(t_out, t_in, dev_out, dev_in, orb):
+    """Interpolated time where ``|dev|`` passes ``orb`` between an outside and an inside sample."""
+    span = dev_out - dev_in
+    frac = np.divide(dev_out - orb, span, out=np.zeros_like(span), where=span != 0)
+    return t_out + (t_in - t_out) * frac
+
+
+def find_orb_events(start, end, bodies=ASPECT_BODIES, aspects=ASPECTS, orbs=None, step_minutes=60.0):
+    """Periods in which any pair of ``bodies`` is within orb of an aspect.
+
+    ``orbs`` is a single orb in degrees or ``{aspect: orb}`` (default
+    :data:`DEFAULT_ORBS`). Positions are sampled every ``step_minutes``;
+    period edges are interpolated between samples, and ``peak``/``orb`` are
+    the sample closest to exact and its distance from it. Periods still in
+    orb at ``start`` or ``end`` are cut there. Returns a structured array with
+    ``ORB_EVENT_DTYPE`` sorted by start time, times in UTC epoch seconds.
+    """
+    t0 = float(to_unix_seconds(start))
+    t1 = float(to_unix_seconds(end))
+    grid = np.append(np.arange(t0, t1, step_minutes * 60.0), t1)
+    aspects = tuple(aspects)
+    aspect_values = np.array(aspects, dtype=np.float64)
+    orb_values = _orb_array(aspects, DEFAULT_ORBS if orbs is None else orbs)
+    a, b = aspect_pairs(bodies)
+
+    separations = separation_matrix(positions_array(grid, bodies))[:, a, b].T  # (pairs, times)
+    # One row per (pair, aspect) series: row // len(aspects) is the pair.
+    dev = np.abs(separations[:, None, :] - aspect_values[:, None]).reshape(-1, len(grid))
+    within = dev <= np.tile(orb_values, len(a))[:, None]
+
+    # Pad so every run has both edges; run k of a row pairs its k-th rise and fall.
+    edges = np.diff(np.pad(within.view(np.int8), ((0, 0), (1, 1))), axis=1)
+    row, first = np.nonzero(edges == 1)
+    _, stop = np.nonzero(edges == -1)
+    last = stop - 1
+    if not len(row):
+        return np.empty(0, dtype=ORB_EVENT_DTYPE)
+
+    orb = orb_values[row % len(aspects)]
+    starts = grid[first].copy()
+    ends = grid[last].copy()
+    inner = first > 0
+    starts[inner] = _cross(grid[first[inner] - 1], grid[first[inner]],
+                           dev[row[inner], first[inner] - 1], dev[row[inner], first[inner]], orb[inner])
+    inner = last < len(grid) - 1
+    ends[inner] = _cross(grid[last[inner] + 1], grid[last[inner]],
+                         dev[row[inner], last[inner] + 1], dev[row[inner], last[inner]], orb[inner])
+
+    # Closest sample of each run: sort in-run samples by (run, deviation).
+    lengths = last - first + 1
+    run_of = np.repeat(np.arange(len(row)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    samples = np.repeat(first, lengths) + offsets
+    values = dev[np.repeat(row, lengths), samples]
+    order = np.lexsort((values, run_of))
+    best = order[np.r_[0, np.cumsum(lengths)[:-1]]]
+
+    pair = row // len(aspects)
+    events = np.empty(len(row), dtype=ORB_EVENT_DTYPE)
+    events["start"] = starts
+    events["end"] = ends
+    events["peak"] = grid[samples[best]]
+    events["body_a"] = np.asarray(bodies)[a[pair]]
+    events["body_b"] = np.asarray(bodies)[b[pair]]
+    events["aspect"] = aspect_values[row % len(aspects)]
+    events["orb"] = values[best]
+    return events[np.argsort(events["start"], kind="stable")]
+
+
+def find_moon_node_events(start, end, node="mean", aspects=ASPECTS, step_minutes=60.0):
+    """Moon aspects to Rahu and Ketu; ``node`` is ``"mean"`` or ``"true"``."""
+    return find_aspect_events(start, end, MOON_NODE_PAIRS[node], aspects, step_minutes)
+
+
+def aspect_label(event):
+    """``"Moon-Rahu 60°"`` for an event record; "True" node prefixes are dropped."""
+    body_b = event["body_b"].replace("True ", "")
+    return f"{event['body_a']}-{body_b} {event['aspect']:g}°"
+
+
+def moon_nodes_transit(dt, node="mean", hours=None):
+    """Moon-Rahu and Moon-Ketu aspects on ``dt``'s calendar day (IST).
+
+    Returns two lists of ``{"aspect": label, "angle": degrees, "time": datetime}``
+    dicts -- naive IST datetimes, formatted by the UI. ``hours`` searches
+    forward from ``dt`` instead of over the whole day.
+    """
+    if hours is None:
+        start = datetime.combine(dt.date(), datetime.min.time())
+        end = start + timedelta(days=1)
+    else:
+        start, end = dt, dt + timedelta(hours=hours)
+
+    rahu, ketu = [], []
+    for event in find_moon_node_events(start, end, node):
+        entry = {
+            "aspect": aspect_label(event),
+            "angle": float(event["aspect"]),
+            "time": from_unix_seconds(event["time"]),
+        }
+        (ketu if event["body_b"].endswith("Ketu") else rahu).append(entry)
+    return rahu, ketu
+
+
+def planet_aspects(dt, orbs=None, step_minutes=30.0):
+    """Aspects within orb between all planets and the nodes on ``dt``'s calendar day (IST).
+
+    Returns ``{"aspect": label, "angle", "orb", "start", "end", "peak"}``
+    dicts ordered by start, with naive IST datetimes. The result depends
+    only on the date, so the default-orb search is cached per day; callers
+    get their own copies of the cached dicts.
+    """
+    if orbs is None:
+        return [dict(period) for period in _day_aspects(dt.date(), step_minutes)]
+    return _aspect_periods(dt.date(), orbs, step_minutes)
+
+
+@lru_cache(maxsize=128)
+def _day_aspects(day, step_minutes):
+    return tuple(_aspect_periods(day, None, step_minutes))
+
+
+def _aspect_periods(day, orbs, step_minutes):
+    start = datetime.combine(day, datetime.min.time())
+    events = find_orb_events(start, start + timedelta(days=1), orbs=orbs, step_minutes=step_minutes)
+    return [{
+        "aspect": aspect_label(event),
+        "angle": float(event["aspect"]),
+        "orb": round(float(event["orb"]), 2),
+        "start": from_unix_seconds(event["start"]),
+        "end": from_unix_seconds(event["end"]),
+        "peak": from_unix_seconds(event["peak"]),
+    } for event in events]
@@ -0,0 +1,258 @@
+"""Replay daily Gann levels and timing windows against historical OHLC bars.
+
+For every trading day in the data the levels are computed exactly as the
+report does -- ``calculate_gann_levels`` on the day's opening price with the
+planet positions at ``report_time`` -- and the ``calculate_timing`` windows
+for that instant are laid over the day's bars. Each (symbol, day, planet)
+row then records whether price touched and respected the swing levels and,
+for intraday bars, whether the day's high or low printed inside the window.
+
+Days are evaluated as arrays; files are parsed and then every symbol's bars
+are fanned out over a process pool, so one multi-symbol file runs in parallel
+too::
+
+    python -m astro_gann.backtest data/ohlc/*.parquet --workers 8
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time
+
+import numpy as np
+import pandas as pd
+
+from .core import (
+    INDIAN_MARKET,
+    NAKSHATRAS,
+    PLANETS,
+    adjust_timing_to_market,
+    calculate_timing,
+    get_market_hours,
+)
+from .ephemeris import positions_array
+from .levels import calculate_gann_levels_batch
+from .rules import get_rules
+from .transit import transit_natures
+
+HIT_COLUMNS = ("touched_low", "touched_high", "respected_low", "respected_high", "contained",
+               "extreme_in_window")
+
+_TIMESTAMP_NAMES = ("timestamp", "datetime", "date_time", "time", "date")
+
+
+def _to_ist(values):
+    """Parse timestamps as naive IST; offset-aware values are converted, not just stripped."""
+    try:
+        stamps = pd.to_datetime(values)
+    except ValueError:  # mixed UTC offsets
+        stamps = pd.to_datetime(values, utc=True)
+    if stamps.dt.tz is not None:
+        stamps = stamps.dt.tz_convert("Asia/Kolkata").dt.tz_localize(None)
+    return stamps
+
+
+def load_ohlc(path, symbol=None):
+    """Read a CSV or Parquet file of OHLC bars into a normalized frame.
+
+    Column names are matched case-insensitively. Timestamps come from a
+    ``timestamp``/``datetime``/``date`` column, or ``date`` + ``time``; naive
+    values are taken as IST and offset-aware ones are converted to IST. A ``symbol`` column is optional; without
+    one, ``symbol`` (default: the file's base name) is used for every row.
+    """
+    if path.endswith((".parquet", ".pq")):
+        frame = pd.read_parquet(path)
+    else:
+        frame = pd.read_csv(path)
+    frame.columns = [str(c).strip().lower() for c in frame.columns]
+
+    if "date" in frame.columns and "time" in frame.columns:
+        stamps = _to_ist(frame["date"].astype(str) + " " + frame["time"].astype(str))
+    else:
+        name = next((c for c in _TIMESTAMP_NAMES if c in frame.columns), None)
+        if name is None:
+            raise ValueError(f"{path}: no timestamp column (expected one of {_TIMESTAMP_NAMES})")
+        stamps = _to_ist(frame[name])
+    missing = {"open", "high", "low", "close"} - set(frame.columns)
+    if missing:
+        raise ValueError(f"{path}: missing OHLC columns {sorted(missing)}")
+
+    if "symbol" not in frame.columns:
+        frame["symbol"] = symbol or os.path.splitext(os.path.basename(path))[0]
+    out = pd.DataFrame({
+        "symbol": frame["symbol"].astype(str).to_numpy(),
+        "timestamp": stamps.to_numpy(dtype="datetime64[ns]"),
+        "open": frame["open"].to_numpy(dtype=np.float64),
+        "high": frame["high"].to_numpy(dtype=np.float64),
+        "low": frame["low"].to_numpy(dtype=np.float64),
+        "close": frame["close"].to_numpy(dtype=np.float64),
+    })
+    return out.sort_values(["symbol", "timestamp"], kind="stable", ignore_index=True)
+
+
+def timing_offsets(report_time, market=INDIAN_MARKET, planets=PLANETS, rules=None):
+    """Per-planet ``(start, end)`` window offsets in minutes from midnight.
+
+    The windows only depend on the time of day, so ``calculate_timing`` and
+    ``adjust_timing_to_market`` are evaluated once on a reference date.
+    Planets whose window falls outside the session get NaN.
+    """
+    reference = datetime.combine(date(2000, 1, 3), report_time)
+    midnight = datetime.combine(reference.date(), time())
+    starts, ends = [], []
+    for planet in planets:
+        start, end = adjust_timing_to_market(*calculate_timing(reference, planet, market, rules), market)
+        if start is None:
+            starts.append(np.nan)
+            ends.append(np.nan)
+        else:
+            starts.append((start - midnight).total_seconds() / 60)
+            ends.append((end - midnight).total_seconds() / 60)
+    return np.array(starts), np.array(ends)
+
+
+def _daily_bars(bars):
+    """Per-day OHLC plus the minute-of-day of the day's high and low."""
+    day = bars["timestamp"].dt.normalize()
+    minute = (bars["timestamp"] - day).dt.total_seconds().to_numpy() / 60
+    grouped = bars.assign(day=day, minute=minute).groupby("day", sort=True)
+    daily = grouped.agg(open=("open", "first"), high=("high", "max"), low=("low", "min"),
+                        close=("close", "last"), bars=("open", "size"))
+    high_at = bars["high"].to_numpy()
+    low_at = bars["low"].to_numpy()
+    day_codes = grouped.ngroup().to_numpy()
+    # Index of each day's first max/min, found with lexsort instead of a Python loop.
+    high_idx = np.lexsort((-high_at, day_codes))[np.r_[0, np.cumsum(daily["bars"].to_numpy())[:-1]]]
+    low_idx = np.lexsort((low_at, day_codes))[np.r_[0, np.cumsum(daily["bars"].to_numpy())[:-1]]]
+    daily["high_minute"] = minute[high_idx]
+    daily["low_minute"] = minute[low_idx]
+    return daily
+
+
+def backtest_symbol(bars, report_time=None, market=INDIAN_MARKET, swing_range_multiplier=1.0, planets=PLANETS):
+    """Evaluate one symbol's bars; returns one row per (day, planet)."""
+    if report_time is None:
+        report_time = get_market_hours(market)[0]
+    daily = _daily_bars(bars)
+    if daily.empty:
+        return pd.DataFrame()
+    rules = get_rules()
+    days = daily.index.to_numpy(dtype="datetime64[ns]")
+    n_days, n_planets = len(days), len(planets)
+    intraday = bool((daily["bars"] > 1).any())
+
+    report_offset = np.timedelta64(report_time.hour * 60 + report_time.minute, "m")
+    degrees = positions_array(days + report_offset, planets)
+    levels = calculate_gann_levels_batch(daily["open"].to_numpy(), degrees, planets, swing_range_multiplier, rules)
+    natures = transit_natures(degrees, planets, rules)
+    moon = degrees[:, list(planets).index("Moon")] if "Moon" in planets else np.zeros(n_days)
+    nakshatra = np.array(NAKSHATRAS)[(moon // (360 / 27)).astype(int) % 27]
+
+    win_start, win_end = timing_offsets(report_time, market, planets, rules)
+
+    def per_day(values):
+        return np.repeat(np.asarray(values), n_planets)
+
+    def per_planet(values):
+        return np.tile(np.asarray(values), n_days)
+
+    low, high, close = (per_day(daily[c].to_numpy()) for c in ("low", "high", "close"))
+    swing_low, swing_high = levels.swing_low.ravel(), levels.swing_high.ravel()
+    start, end = per_planet(win_start), per_planet(win_end)
+
+    result = pd.DataFrame({
+        "symbol": bars["symbol"].iloc[0],
+        "date": per_day(days),
+        "planet": per_planet(planets),
+        "nakshatra": per_day(nakshatra),
+        "transit_nature": natures.ravel(),
+        "degree": degrees.ravel(),
+        "open": per_day(daily["open"].to_numpy()),
+        "swing_low": swing_low,
+        "swing_high": swing_high,
+        "touched_low": low <= swing_low,
+        "touched_high": high >= swing_high,
+        "respected_low": (low <= swing_low) & (close > swing_low),
+        "respected_high": (high >= swing_high) & (close < swing_high),
+        "contained": (low >= swing_low) & (high <= swing_high),
+    })
+    if intraday:
+        high_minute = per_day(daily["high_minute"].to_numpy())
+        low_minute = per_day(daily["low_minute"].to_numpy())
+        in_window = (((high_minute >= start) & (high_minute <= end))
+                     | ((low_minute >= start) & (low_minute <= end)))
+        result["extreme_in_window"] = np.where(np.isnan(start), np.nan, in_window)
+    else:
+        result["extreme_in_window"] = np.nan
+    return result
+
+
+def _symbol_groups(path):
+    bars = load_ohlc(path)
+    return [group.reset_index(drop=True) for _, group in bars.groupby("symbol", sort=False)]
+
+
+def run_backtest(paths, report_time=None, market=INDIAN_MARKET, swing_range_multiplier=1.0, workers=None):
+    """Backtest every symbol in the files ``paths`` across ``workers`` processes (default: all cores).
+
+    Files are parsed in parallel, then each symbol's bars are a task of
+    their own.
+    """
+    args = (report_time, market, swing_range_multiplier)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        frames = [backtest_symbol(group, *args) for path in paths for group in _symbol_groups(path)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            loads = [pool.submit(_symbol_groups, path) for path in paths]
+            runs = [pool.submit(backtest_symbol, group, *args) for load in loads for group in load.result()]
+            frames = [run.result() for run in runs]
+    frames = [frame for frame in frames if not frame.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def hit_rates(results, by="planet"):
+    """Share of rows where each hit condition held, grouped by ``by``.
+
+    ``by`` is any result column (``"planet"``, ``"nakshatra"``,
+    ``"transit_nature"``) or a list of them.
+    """
+    columns = [c for c in HIT_COLUMNS if c in results.columns]
+    rates = results.groupby(by)[columns].mean()
+    rates.insert(0, "days", results.groupby(by).size())
+    return rates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtest Gann swing levels against OHLC files.")
+    parser.add_argument("paths", nargs="+", help="CSV or Parquet OHLC files")
+    parser.add_argument("--market", default=INDIAN_MARKET, choices=[INDIAN_MARKET, "Global Market"])
+    parser.add_argument("--report-time", default=None, help="HH:MM the levels are computed at (default: open)")
+    parser.add_argument("--multiplier", type=float, default=1.0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", help="write per-row results to this .parquet or .csv file")
+    args = parser.parse_args(argv)
+
+    report_time = time.fromisoformat(args.report_time) if args.report_time else None
+    started = datetime.now()
+    results = run_backtest(args.paths, report_time, args.market, args.multiplier, args.workers)
+    elapsed = (datetime.now() - started).total_seconds()
+    if results.empty:
+        print("no bars found")
+        return
+    if args.out:
+        if args.out.endswith(".parquet"):
+            results.to_parquet(args.out, index=False)
+        else:
+            results.to_csv(args.out, index=False)
+
+    pd.set_option("display.width", 160)
+    print(f"{results['symbol'].nunique()} symbols, {results['date'].nunique()} days, "
+          f"{len(results)} rows in {elapsed:.1f}s")
+    for by in ("planet", "nakshatra", "transit_nature"):
+        print(f"\nHit rates by {by}:")
+        print(hit_rates(results, by).round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Process-wide report cache with LRU eviction and an optional SQLite tier.
+
+Entries are the CMP-independent part of a report -- positions, Moon-node
+aspects, timing windows, natures -- keyed only on (date, time bucket, market,
+multiplier), so every session and every symbol at that instant shares one
+entry; a symbol's swing levels are derived from it per call with
+:meth:`~astro_gann.report.Report.with_cmp`. The memory tier is bounded by the pickled size of its entries; the
+disk tier, when a path is given, is written through on every insert and
+survives restarts. Keys start with :data:`CACHE_SCHEMA`, so pickles of an
+older :class:`~astro_gann.report.Report` layout are dropped when the disk
+tier is opened instead of being served.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from .core import INDIAN_MARKET
+from .diagnostics import stage
+from .report import generate_report
+from .rules import get_rules
+
+# Bump whenever Report/ReportRow change shape: disk entries of other versions are dropped
+CACHE_SCHEMA = 1
+
+
+def bucket_time(dt, bucket_minutes=1):
+    """Floor ``dt`` to the start of its ``bucket_minutes`` bucket."""
+    minutes = (dt.hour * 60 + dt.minute) // bucket_minutes * bucket_minutes
+    return datetime.combine(dt.date(), datetime.min.time()) + timedelta(minutes=minutes)
+
+
+def engine_key(dt, market, swing_range_multiplier, rules_key=""):
+    return "|".join((
+        f"v{CACHE_SCHEMA}",
+        dt.strftime("%Y-%m-%dT%H:%M"),
+        market,
+        f"{swing_range_multiplier:.4f}",
+        rules_key,
+    ))
+
+
+class ReportCache:
+    """Thread-safe LRU cache of :class:`~astro_gann.report.Report` objects.
+
+    ``max_bytes`` caps the memory tier; ``disk_path`` enables the SQLite tier.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_path=None, bucket_minutes=1):
+        self.max_bytes = max_bytes
+        self.bucket_minutes = bucket_minutes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = None
+        if disk_path is not None:
+            if os.path.dirname(disk_path):
+                os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS reports (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+            prefix = f"v{CACHE_SCHEMA}|"
+            self._db.execute("DELETE FROM reports WHERE substr(key, 1, ?) != ?", (len(prefix), prefix))
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM reports WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    try:
+                        value = pickle.loads(row[0])
+                    except Exception:
+                        # Written by incompatible code despite the schema tag
+                        self._db.execute("DELETE FROM reports WHERE key = ?", (key,))
+                        self._db.commit()
+                    else:
+                        self.disk_hits += 1
+                        self._insert(key, value, len(row[0]))
+                        return value
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._insert(key, value, len(blob))
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO reports (key, value) VALUES (?, ?)", (key, blob))
+                self._db.commit()
+
+    def _insert(self, key, value, size):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if disk and self._db is not None:
+                self._db.execute("DELETE FROM reports")
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def get_engine(self, dt, market=INDIAN_MARKET, swing_range_multiplier=1.0, timer=None, rules=None):
+        """Cached CMP-independent report for ``dt``'s time bucket (``cmp`` 0, no symbol).
+
+        Entries are keyed on the rule set too, so swapping rules never serves
+        a report built with the old ones.
+        """
+        rules = rules or get_rules()
+        dt = bucket_time(dt, self.bucket_minutes)
+        key = engine_key(dt, market, swing_range_multiplier, rules.key)
+        with stage(timer, "cache_lookup") as record:
+            report = self.get(key)
+            if record is not None:
+                record["hit"] = report is not None
+        if report is None:
+            report = generate_report(dt, 0.0, "", market, swing_range_multiplier, now=dt, timer=timer, rules=rules)
+            with stage(timer, "cache_store"):
+                self.put(key, report)
+        return report
+
+    def get_report(self, dt, cmp, symbol="Nifty", market=INDIAN_MARKET,
+                   swing_range_multiplier=1.0, now=None, timer=None, rules=None):
+        """Cached :func:`~astro_gann.report.generate_report` for ``dt``'s time bucket.
+
+        Only the swing levels are computed per call, from the cached engine
+        entry; the ``current_transit`` flags are re-evaluated at ``now``.
+        """
+        rules = rules or get_rules()
+        report = self.get_engine(dt, market, swing_range_multiplier, timer, rules)
+        if now is None:
+            now = datetime.combine(report.dt.date(), datetime.now().time())
+        with stage(timer, "levels"):
+            return report.with_cmp(cmp, symbol, rules).with_now(now)
+
+
+def cache_from_env():
+    """Build a cache sized by ``ASTRO_GANN_CACHE_MB`` with the disk tier at ``ASTRO_GANN_CACHE_PATH``."""
+    max_mb = float(os.environ.get("ASTRO_GANN_CACHE_MB", "64"))
+    return ReportCache(max_bytes=int(max_mb * 1024 * 1024),
+                       disk_path=os.environ.get("ASTRO_GANN_CACHE_PATH") or None)
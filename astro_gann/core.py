@@ -0,0 +1,269 @@
+"""Pure astro-Gann compute functions.
+
+Everything here is stdlib only and free of UI state: the market, the swing
+range multiplier and the session hours are passed in explicitly instead of
+being read from Streamlit sidebar globals. The rule literals below are the
+builtin defaults; lookups go through the compiled, swappable tables of
+:mod:`astro_gann.rules`, and every rule-dependent function accepts a
+``rules`` snapshot (default: the active rule set).
+"""
+
+import math
+from datetime import datetime, time, timedelta
+
+PLANETS = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn")
+
+INDIAN_MARKET = "Indian Market"
+GLOBAL_MARKET = "Global Market"
+
+MARKET_HOURS = {
+    INDIAN_MARKET: (time(9, 15), time(15, 15)),
+    GLOBAL_MARKET: (time(5, 0), time(23, 35)),
+}
+
+# Monday is 0, Sunday is 6
+DAY_RULERS = {
+    0: "Moon",
+    1: "Mars",
+    2: "Mercury",
+    3: "Jupiter",
+    4: "Venus",
+    5: "Saturn",
+    6: "Sun",
+}
+
+FAVORABLE_DEGREES = {
+    "Sun": [(0, 30), (120, 150), (240, 270)],
+    "Moon": [(60, 90), (150, 180), (270, 300)],
+    "Mercury": [(60, 90), (180, 210), (300, 330)],
+    "Venus": [(30, 60), (150, 180), (270, 300)],
+    "Mars": [(0, 30), (90, 120), (240, 270)],
+    "Jupiter": [(0, 30), (120, 150), (240, 270)],
+    "Saturn": [(60, 90), (210, 240), (300, 330)],
+}
+
+UNFAVORABLE_DEGREES = {
+    "Sun": [(90, 120), (210, 240), (330, 360)],
+    "Moon": [(0, 30), (120, 150), (210, 240)],
+    "Mercury": [(0, 30), (120, 150), (210, 240)],
+    "Venus": [(120, 150), (210, 240), (330, 360)],
+    "Mars": [(60, 90), (180, 210), (300, 330)],
+    "Jupiter": [(90, 120), (210, 240), (330, 360)],
+    "Saturn": [(0, 30), (120, 150), (240, 270)],
+}
+
+TRANSIT_NATURES = ("Neutral", "Favorable", "Negative")
+
+ZODIAC_VOLATILITY = {
+    0: 1.2, 1: 0.8, 2: 1.1, 3: 0.9, 4: 1.3, 5: 1.0,
+    6: 1.0, 7: 1.1, 8: 0.7, 9: 0.9, 10: 1.2, 11: 0.8,
+}
+
+PLANET_MULTIPLIERS = {
+    "Sun": 1.0, "Moon": 0.8, "Mercury": 1.1, "Venus": 0.7,
+    "Mars": 1.3, "Jupiter": 1.2, "Saturn": 0.9,
+}
+
+BASE_DURATION = {
+    "Sun": 30, "Moon": 90, "Mercury": 45, "Venus": 60,
+    "Mars": 75, "Jupiter": 120, "Saturn": 150,
+}
+
+NAKSHATRAS = (
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu",
+    "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta",
+    "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
+    "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
+    "Uttara Bhadrapada", "Revati",
+)
+
+ASPECTS = (0, 60, 90, 120, 180)
+
+# Planet IDs index the compiled rule tables of astro_gann.rules
+PLANET_IDS = {planet: index for index, planet in enumerate(PLANETS)}
+
+
+def get_market_hours(market):
+    """Return the ``(open, close)`` session times for ``market``."""
+    return MARKET_HOURS[market]
+
+
+def is_trading_day(date, market):
+    """Whether ``market`` has a session on ``date`` (weekends, holidays, special sessions)."""
+    from .trading_calendar import get_calendar
+
+    return get_calendar().is_trading_day(date, market)
+
+
+_rules_module = None
+
+
+def _active_rules(rules):
+    global _rules_module
+    if rules is not None:
+        return rules
+    if _rules_module is None:
+        # Imported on first use: astro_gann.rules builds its defaults from this module.
+        from . import rules as module
+
+        _rules_module = module
+    return _rules_module.get_rules()
+
+
+# Function to determine the important planet for the day
+def get_important_planet(date, rules=None):
+    return _active_rules(rules).important_planet(date.weekday())
+
+
+# Function to check if time is within market hours
+def is_within_market_hours(time, market):
+    market_start, market_end = get_market_hours(market)
+    return market_start <= time <= market_end
+
+
+# Function to adjust timing to market hours
+def adjust_timing_to_market(start_time, end_time, market):
+    from .trading_calendar import get_calendar
+
+    calendar = get_calendar()[market]
+    if not calendar.clip_windows:
+        return start_time, end_time
+
+    session = calendar.session(start_time.date())
+    end_session = calendar.session(end_time.date())
+    if session is None or end_session is None:
+        return None, None
+    if start_time.time() < session[0]:
+        start_time = datetime.combine(start_time.date(), session[0])
+    if end_time.time() > end_session[1]:
+        end_time = datetime.combine(end_time.date(), end_session[1])
+
+    if start_time >= end_time:
+        return None, None
+
+    return start_time, end_time
+
+
+def compile_transit_table(favorable=FAVORABLE_DEGREES, unfavorable=UNFAVORABLE_DEGREES, planets=PLANETS):
+    """Compile degree-range rules into ``(bin_width, {planet: nature codes})``.
+
+    Each range is half-open, ``[start, end)``, so it owns its lower boundary
+    just like zodiac signs and nakshatras do, and every degree belongs to
+    exactly one bin. Codes index :data:`TRANSIT_NATURES`; when a favorable
+    and an unfavorable range overlap, favorable wins. Boundaries must be
+    whole degrees (``ValueError`` otherwise); ``bin_width`` is the largest
+    whole degree dividing every boundary, so a lookup is a single integer
+    division.
+    """
+    bin_width = 360
+    for rules in (favorable, unfavorable):
+        for ranges in rules.values():
+            for start, end in ranges:
+                if start != int(start) or end != int(end):
+                    raise ValueError(f"degree range [{start}, {end}) is not in whole degrees")
+                bin_width = math.gcd(bin_width, int(start), int(end))
+
+    table = {}
+    for planet in planets:
+        codes = [0] * (360 // bin_width)
+        for code, rules in ((2, unfavorable), (1, favorable)):
+            for start, end in rules.get(planet, []):
+                for index in range(int(start) // bin_width, int(end) // bin_width):
+                    codes[index] = code
+        table[planet] = tuple(codes)
+    return bin_width, table
+
+
+TRANSIT_BIN_WIDTH, TRANSIT_TABLE = compile_transit_table()
+
+
+# Function to determine if a planet's transit is favorable or negative
+def get_transit_nature(planet, degree, rules=None):
+    planet_id = PLANET_IDS.get(planet)
+    if planet_id is None:
+        return "Neutral"
+    rules = _active_rules(rules)
+    codes = rules.transit_codes[planet_id]
+    return TRANSIT_NATURES[codes[int((degree % 360) // rules.transit_bin_width) % len(codes)]]
+
+
+# Function to calculate Moon-Rahu and Moon-Ketu transit times
+def calculate_moon_nodes_transit(dt, node="mean"):
+    from .aspects import moon_nodes_transit
+
+    return moon_nodes_transit(dt, node)
+
+
+# Aspects within orb between every pair of planets and nodes on the day
+def calculate_planet_aspects(dt, orbs=None):
+    from .aspects import planet_aspects
+
+    return planet_aspects(dt, orbs)
+
+
+# Sidereal planetary positions from the ephemeris engine
+def get_planetary_positions(dt):
+    # Imported here so the rest of the core stays importable without NumPy.
+    from .ephemeris import get_planetary_positions as ephemeris_positions
+
+    return ephemeris_positions(dt)
+
+
+# Get nakshatra based on moon's position
+def get_nakshatra(degree):
+    index = int(degree / (360 / 27)) % 27
+    return NAKSHATRAS[index]
+
+
+# Calculate Gann price levels based on planet's degree
+def calculate_gann_levels(cmp, planet_degree, planet_name, swing_range_multiplier=1.0, rules=None):
+    rules = _active_rules(rules)
+    planet_id = PLANET_IDS.get(planet_name)
+    if planet_id is None:
+        raise KeyError(planet_name)
+    zodiac_index = int(planet_degree / 30) % 12
+
+    degree_in_sign = planet_degree % 30
+    volatility_factor = rules.zodiac_volatility[zodiac_index] * rules.planet_multipliers[planet_id]
+
+    if degree_in_sign < 5 or degree_in_sign > 25:
+        volatility_factor *= 1.2
+
+    base_range_percent = 0.01 * swing_range_multiplier
+    range_percent = base_range_percent * volatility_factor
+
+    range_size = cmp * range_percent
+    swing_low = cmp - range_size
+    swing_high = cmp + range_size
+
+    degree_range = 3 * volatility_factor
+    degree_low = (planet_degree - degree_range) % 360
+    degree_high = (planet_degree + degree_range) % 360
+
+    return swing_low, swing_high, degree_low, degree_high
+
+
+# Calculate timing window
+def calculate_timing(dt, planet, market, rules=None):
+    planet_id = PLANET_IDS.get(planet)
+    duration = _active_rules(rules).base_duration[planet_id] if planet_id is not None else 60
+
+    if market == INDIAN_MARKET:
+        from .trading_calendar import get_calendar
+
+        # Centre on the day's calendar session (special sessions keep their own
+        # hours); the regular hours are only the fallback for closed days
+        market_start, market_end = get_calendar()[market].session(dt.date()) or get_market_hours(market)
+        if dt.time() < market_start:
+            center_time = datetime.combine(dt.date(), market_start)
+        elif dt.time() > market_end:
+            center_time = datetime.combine(dt.date(), market_end)
+        else:
+            center_time = dt
+    else:
+        center_time = dt
+
+    start_time = center_time - timedelta(minutes=duration // 2)
+    end_time = center_time + timedelta(minutes=duration // 2)
+
+    return start_time, end_time
@@ -0,0 +1,133 @@
+"""Per-stage timing and memory counters for the report generation path.
+
+A :class:`StageTimer` is cheap enough to leave on in production: wall time
+per stage is always recorded, Python allocation counters only when
+``trace_memory`` is set (tracemalloc slows allocation-heavy code down).
+Finished timings are emitted as one JSON log line on the
+``astro_gann.diagnostics`` logger.
+
+tracemalloc is process-global: while two memory-tracing timers overlap
+(e.g. two app sessions with diagnostics on), each sees the other's
+allocations and peak resets. Their stage records are then flagged with
+``memory_shared`` and the byte counts are only indicative; wall times are
+unaffected.
+"""
+
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger("astro_gann.diagnostics")
+
+_trace_lock = threading.Lock()
+_tracers = 0  # memory-tracing timers not yet finished
+_tracer_starts = 0  # memory-tracing timers ever created, to spot overlaps
+_started_tracing = False  # tracemalloc was started by a timer, not by the host process
+
+
+def _max_rss_kb():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class StageTimer:
+    """Collects ``(stage, seconds, memory)`` records for one run."""
+
+    def __init__(self, name="report", trace_memory=False):
+        global _tracers, _tracer_starts, _started_tracing
+        self.name = name
+        self.trace_memory = trace_memory
+        self.stages = []
+        self._depth = 0
+        # Running peak of each open stage; tracemalloc has a single peak, so a
+        # nested stage folds it into its parent's before resetting it
+        self._peaks = []
+        self._tracing = False
+        if trace_memory:
+            with _trace_lock:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _started_tracing = True
+                _tracers += 1
+                _tracer_starts += 1
+            self._tracing = True
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        record = {"stage": name, "depth": self._depth}
+        self._depth += 1
+        if self.trace_memory:
+            shared = _tracers > 1
+            starts = _tracer_starts
+            before, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append(before)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            self._depth -= 1
+            record["seconds"] = time.perf_counter() - start
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(self._peaks.pop(), peak)
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                record["alloc_bytes"] = current - before
+                record["peak_bytes"] = peak - before
+                record["memory_shared"] = shared or _tracers > 1 or _tracer_starts != starts
+            self.stages.append(record)
+
+    @property
+    def total_seconds(self):
+        """Wall time of the top-level stages; nested stages are already inside them."""
+        return sum(record["seconds"] for record in self.stages if record["depth"] == 0)
+
+    def finish(self):
+        """Stop tracemalloc if a timer started it and no other timer is still tracing."""
+        global _tracers, _started_tracing
+        if not self._tracing:
+            return
+        self._tracing = False
+        with _trace_lock:
+            _tracers -= 1
+            if _tracers == 0 and _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
+
+    def to_dict(self, **context):
+        return {
+            "name": self.name,
+            **context,
+            "wall_seconds": time.perf_counter() - self._started,
+            "total_seconds": self.total_seconds,
+            "max_rss_kb": _max_rss_kb(),
+            "stages": self.stages,
+        }
+
+    def to_json(self, **context):
+        return json.dumps(self.to_dict(**context), default=str)
+
+    def log(self, level=logging.INFO, **context):
+        """Emit the timings as a single structured JSON line."""
+        if logger.isEnabledFor(level):
+            logger.log(level, self.to_json(**context))
+
+
+def stage(timer, name):
+    """``timer.stage(name)``, or a no-op context when ``timer`` is ``None``."""
+    if timer is None:
+        return nullcontext()
+    return timer.stage(name)
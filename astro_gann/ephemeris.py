@@ -0,0 +1,342 @@
+"""Planetary positions from an analytic model or a precomputed ephemeris table.
+
+The analytic model follows the low-precision orbital elements published by
+Paul Schlyter ("How to compute planetary positions"), good to a few arc
+minutes for the outer planets and ~0.2° for the Moon, and is converted to
+sidereal (Lahiri) longitudes so nakshatras line up with Vedic charts.
+
+For heavy use a table of hourly samples can be built offline with::
+
+    python -m astro_gann.ephemeris --start 1990-01-01 --end 2050-01-01 --out data/ephemeris
+
+which writes ``ephemeris.npy`` (unwrapped longitudes, one column per body)
+and ``ephemeris.json`` (epoch, step, body names). :class:`EphemerisTable`
+memory-maps the ``.npy`` file and answers lookups by linear interpolation
+between the two neighbouring samples, so a lookup costs the same for any
+timestamp and nothing is parsed per request. Set ``ASTRO_GANN_EPHEMERIS``
+to the table path (or call :func:`use_ephemeris`) to enable it; timestamps
+outside the table fall back to the analytic model.
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from .core import PLANETS
+
+BODIES = PLANETS + ("Rahu",)
+
+# Rahu/Ketu are the mean lunar nodes; the "True" variants add the periodic terms.
+NODES = ("Rahu", "Ketu", "True Rahu", "True Ketu")
+
+# Naive datetimes throughout the tool are Indian Standard Time.
+LOCAL_UTC_OFFSET = timedelta(hours=5, minutes=30)
+
+# Schlyter's day number: days since 1999-12-31 00:00 UT.
+_EPOCH = datetime(1999, 12, 31, tzinfo=timezone.utc)
+_EPOCH_UNIX = _EPOCH.timestamp()
+
+AYANAMSA_J2000 = 23.853
+PRECESSION_PER_DAY = 3.82394e-5
+
+# name: (N, N/day, i, i/day, w, w/day, a, e, e/day, M, M/day)
+_ELEMENTS = {
+    "Mercury": (48.3313, 3.24587e-5, 7.0047, 5.00e-8, 29.1241, 1.01444e-5, 0.387098,
+                0.205635, 5.59e-10, 168.6562, 4.0923344368),
+    "Venus": (76.6799, 2.46590e-5, 3.3946, 2.75e-8, 54.8910, 1.38374e-5, 0.723330,
+              0.006773, -1.302e-9, 48.0052, 1.6021302244),
+    "Mars": (49.5574, 2.11081e-5, 1.8497, -1.78e-8, 286.5016, 2.92961e-5, 1.523688,
+             0.093405, 2.516e-9, 18.6021, 0.5240207766),
+    "Jupiter": (100.4542, 2.76854e-5, 1.3030, -1.557e-7, 273.8777, 1.64505e-5, 5.20256,
+                0.048498, 4.469e-9, 19.8950, 0.0830853001),
+    "Saturn": (113.6634, 2.38980e-5, 2.4886, -1.081e-7, 339.3939, 2.97661e-5, 9.55475,
+               0.055546, -9.499e-9, 316.9670, 0.0334442282),
+}
+
+
+def to_unix_seconds(timestamps):
+    """Convert datetimes, ``datetime64`` values or epoch seconds to UTC epoch seconds.
+
+    Naive datetimes (and ``datetime64`` values, which carry no zone) are taken
+    to be IST, matching the times entered in the Streamlit sidebar.
+    """
+    if isinstance(timestamps, datetime):
+        if timestamps.tzinfo is None:
+            return (timestamps - LOCAL_UTC_OFFSET).replace(tzinfo=timezone.utc).timestamp()
+        return timestamps.timestamp()
+    arr = np.asarray(timestamps)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        seconds = arr.astype("datetime64[ns]").astype(np.int64) / 1e9
+        return seconds - LOCAL_UTC_OFFSET.total_seconds()
+    if arr.dtype == object:
+        return np.array([to_unix_seconds(ts) for ts in arr.ravel()]).reshape(arr.shape)
+    return arr.astype(np.float64)
+
+
+def from_unix_seconds(unix_seconds):
+    """Inverse of :func:`to_unix_seconds` for a single value: a naive IST datetime."""
+    return datetime.fromtimestamp(float(unix_seconds), timezone.utc).replace(tzinfo=None) + LOCAL_UTC_OFFSET
+
+
+def _day_number(unix_seconds):
+    return (np.asarray(unix_seconds, dtype=np.float64) - _EPOCH_UNIX) / 86400.0
+
+
+def _kepler(M, e):
+    E = M + e * np.sin(M) * (1.0 + e * np.cos(M))
+    for _ in range(5):
+        E = E - (E - e * np.sin(E) - M) / (1.0 - e * np.cos(E))
+    return E
+
+
+def _orbit(N, i, w, a, e, M):
+    """Ecliptic rectangular coordinates for angles in degrees."""
+    N, i, w, M = (np.radians(x) for x in (N, i, w, M))
+    E = _kepler(M, e)
+    xv = a * (np.cos(E) - e)
+    yv = a * np.sqrt(1.0 - e * e) * np.sin(E)
+    v = np.arctan2(yv, xv)
+    r = np.hypot(xv, yv)
+    vw = v + w
+    x = r * (np.cos(N) * np.cos(vw) - np.sin(N) * np.sin(vw) * np.cos(i))
+    y = r * (np.sin(N) * np.cos(vw) + np.cos(N) * np.sin(vw) * np.cos(i))
+    return x, y
+
+
+def _sind(x):
+    return np.sin(np.radians(x))
+
+
+def _cosd(x):
+    return np.cos(np.radians(x))
+
+
+def _sun(d):
+    w = 282.9404 + 4.70935e-5 * d
+    e = 0.016709 - 1.151e-9 * d
+    M = 356.0470 + 0.9856002585 * d
+    E = _kepler(np.radians(M), e)
+    xv = np.cos(E) - e
+    yv = np.sqrt(1.0 - e * e) * np.sin(E)
+    lon = np.degrees(np.arctan2(yv, xv)) + w
+    r = np.hypot(xv, yv)
+    return lon, r, M, w
+
+
+def _moon_angles(d, sun_M, sun_w):
+    N = 125.1228 - 0.0529538083 * d
+    w = 318.0634 + 0.1643573223 * d
+    M = 115.3654 + 13.0649929509 * d
+    Ls = sun_M + sun_w
+    Lm = M + w + N
+    D = Lm - Ls
+    F = Lm - N
+    return N, w, M, D, F
+
+
+def _moon(d, sun_M, sun_w):
+    N, w, M, D, F = _moon_angles(d, sun_M, sun_w)
+    x, y = _orbit(N, 5.1454, w, 60.2666, 0.0549, M)
+    lon = np.degrees(np.arctan2(y, x))
+    lon += (-1.274 * _sind(M - 2 * D)
+            + 0.658 * _sind(2 * D)
+            - 0.186 * _sind(sun_M)
+            - 0.059 * _sind(2 * M - 2 * D)
+            - 0.057 * _sind(M - 2 * D + sun_M)
+            + 0.053 * _sind(M + 2 * D)
+            + 0.046 * _sind(2 * D - sun_M)
+            + 0.041 * _sind(M - sun_M)
+            - 0.035 * _sind(D)
+            - 0.031 * _sind(M + sun_M)
+            - 0.015 * _sind(2 * F - 2 * D)
+            + 0.011 * _sind(M - 4 * D))
+    return lon
+
+
+def _node(name, d, sun_M, sun_w):
+    """Mean node, or the true node using the main periodic terms from Meeus (ch. 47)."""
+    N, _, M, D, F = _moon_angles(d, sun_M, sun_w)
+    if name.startswith("True"):
+        N = (N - 1.4979 * _sind(2 * (D - F))
+             - 0.1500 * _sind(sun_M)
+             - 0.1226 * _sind(2 * D)
+             + 0.1176 * _sind(2 * F)
+             - 0.0801 * _sind(2 * (F - M)))
+    if name.endswith("Ketu"):
+        N = N + 180.0
+    return N
+
+
+def _planet(name, d, sun_x, sun_y):
+    N0, dN, i0, di, w0, dw, a, e0, de, M0, dM = _ELEMENTS[name]
+    x, y = _orbit(N0 + dN * d, i0 + di * d, w0 + dw * d, a, e0 + de * d, M0 + dM * d)
+    lon = np.degrees(np.arctan2(y + sun_y, x + sun_x))
+    if name in ("Jupiter", "Saturn"):
+        Mj = 19.8950 + 0.0830853001 * d
+        Ms = 316.9670 + 0.0334442282 * d
+        if name == "Jupiter":
+            lon += (-0.332 * _sind(2 * Mj - 5 * Ms - 67.6)
+                    - 0.056 * _sind(2 * Mj - 2 * Ms + 21)
+                    + 0.042 * _sind(3 * Mj - 5 * Ms + 21)
+                    - 0.036 * _sind(Mj - 2 * Ms)
+                    + 0.022 * _cosd(Mj - Ms)
+                    + 0.023 * _sind(2 * Mj - 3 * Ms + 52)
+                    - 0.016 * _sind(Mj - 5 * Ms - 69))
+        else:
+            lon += (0.812 * _sind(2 * Mj - 5 * Ms - 67.6)
+                    - 0.229 * _cosd(2 * Mj - 4 * Ms - 2)
+                    + 0.119 * _sind(Mj - 2 * Ms - 3)
+                    + 0.046 * _sind(2 * Mj - 6 * Ms - 69)
+                    + 0.014 * _sind(Mj - 3 * Ms + 32))
+    return lon
+
+
+def compute_longitudes(unix_seconds, bodies=BODIES):
+    """Sidereal longitudes in ``[0, 360)`` with shape ``(len(unix_seconds), len(bodies))``."""
+    d = np.atleast_1d(_day_number(unix_seconds))
+    sun_lon, sun_r, sun_M, sun_w = _sun(d)
+    sun_x = sun_r * _cosd(sun_lon)
+    sun_y = sun_r * _sind(sun_lon)
+
+    columns = []
+    for body in bodies:
+        if body == "Sun":
+            lon = sun_lon
+        elif body == "Moon":
+            lon = _moon(d, sun_M, sun_w)
+        elif body in NODES:
+            lon = _node(body, d, sun_M, sun_w)
+        else:
+            lon = _planet(body, d, sun_x, sun_y)
+        columns.append(lon)
+
+    # The elements are referred to the equinox of date; subtracting the
+    # Lahiri ayanamsa of date gives sidereal longitudes.
+    tropical = np.stack(columns, axis=-1)
+    ayanamsa = AYANAMSA_J2000 + PRECESSION_PER_DAY * d
+    return (tropical - ayanamsa[:, None]) % 360.0
+
+
+class EphemerisTable:
+    """Memory-mapped table of unwrapped longitudes sampled at a fixed step."""
+
+    def __init__(self, path):
+        base = os.path.splitext(path)[0]
+        with open(base + ".json") as fh:
+            meta = json.load(fh)
+        self.path = base
+        self.start = float(meta["start"])
+        self.step = float(meta["step"])
+        self.bodies = tuple(meta["bodies"])
+        self.data = np.load(base + ".npy", mmap_mode="r")
+        self.end = self.start + self.step * (len(self.data) - 1)
+        self._columns = {body: index for index, body in enumerate(self.bodies)}
+
+    def __len__(self):
+        return len(self.data)
+
+    def covers(self, unix_seconds):
+        t = np.asarray(unix_seconds, dtype=np.float64)
+        return bool(np.all((t >= self.start) & (t <= self.end)))
+
+    def longitudes(self, unix_seconds, bodies=BODIES):
+        """Interpolated longitudes shaped ``(len(unix_seconds), len(bodies))``."""
+        t = np.atleast_1d(np.asarray(unix_seconds, dtype=np.float64))
+        if not self.covers(t):
+            raise ValueError(f"timestamps outside ephemeris range [{self.start}, {self.end}]")
+        columns = [self._columns[body] for body in bodies]
+
+        position = (t - self.start) / self.step
+        index = np.minimum(position.astype(np.intp), len(self.data) - 2)
+        frac = (position - index)[:, None]
+
+        lower = self.data[index][:, columns]
+        upper = self.data[index + 1][:, columns]
+        return (lower + (upper - lower) * frac) % 360.0
+
+
+_table = None
+
+
+def use_ephemeris(path):
+    """Route position lookups through the table at ``path`` (``None`` to disable)."""
+    global _table
+    _table = EphemerisTable(path) if path is not None else None
+    return _table
+
+
+def get_ephemeris():
+    return _table
+
+
+def positions_array(timestamps, bodies=BODIES):
+    """Longitudes for an array of timestamps, from the table when it covers them."""
+    unix_seconds = np.atleast_1d(to_unix_seconds(timestamps))
+    if _table is not None and set(bodies) <= set(_table.bodies) and _table.covers(unix_seconds):
+        return _table.longitudes(unix_seconds, bodies)
+    return compute_longitudes(unix_seconds, bodies)
+
+
+def get_planetary_positions(dt, bodies=PLANETS):
+    """``{planet: sidereal longitude}`` for a single instant."""
+    row = positions_array([to_unix_seconds(dt)], bodies)[0]
+    return {body: float(lon) for body, lon in zip(bodies, row)}
+
+
+def build_table(out, start, end, step_seconds=3600, bodies=BODIES, chunk=100_000):
+    """Sample the analytic model from ``start`` to ``end`` into ``out``.npy/.json.
+
+    Longitudes are unwrapped so interpolation never crosses the 0°/360° seam;
+    the file is filled chunk by chunk so memory stays bounded for long spans.
+    """
+    base = os.path.splitext(out)[0]
+    if os.path.dirname(base):
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+    t0 = to_unix_seconds(start)
+    t1 = to_unix_seconds(end)
+    count = int((t1 - t0) // step_seconds) + 1
+
+    data = np.lib.format.open_memmap(base + ".npy", mode="w+", dtype=np.float64,
+                                     shape=(count, len(bodies)))
+    previous = None
+    for lo in range(0, count, chunk):
+        hi = min(lo + chunk, count)
+        lon = compute_longitudes(t0 + step_seconds * np.arange(lo, hi, dtype=np.float64), bodies)
+        if previous is not None:
+            lon = np.vstack([previous, lon])
+        lon = np.unwrap(lon, axis=0, period=360.0)
+        if previous is not None:
+            lon = lon[1:]
+        data[lo:hi] = lon
+        previous = lon[-1:]
+    data.flush()
+    del data
+
+    with open(base + ".json", "w") as fh:
+        json.dump({"start": t0, "step": step_seconds, "bodies": list(bodies),
+                   "model": "schlyter-lahiri"}, fh, indent=2)
+    return base
+
+
+if os.environ.get("ASTRO_GANN_EPHEMERIS"):
+    use_ephemeris(os.environ["ASTRO_GANN_EPHEMERIS"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a precomputed ephemeris table.")
+    parser.add_argument("--start", required=True, help="first sample, YYYY-MM-DD (IST)")
+    parser.add_argument("--end", required=True, help="last sample, YYYY-MM-DD (IST)")
+    parser.add_argument("--step-minutes", type=float, default=60.0)
+    parser.add_argument("--out", default="data/ephemeris")
+    args = parser.parse_args(argv)
+
+    base = build_table(args.out, datetime.fromisoformat(args.start), datetime.fromisoformat(args.end),
+                       step_seconds=args.step_minutes * 60)
+    print(f"wrote {base}.npy and {base}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""File exports of report frames, built incrementally chunk by chunk."""
+
+from .styles import HIGHLIGHT_CATEGORIES, HIGHLIGHTS, row_categories
+
+PDF_COLUMN_WIDTHS = (0.8, 0.9, 0.9, 0.9, 1.35, 1.45, 1.45, 0.85, 0.7, 0.75)
+
+
+def _pdf_text(value):
+    # The standard PDF fonts have no rupee glyph.
+    return str(value).replace("₹", "Rs ")
+
+
+def _pdf_table(frame, column_widths):
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Table, TableStyle
+
+    columns = list(frame.columns)
+    data = [columns] + [[_pdf_text(value) for value in row] for row in frame.itertuples(index=False)]
+    widths = [w * inch for w in column_widths] if len(column_widths) == len(columns) else None
+    table = Table(data, colWidths=widths, repeatRows=1)
+
+    commands = [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 7),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#b0bec5")),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]
+    for index, code in enumerate(row_categories(frame), start=1):
+        if code < 0:
+            continue
+        spec = HIGHLIGHTS[HIGHLIGHT_CATEGORIES[code]]
+        commands.append(("BACKGROUND", (0, index), (-1, index), colors.HexColor(spec["background"])))
+        if spec["bold"]:
+            commands.append(("FONTNAME", (0, index), (-1, index), "Helvetica-Bold"))
+        if spec["border_side"] == "box":
+            commands.append(("BOX", (0, index), (-1, index), 1.5, colors.HexColor(spec["border"])))
+        elif spec["border_side"] == "left":
+            commands.append(("LINEBEFORE", (0, index), (0, index), 3, colors.HexColor(spec["border"])))
+    table.setStyle(TableStyle(commands))
+    return table
+
+
+def write_pdf(frames, path_or_buffer, title="Astro-Gann Swing Report", column_widths=PDF_COLUMN_WIDTHS):
+    """Write report frames to a landscape A4 PDF, one titled table per frame.
+
+    ``frames`` may be any iterable, e.g. :func:`astro_gann.stream.iter_report_frames`.
+    Each frame is laid out and flushed to pages before the next one is
+    pulled, so only the current chunk's flowables are held in memory.
+    Row colours follow :data:`astro_gann.styles.HIGHLIGHTS`. Returns the row count.
+    """
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer
+
+    styles = getSampleStyleSheet()
+    doc = BaseDocTemplate(path_or_buffer, pagesize=landscape(A4), title=title,
+                          leftMargin=0.4 * inch, rightMargin=0.4 * inch,
+                          topMargin=0.5 * inch, bottomMargin=0.5 * inch)
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id="body")
+    doc.addPageTemplates([PageTemplate(id="report", frames=[frame])])
+
+    # Same steps as BaseDocTemplate.build(), but fed one chunk at a time.
+    doc._startBuild()
+    doc.canv._doctemplate = doc
+    rows = 0
+    try:
+        pending = [Paragraph(title, styles["Title"])]
+        for chunk in frames:
+            heading = chunk["Date"].iloc[0] if "Date" in chunk.columns and len(chunk) else None
+            body = chunk.drop(columns=["Date"]) if heading is not None else chunk
+            if heading is not None:
+                pending.append(Paragraph(f"{heading} — {len(chunk)} rows", styles["Heading3"]))
+            pending.append(_pdf_table(body, column_widths))
+            pending.append(Spacer(1, 0.15 * inch))
+            rows += len(chunk)
+            while pending:
+                doc.clean_hanging()
+                doc.handle_flowable(pending)
+    finally:
+        del doc.canv._doctemplate
+    doc._endBuild()
+    return rows
+
+
+def _excel_rules(columns, last_row):
+    """Sheet-level conditional formatting equivalent to the row highlights."""
+    from openpyxl.formatting.rule import FormulaRule
+    from openpyxl.styles import Border, Font, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+
+    letter = {name: get_column_letter(index) for index, name in enumerate(columns, start=1)}
+    important = f'${letter["Important"]}2="Yes"'
+    current = f'${letter["Current Transit"]}2="Yes"'
+    nature = f'${letter["Transit Nature"]}2'
+    conditions = {
+        "important_current": f"AND({important},{current})",
+        "current": current,
+        "important": important,
+        "favorable": f'AND({nature}="Favorable",NOT({important}),NOT({current}))',
+        "negative": f'AND({nature}="Negative",NOT({important}),NOT({current}))',
+    }
+
+    row_range = f"A2:{get_column_letter(len(columns))}{last_row}"
+    first_column = f"A2:A{last_row}"
+    rules = []
+    for category, spec in HIGHLIGHTS.items():
+        color = spec["background"].lstrip("#").upper()
+        fill = PatternFill(fill_type="solid", start_color=color, end_color=color, bgColor=color)
+        font = Font(bold=True) if spec["bold"] else None
+        border = None
+        if spec["border_side"] == "box":
+            side = Side(style="medium", color=spec["border"].lstrip("#").upper())
+            border = Border(left=side, right=side, top=side, bottom=side)
+        elif spec["border_side"] == "left":
+            # CSS puts this border on the row's left edge only, so it gets
+            # its own rule on the first column.
+            side = Side(style="thick", color=spec["border"].lstrip("#").upper())
+            rules.append((first_column, FormulaRule(formula=[conditions[category]], border=Border(left=side))))
+        rules.append((row_range, FormulaRule(formula=[conditions[category]], fill=fill, font=font,
+                                             border=border, stopIfTrue=True)))
+    # Left-border rules must be evaluated before the stopIfTrue fill rules.
+    rules.sort(key=lambda rule: rule[0] != first_column)
+    return rules
+
+
+def write_excel(frames, path_or_buffer, sheet_by=None, sheet_name="Report"):
+    """Stream report frames into an ``.xlsx`` workbook; returns the row count.
+
+    Uses openpyxl's write-only mode, so rows go straight to temporary files
+    instead of building the workbook in memory. Highlighting is expressed as
+    a handful of conditional formatting rules per sheet rather than
+    per-cell styles. ``sheet_by`` names a column (e.g. ``"Symbol"``) whose
+    values each get their own sheet.
+    """
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    sheets = {}
+    rows = 0
+
+    def sheet_for(key, columns):
+        if key not in sheets:
+            sheet = workbook.create_sheet(str(key)[:31])
+            for index, name in enumerate(columns, start=1):
+                sheet.column_dimensions[get_column_letter(index)].width = max(12, len(name) + 4)
+            sheet.append(columns)
+            sheets[key] = [sheet, columns, 1]
+        return sheets[key]
+
+    for chunk in frames:
+        columns = list(chunk.columns)
+        key_index = columns.index(sheet_by) if sheet_by is not None else None
+        for values in chunk.itertuples(index=False, name=None):
+            entry = sheet_for(sheet_name if key_index is None else values[key_index], columns)
+            entry[0].append(values)
+            entry[2] += 1
+        rows += len(chunk)
+
+    if not sheets:
+        workbook.create_sheet(sheet_name)
+    for sheet, columns, last_row in sheets.values():
+        if last_row > 1 and {"Important", "Current Transit", "Transit Nature"} <= set(columns):
+            for cell_range, rule in _excel_rules(columns, last_row):
+                sheet.conditional_formatting.add(cell_range, rule)
+
+    workbook.save(path_or_buffer)
+    return rows
@@ -0,0 +1,279 @@
+"""Nightly grid of reports over symbols × trading days × swing multipliers.
+
+Work is split into one chunk per trading day: the planet positions, timing
+windows and natures for that instant are computed once and the levels for
+every (multiplier, symbol) pair follow from one array operation. Workers
+write each chunk straight to ``<out>/<YYYY-MM-DD>.parquet`` (typed columns,
+see :data:`~astro_gann.report.REPORT_SCHEMA`) through a temporary file and an
+atomic rename, so a crashed or interrupted run resumes by skipping the days
+whose file already exists. The run's parameters (symbols and CMPs,
+multipliers, market, report time, rules) are recorded in
+``<out>/_manifest.json``; resuming into a directory written with other
+parameters is refused, and recomputing it (``--no-resume``) first deletes
+the old day files, so two grids are never mixed::
+
+    python -m astro_gann.grid --symbols symbols.csv --start 2025-01-01 --end 2025-12-31 \\
+        --multipliers 0.5 1 1.5 --out grid/ --workers 8
+
+The output directory reads back as one table with ``pd.read_parquet(out)``
+(files starting with ``_`` or ``.`` are ignored).
+"""
+
+import argparse
+import json
+import os
+import re
+import time as clock
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, time
+
+import numpy as np
+import pandas as pd
+
+from .core import (
+    INDIAN_MARKET,
+    adjust_timing_to_market,
+    calculate_timing,
+    get_important_planet,
+    get_market_hours,
+    get_planetary_positions,
+)
+from .levels import calculate_gann_levels_batch
+from .report import REPORT_CATEGORIES
+from .rules import get_rules
+from .stream import iter_instants, parse_symbols
+from .transit import transit_natures
+
+GRID_COLUMNS = ("report_time", "swing_range_multiplier", "symbol", "cmp", "planet", "nakshatra", "degree",
+                "swing_low", "swing_high", "degree_low", "degree_high", "window_start", "window_end",
+                "transit_nature", "important", "current_transit", "rule_version")
+
+
+def load_symbols(source):
+    """``{symbol: cmp}`` from a CSV/Parquet file with ``symbol`` and ``cmp`` columns, or ``"SYM:CMP,..."`` text."""
+    if not os.path.exists(source):
+        return parse_symbols(source)
+    frame = pd.read_parquet(source) if source.endswith((".parquet", ".pq")) else pd.read_csv(source)
+    frame.columns = [str(c).strip().lower() for c in frame.columns]
+    missing = {"symbol", "cmp"} - set(frame.columns)
+    if missing:
+        raise ValueError(f"{source}: missing columns {sorted(missing)}")
+    return dict(zip(frame["symbol"].astype(str), frame["cmp"].astype(float)))
+
+
+def grid_frame(dt, symbols, multipliers, market=INDIAN_MARKET, now=None, rules=None):
+    """Typed report rows for every multiplier × symbol × planet at the instant ``dt``.
+
+    Rows match :func:`~astro_gann.report.generate_report` for the same inputs.
+    ``current_transit`` is evaluated at ``now``, which defaults to ``dt``.
+    """
+    now = dt if now is None else now
+    rules = rules or get_rules()
+    positions = get_planetary_positions(dt)
+    important_planet = get_important_planet(dt.date(), rules)
+
+    planets, starts, ends = [], [], []
+    for planet in positions:
+        start, end = adjust_timing_to_market(*calculate_timing(dt, planet, market, rules), market)
+        if market == INDIAN_MARKET and (start is None or end is None):
+            continue
+        planets.append(planet)
+        starts.append(start)
+        ends.append(end)
+
+    names = list(symbols)
+    cmps = np.fromiter(symbols.values(), dtype=np.float64, count=len(names))
+    degrees = np.array([positions[planet] for planet in planets], dtype=np.float64)
+    levels = [calculate_gann_levels_batch(cmps, degrees, planets, mult, rules) for mult in multipliers]
+    n_mult, n_sym, n_planet = len(multipliers), len(names), len(planets)
+
+    def per_planet(values):
+        return np.tile(np.asarray(values), n_mult * n_sym)
+
+    def per_symbol(values):
+        return np.tile(np.repeat(np.asarray(values), n_planet), n_mult)
+
+    def stacked(field):
+        return np.concatenate([getattr(level, field).ravel() for level in levels]) if levels else np.empty(0)
+
+    moon = positions["Moon"]
+    nakshatra = REPORT_CATEGORIES["nakshatra"][int(moon // (360 / 27)) % 27]
+    start_arr = np.array(starts, dtype="datetime64[ns]")
+    end_arr = np.array(ends, dtype="datetime64[ns]")
+    planet_arr = np.array(planets, dtype=object)
+
+    frame = pd.DataFrame({
+        "report_time": np.full(n_mult * n_sym * n_planet, np.datetime64(dt, "ns")),
+        "swing_range_multiplier": np.repeat(np.asarray(multipliers, dtype=np.float64), n_sym * n_planet),
+        "symbol": pd.Categorical(per_symbol(np.array(names, dtype=object)), categories=names),
+        "cmp": per_symbol(cmps),
+        "planet": pd.Categorical(per_planet(planet_arr), categories=REPORT_CATEGORIES["planet"]),
+        "nakshatra": pd.Categorical(per_planet(np.where(planet_arr == "Moon", nakshatra, None)),
+                                    categories=REPORT_CATEGORIES["nakshatra"]),
+        "degree": per_planet(degrees),
+        "swing_low": stacked("swing_low"),
+        "swing_high": stacked("swing_high"),
+        "degree_low": stacked("degree_low"),
+        "degree_high": stacked("degree_high"),
+        "window_start": per_planet(start_arr),
+        "window_end": per_planet(end_arr),
+        "transit_nature": pd.Categorical(per_planet(transit_natures(degrees, planets, rules)),
+                                         categories=REPORT_CATEGORIES["transit_nature"]),
+        "important": per_planet(planet_arr == important_planet),
+        "current_transit": per_planet((start_arr <= np.datetime64(now, "ns"))
+                                      & (np.datetime64(now, "ns") <= end_arr)),
+        "rule_version": pd.Categorical(np.full(n_mult * n_sym * n_planet, rules.version, dtype=object)),
+    }, columns=list(GRID_COLUMNS))
+    return frame
+
+
+def chunk_path(out_dir, day):
+    return os.path.join(out_dir, f"{day:%Y-%m-%d}.parquet")
+
+
+def manifest_path(out_dir):
+    return os.path.join(out_dir, "_manifest.json")
+
+
+def _day_files(out_dir):
+    return [name for name in os.listdir(out_dir) if re.fullmatch(r"\d{4}-\d{2}-\d{2}\.parquet", name)]
+
+
+def _check_manifest(out_dir, manifest, resume):
+    """Make ``out_dir`` hold one grid, described by ``manifest``.
+
+    When day files were written with another (or no) manifest, ``resume``
+    raises ``ValueError``; otherwise the old day files are deleted, so days
+    outside the new range cannot mix into the new grid.
+    """
+    path = manifest_path(out_dir)
+    stored = None
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as fh:
+            stored = json.load(fh)
+    if stored == manifest:
+        return
+    days = _day_files(out_dir)
+    if days:
+        if resume and stored is None:
+            raise ValueError(f"{out_dir}: existing grid has no manifest to resume from; "
+                             "use another directory or resume=False to recompute it")
+        if resume:
+            changed = sorted(key for key in manifest.keys() | stored.keys() if manifest.get(key) != stored.get(key))
+            raise ValueError(f"{out_dir}: grid was written with different {', '.join(changed)}; "
+                             "use another directory or resume=False to recompute it")
+        for name in days:
+            os.remove(os.path.join(out_dir, name))
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=1)
+    os.replace(partial, path)
+
+
+def _run_chunk(args):
+    dt, symbols, multipliers, market, out_dir = args
+    started = clock.perf_counter()
+    frame = grid_frame(dt, symbols, multipliers, market)
+    final = chunk_path(out_dir, dt.date())
+    partial = os.path.join(out_dir, f".{os.path.basename(final)}.{os.getpid()}.tmp")
+    frame.to_parquet(partial, index=False)
+    os.replace(partial, final)
+    return dt.date(), len(frame), clock.perf_counter() - started
+
+
+def run_grid(symbols, start, end, multipliers=(1.0,), out_dir="grid", report_time=None,
+             market=INDIAN_MARKET, workers=None, resume=True, progress=None):
+    """Compute the grid for every trading day from ``start`` to ``end`` (dates) into ``out_dir``.
+
+    ``report_time`` defaults to the market open. With ``resume`` the days
+    already on disk are skipped, provided ``out_dir`` was written with the
+    same parameters (``ValueError`` otherwise); without it every day is
+    recomputed, and day files written with other parameters are deleted
+    first. ``progress`` is called as
+    ``progress(done, total, day, rows, elapsed_seconds)`` after every chunk.
+    Returns a summary dict with the row count and throughput.
+    """
+    if report_time is None:
+        report_time = get_market_hours(market)[0]
+    os.makedirs(out_dir, exist_ok=True)
+    symbols = dict(symbols)
+    multipliers = [float(m) for m in multipliers]
+    _check_manifest(out_dir, {
+        "symbols": {str(symbol): float(cmp) for symbol, cmp in symbols.items()},
+        "multipliers": multipliers,
+        "market": market,
+        "report_time": report_time.isoformat(),
+        "rules": get_rules().key,
+    }, resume)
+
+    instants = list(iter_instants(datetime.combine(start, report_time), datetime.combine(end, report_time),
+                                  1, market))
+    pending = [dt for dt in instants if not (resume and os.path.exists(chunk_path(out_dir, dt.date())))]
+    tasks = [(dt, symbols, multipliers, market, out_dir) for dt in pending]
+
+    started = clock.perf_counter()
+    rows = 0
+    done = 0
+
+    def finished(result):
+        nonlocal rows, done
+        day, count, _ = result
+        rows += count
+        done += 1
+        if progress is not None:
+            progress(done, len(tasks), day, rows, clock.perf_counter() - started)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            finished(_run_chunk(task))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            for future in as_completed([pool.submit(_run_chunk, task) for task in tasks]):
+                finished(future.result())
+
+    elapsed = clock.perf_counter() - started
+    return {
+        "days": len(instants),
+        "computed": len(tasks),
+        "skipped": len(instants) - len(tasks),
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed else 0.0,
+        "reports_per_second": len(tasks) * len(symbols) * len(multipliers) / elapsed if elapsed else 0.0,
+    }
+
+
+def _print_progress(done, total, day, rows, elapsed):
+    rate = rows / elapsed if elapsed else 0.0
+    eta = elapsed / done * (total - done)
+    print(f"[{done}/{total}] {day:%Y-%m-%d}  {rows} rows  {rate:,.0f} rows/s  ETA {eta:.0f}s", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the report grid over symbols × days × multipliers.")
+    parser.add_argument("--symbols", required=True, help="CSV/Parquet file with symbol,cmp columns, or SYM:CMP,...")
+    parser.add_argument("--start", required=True, type=date.fromisoformat)
+    parser.add_argument("--end", required=True, type=date.fromisoformat)
+    parser.add_argument("--multipliers", type=float, nargs="+", default=[1.0])
+    parser.add_argument("--out", default="grid", help="output directory, one Parquet file per day")
+    parser.add_argument("--market", default=INDIAN_MARKET, choices=[INDIAN_MARKET, "Global Market"])
+    parser.add_argument("--report-time", default=None, help="HH:MM the reports are computed at (default: open)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--no-resume", action="store_true", help="recompute days already on disk")
+    args = parser.parse_args(argv)
+
+    symbols = load_symbols(args.symbols)
+    report_time = time.fromisoformat(args.report_time) if args.report_time else None
+    try:
+        summary = run_grid(symbols, args.start, args.end, args.multipliers, args.out, report_time, args.market,
+                           args.workers, resume=not args.no_resume, progress=_print_progress)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"{summary['computed']} days computed, {summary['skipped']} skipped, {summary['rows']} rows "
+          f"in {summary['seconds']:.1f}s ({summary['rows_per_second']:,.0f} rows/s, "
+          f"{summary['reports_per_second']:,.0f} reports/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Minute-resolution intraday grid: every planet at every minute of a session.
+
+:func:`generate_report` samples one instant. :func:`intraday_grid` evaluates
+positions, transit nature, nakshatra and Gann swing levels for all
+``planets x minutes`` of a trading day in one array pass, with each field
+stored as a ``(planets, minutes)`` array. :func:`downsample` thins a grid for
+charting while keeping the minutes at which a nature, nakshatra or level
+step changes, so the browser only receives a few hundred points per planet.
+"""
+
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+
+import numpy as np
+
+from .core import INDIAN_MARKET, NAKSHATRAS, PLANETS, TRANSIT_NATURES, get_important_planet
+from .ephemeris import positions_array
+from .levels import calculate_gann_levels_batch
+from .rules import get_rules
+from .trading_calendar import get_calendar
+from .transit import transit_nature_codes
+
+NAKSHATRA_SPAN = 360 / 27
+
+_LEVEL_FIELDS = ("degrees", "nature_codes", "nakshatra_codes",
+                 "swing_low", "swing_high", "degree_low", "degree_high")
+
+
+@dataclass(frozen=True)
+class IntradayGrid:
+    """Per-minute levels for one CMP; every array field is ``(planets, minutes)``.
+
+    ``minutes`` holds naive IST ``datetime64[m]`` values. ``nature_codes``
+    index :data:`~astro_gann.core.TRANSIT_NATURES` and ``nakshatra_codes``
+    index :data:`~astro_gann.core.NAKSHATRAS`.
+    """
+
+    cmp: float
+    market: str
+    swing_range_multiplier: float
+    important_planet: str
+    rule_version: str
+    planets: tuple
+    minutes: np.ndarray
+    degrees: np.ndarray
+    nature_codes: np.ndarray
+    nakshatra_codes: np.ndarray
+    swing_low: np.ndarray
+    swing_high: np.ndarray
+    degree_low: np.ndarray
+    degree_high: np.ndarray
+
+    def __len__(self):
+        return len(self.minutes)
+
+    def take(self, indices):
+        """Grid restricted to the minute ``indices``."""
+        indices = np.asarray(indices)
+        fields = {name: getattr(self, name)[:, indices] for name in _LEVEL_FIELDS}
+        return replace(self, minutes=self.minutes[indices], **fields)
+
+    def changes(self):
+        """Minute indices where any planet's nature, nakshatra or level step changes.
+
+        Swing levels move smoothly with the degree except where the
+        volatility factor can jump: sign boundaries and the 5°/25° cusps.
+        """
+        if len(self) < 2:
+            return np.empty(0, dtype=np.intp)
+        in_sign = self.degrees % 30
+        zone = (self.degrees // 30) * 3 + (in_sign >= 5) + (in_sign > 25)
+        changed = ((np.diff(self.nature_codes, axis=1) != 0)
+                   | (np.diff(self.nakshatra_codes, axis=1) != 0)
+                   | (np.diff(zone, axis=1) != 0))
+        return np.flatnonzero(changed.any(axis=0)) + 1
+
+    def to_frame(self):
+        """Long typed frame, one row per (planet, minute), planet-major."""
+        import pandas as pd
+
+        planets, minutes = len(self.planets), len(self)
+        return pd.DataFrame({
+            "time": np.tile(self.minutes.astype("datetime64[ns]"), planets),
+            "planet": pd.Categorical.from_codes(np.repeat(np.arange(planets), minutes),
+                                                categories=list(self.planets)),
+            "degree": self.degrees.ravel(),
+            "nakshatra": pd.Categorical.from_codes(self.nakshatra_codes.ravel(), categories=NAKSHATRAS),
+            "transit_nature": pd.Categorical.from_codes(self.nature_codes.ravel(), categories=TRANSIT_NATURES),
+            "swing_low": self.swing_low.ravel(),
+            "swing_high": self.swing_high.ravel(),
+            "degree_low": self.degree_low.ravel(),
+            "degree_high": self.degree_high.ravel(),
+            "important": np.repeat(np.array(self.planets) == self.important_planet, minutes),
+        })
+
+
+def session_minutes(day, market=INDIAN_MARKET, step_minutes=1):
+    """``datetime64[m]`` minutes from the open to the close of ``day``'s session."""
+    opens, closes = get_calendar()[market].session_minutes(day)
+    if opens < 0:
+        raise ValueError(f"{market} has no session on {day}")
+    midnight = np.datetime64(day, "m")
+    return midnight + np.arange(opens, closes + 1, step_minutes, dtype=np.int64).astype("timedelta64[m]")
+
+
+def grid_at(minutes, cmp, market=INDIAN_MARKET, swing_range_multiplier=1.0, planets=PLANETS, rules=None):
+    """Build an :class:`IntradayGrid` for arbitrary ``datetime64`` instants."""
+    rules = rules or get_rules()
+    minutes = np.asarray(minutes, dtype="datetime64[m]")
+    positions = positions_array(minutes, planets)  # (minutes, planets)
+    levels = calculate_gann_levels_batch(np.full(len(minutes), float(cmp)), positions, planets,
+                                         swing_range_multiplier, rules)
+    degrees = positions.T
+    first_day = minutes[0].astype("datetime64[D]").item() if len(minutes) else date.today()
+    return IntradayGrid(
+        cmp=float(cmp),
+        market=market,
+        swing_range_multiplier=swing_range_multiplier,
+        important_planet=get_important_planet(first_day, rules),
+        rule_version=rules.version,
+        planets=tuple(planets),
+        minutes=minutes,
+        degrees=degrees,
+        nature_codes=transit_nature_codes(positions, planets, rules).T.astype(np.int8),
+        nakshatra_codes=((degrees // NAKSHATRA_SPAN).astype(np.intp) % 27).astype(np.int8),
+        swing_low=levels.swing_low.T,
+        swing_high=levels.swing_high.T,
+        degree_low=levels.degree_low.T,
+        degree_high=levels.degree_high.T,
+    )
+
+
+def intraday_grid(day, cmp, market=INDIAN_MARKET, swing_range_multiplier=1.0, step_minutes=1, planets=PLANETS,
+                  rules=None):
+    """Every planet at every ``step_minutes`` of ``day``'s session (calendar hours).
+
+    Raises ``ValueError`` when the market is closed on ``day``.
+    """
+    if isinstance(day, datetime):
+        day = day.date()
+    return grid_at(session_minutes(day, market, step_minutes), cmp, market, swing_range_multiplier, planets, rules)
+
+
+def downsample(grid, max_points=240):
+    """Thin ``grid`` to about ``max_points`` minutes for display.
+
+    Evenly spaced minutes are kept together with both sides of every change
+    reported by :meth:`IntradayGrid.changes`, so nature bands and level steps
+    land on the right minute. The first and last minutes are always kept.
+    """
+    count = len(grid)
+    if count <= max_points:
+        return grid
+    changes = grid.changes()
+    edges = np.concatenate([changes - 1, changes])
+    even = np.linspace(0, count - 1, max(max_points - len(edges), 2)).round().astype(np.intp)
+    return grid.take(np.unique(np.concatenate([even, edges])))
+
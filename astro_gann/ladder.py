@@ -0,0 +1,183 @@
+"""Gann Square-of-Nine price ladders with sorted-array level queries.
+
+On the Square of Nine a price ``p`` sits at the angle ``(sqrt(p) mod 2) *
+180°``: one full turn adds 2 to the square root. A planet at longitude ``L``
+therefore marks the prices ``(2n + L / 180)²``, and its harmonics -- ``L``
+plus multiples of ``360° / harmonics`` -- add the intermediate levels. Taking
+``rotations`` turns either side of the CMP gives ``planets x harmonics x (2 *
+rotations + 1)`` support/resistance levels, held in one sorted array so
+every query is a ``searchsorted``.
+
+Levels are built from each planet's longitude rounded down to
+``degree_step``, so a :class:`LadderBook` can hand out the same ladder for
+every tick until a planet moves into the next degree bucket or the price
+leaves the ladder's range.
+"""
+
+import threading
+from typing import NamedTuple
+
+import numpy as np
+
+from .core import PLANETS
+
+
+class Level(NamedTuple):
+    price: float
+    planet: str
+    angle: float
+
+
+class PriceLadder:
+    """Sorted Square-of-Nine levels for a set of planet longitudes around a price."""
+
+    def __init__(self, cmp, degrees, planets=PLANETS, rotations=3, harmonics=8):
+        if rotations < 1:
+            raise ValueError("rotations must be at least 1")
+        degrees = np.asarray(degrees, dtype=np.float64)
+        self.cmp = float(cmp)
+        self.planets = tuple(planets)
+        self.degrees = degrees
+        self.rotations = rotations
+        self.harmonics = harmonics
+
+        offsets = np.arange(harmonics) * (360.0 / harmonics)  # (harmonics,)
+        turn = np.floor(np.sqrt(self.cmp) / 2.0)
+        turns = turn + np.arange(-rotations, rotations + 1)  # (turns,)
+        angles = (degrees[:, None] + offsets) % 360.0  # (planets, harmonics)
+        roots = 2.0 * turns[None, None, :] + angles[:, :, None] / 180.0
+        prices = roots ** 2
+
+        shape = prices.shape
+        planet_codes = np.broadcast_to(np.arange(len(self.planets))[:, None, None], shape)
+        harmonic_angles = np.broadcast_to(offsets[None, :, None], shape)
+        keep = (roots > 0).ravel()
+        order = np.argsort(prices.ravel()[keep], kind="stable")
+        self.prices = prices.ravel()[keep][order]
+        self.planet_codes = planet_codes.ravel()[keep][order].astype(np.int8)
+        self.angles = harmonic_angles.ravel()[keep][order]
+        # Prices with a full turn of levels on both sides answer exactly; near
+        # zero the ladder reaches all the way down, so the bound stops at 0.
+        self.low = (2.0 * max(0.0, turn - rotations + 1)) ** 2
+        self.high = (2.0 * (turn + rotations)) ** 2
+        self._by_planet = {}
+
+    def __len__(self):
+        return len(self.prices)
+
+    def covers(self, price):
+        return self.low <= price <= self.high
+
+    def _level(self, index):
+        return Level(float(self.prices[index]), self.planets[self.planet_codes[index]], float(self.angles[index]))
+
+    def nearest_below(self, price):
+        """Highest level strictly below ``price``, or ``None``."""
+        index = np.searchsorted(self.prices, price, side="left") - 1
+        return self._level(index) if index >= 0 else None
+
+    def nearest_above(self, price):
+        """Lowest level strictly above ``price``, or ``None``."""
+        index = np.searchsorted(self.prices, price, side="right")
+        return self._level(index) if index < len(self.prices) else None
+
+    def bracket(self, prices):
+        """Vectorized neighbours: ``(below, above)`` level prices for an array of prices (NaN at the ends)."""
+        prices = np.asarray(prices, dtype=np.float64)
+        padded = np.concatenate([[np.nan], self.prices, [np.nan]])
+        below = np.searchsorted(self.prices, prices, side="left")
+        above = np.searchsorted(self.prices, prices, side="right") + 1
+        return padded[below], padded[above]
+
+    def band(self, low, high):
+        """``slice`` of :attr:`prices` holding every level in ``[low, high]``."""
+        start = np.searchsorted(self.prices, low, side="left")
+        stop = np.searchsorted(self.prices, high, side="right")
+        return slice(int(start), int(stop))
+
+    def levels(self, low=None, high=None):
+        """Levels in ``[low, high]`` (default all) as a list of :class:`Level`."""
+        window = self.band(-np.inf if low is None else low, np.inf if high is None else high)
+        return [self._level(index) for index in range(window.start, window.stop)]
+
+    def for_planet(self, planet):
+        """Ladder of a single planet's levels, sharing this one's turns."""
+        ladder = self._by_planet.get(planet)
+        if ladder is None:
+            index = self.planets.index(planet)
+            ladder = PriceLadder(self.cmp, self.degrees[index:index + 1], (planet,), self.rotations, self.harmonics)
+            self._by_planet[planet] = ladder
+        return ladder
+
+    def to_frame(self, low=None, high=None):
+        """Levels in ``[low, high]`` as a frame with ``price``, ``planet`` and ``angle`` columns."""
+        import pandas as pd
+
+        window = self.band(-np.inf if low is None else low, np.inf if high is None else high)
+        return pd.DataFrame({
+            "price": self.prices[window],
+            "planet": pd.Categorical.from_codes(self.planet_codes[window], categories=list(self.planets)),
+            "angle": self.angles[window],
+        })
+
+
+def nearest_levels(prices, degrees, harmonics=8):
+    """Each planet's Square-of-Nine level closest to each price, without building ladders.
+
+    ``prices`` has shape ``(symbols,)`` and ``degrees`` ``(planets,)``. A
+    planet's harmonics are evenly spaced by ``2 / harmonics`` in square-root
+    space, so the neighbours of ``sqrt(price)`` follow from one ``floor``.
+    Returns ``(levels, angles)``, both ``(symbols, planets)``; ``angles`` is
+    the harmonic offset from the planet's longitude, as in :class:`Level`.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    degrees = np.asarray(degrees, dtype=np.float64)
+    step = 2.0 / harmonics
+    base = (degrees % (360.0 / harmonics)) / 180.0  # (planets,)
+    roots = np.sqrt(prices)[:, None]
+    below = base + np.floor((roots - base) / step) * step
+    above = below + step
+    use_above = (below <= 0) | ((above ** 2 - prices[:, None]) < (prices[:, None] - below ** 2))
+    nearest = np.where(use_above, above, below)
+    angles = np.round((nearest * 180.0 - degrees) % 360.0, 9) % 360.0
+    return nearest ** 2, angles
+
+
+class LadderBook:
+    """Reuses ladders across ticks; rebuilds only when a degree bucket or the price range changes.
+
+    Thread-safe; one book can serve many symbols (keyed by ``symbol``).
+    """
+
+    def __init__(self, planets=PLANETS, rotations=3, harmonics=8, degree_step=0.25):
+        self.planets = tuple(planets)
+        self.rotations = rotations
+        self.harmonics = harmonics
+        self.degree_step = degree_step
+        self._ladders = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    def buckets(self, degrees):
+        return tuple(np.floor(np.asarray(degrees, dtype=np.float64) / self.degree_step).astype(np.int64).tolist())
+
+    def get(self, price, degrees, symbol=None):
+        """Ladder for ``price`` and the planet longitudes ``degrees`` (a sequence or ``{planet: degree}``)."""
+        if isinstance(degrees, dict):
+            degrees = [degrees[planet] for planet in self.planets]
+        buckets = self.buckets(degrees)
+        with self._lock:
+            entry = self._ladders.get(symbol)
+            if entry is not None and entry[0] == buckets and entry[1].covers(price):
+                self.hits += 1
+                return entry[1]
+        ladder = PriceLadder(price, np.array(buckets, dtype=np.float64) * self.degree_step, self.planets,
+                             self.rotations, self.harmonics)
+        with self._lock:
+            self._ladders[symbol] = (buckets, ladder)
+            self.builds += 1
+        return ladder
+
+    def stats(self):
+        return {"symbols": len(self._ladders), "hits": self.hits, "builds": self.builds}
@@ -0,0 +1,61 @@
+"""Vectorized Gann swing levels for many symbols and planets at once."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .core import PLANETS
+from .rules import PLANET_IDS, get_rules
+
+
+class GannLevels(NamedTuple):
+    swing_low: np.ndarray
+    swing_high: np.ndarray
+    degree_low: np.ndarray
+    degree_high: np.ndarray
+
+
+def planet_multiplier_array(planets=PLANETS, rules=None):
+    multipliers = (rules or get_rules()).arrays().planet_multipliers
+    if tuple(planets) == PLANETS:
+        return multipliers
+    return multipliers[[PLANET_IDS[planet] for planet in planets]]
+
+
+def volatility_factors(planet_degrees, planets=PLANETS, rules=None):
+    """Per-planet volatility factor for degrees shaped ``(..., len(planets))``."""
+    rules = rules or get_rules()
+    planet_degrees = np.asarray(planet_degrees, dtype=np.float64)
+    zodiac_index = np.floor(planet_degrees / 30).astype(np.intp) % 12
+    degree_in_sign = planet_degrees % 30
+
+    factor = rules.arrays().zodiac_volatility[zodiac_index] * planet_multiplier_array(planets, rules)
+    cusp = (degree_in_sign < 5) | (degree_in_sign > 25)
+    return np.where(cusp, factor * 1.2, factor)
+
+
+def calculate_gann_levels_batch(cmps, planet_degrees, planets=PLANETS, swing_range_multiplier=1.0, rules=None):
+    """Array form of :func:`astro_gann.core.calculate_gann_levels`.
+
+    ``cmps`` has shape ``(symbols,)``; ``planet_degrees`` is either
+    ``(planets,)`` when every symbol shares one chart or ``(symbols, planets)``.
+    ``swing_range_multiplier`` is a scalar or a per-symbol ``(symbols,)``
+    array. Every returned array has shape ``(symbols, planets)``.
+    """
+    cmps = np.asarray(cmps, dtype=np.float64)
+    planet_degrees = np.asarray(planet_degrees, dtype=np.float64)
+    volatility_factor = volatility_factors(planet_degrees, planets, rules)
+
+    multiplier = np.asarray(swing_range_multiplier, dtype=np.float64)
+    if multiplier.ndim:
+        multiplier = multiplier[:, None]
+    range_percent = (0.01 * multiplier) * volatility_factor
+    range_size = cmps[:, None] * range_percent
+    swing_low = cmps[:, None] - range_size
+    swing_high = cmps[:, None] + range_size
+
+    degree_range = 3 * volatility_factor
+    degree_low = np.broadcast_to((planet_degrees - degree_range) % 360, swing_low.shape)
+    degree_high = np.broadcast_to((planet_degrees + degree_range) % 360, swing_low.shape)
+
+    return GannLevels(swing_low, swing_high, degree_low, degree_high)
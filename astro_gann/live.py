@@ -0,0 +1,277 @@
+"""Live CMP feed: ticks in, incrementally updated reports out at a bounded rate.
+
+A source is any async iterator of :class:`Tick`; :func:`csv_tail_source`
+follows a growing CSV file and :func:`socket_source` reads lines from a TCP
+socket, both as ``SYMBOL,PRICE[,ISO_TIME]`` or a JSON object with the same
+fields. :class:`LiveFeed` keeps one template report per session day --
+positions, nakshatra, timing windows and natures are computed once -- and
+only re-derives the CMP-dependent swing levels, for the symbols that ticked,
+when it publishes. Ticks arriving between publishes are coalesced, so the
+UI sees at most ``max_rate`` updates per second however fast the feed is::
+
+    feed = LiveFeed(csv_tail_source("ticks.csv"), datetime(2025, 3, 12, 11, 0))
+    feed.start()           # background thread running the event loop
+    feed.snapshot()        # {symbol: Report} as of the last publish
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+from .core import INDIAN_MARKET
+from .ephemeris import LOCAL_UTC_OFFSET
+from .ladder import LadderBook
+from .report import generate_report
+from .rules import get_rules
+
+logger = logging.getLogger("astro_gann.live")
+
+
+class Tick(NamedTuple):
+    symbol: str
+    price: float
+    time: Optional[datetime] = None
+
+
+def _local(dt):
+    """``dt`` as a naive IST datetime; offset-aware values are converted."""
+    if dt is None or dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone(LOCAL_UTC_OFFSET)).replace(tzinfo=None)
+
+
+def parse_tick(line):
+    """Parse one ``SYMBOL,PRICE[,ISO_TIME]`` or JSON line; ``None`` for headers and blanks.
+
+    Times with a UTC offset (or a trailing ``Z``) are converted to naive IST.
+    """
+    line = line.strip()
+    if not line:
+        return None
+    if line.startswith("{"):
+        data = json.loads(line)
+        symbol, price, stamp = data["symbol"], data["price"], data.get("time")
+    else:
+        parts = [part.strip() for part in line.split(",")]
+        if len(parts) < 2:
+            raise ValueError(f"expected SYMBOL,PRICE[,TIME], got {line!r}")
+        symbol, price = parts[0], parts[1]
+        stamp = parts[2] if len(parts) > 2 and parts[2] else None
+    try:
+        price = float(price)
+    except ValueError:
+        if str(price).strip().lower() in ("price", "cmp", "ltp", "last"):
+            return None  # CSV header
+        raise
+    return Tick(str(symbol), price, _local(datetime.fromisoformat(stamp)) if stamp else None)
+
+
+def _log_bad_line(line, exc):
+    logger.warning("skipping malformed tick line %r: %s", line, exc)
+
+
+def _parse_line(line, on_bad_line):
+    """:func:`parse_tick`, reporting a malformed line to ``on_bad_line`` instead of raising."""
+    try:
+        return parse_tick(line)
+    except (ValueError, KeyError, TypeError) as exc:  # json.JSONDecodeError is a ValueError
+        (on_bad_line or _log_bad_line)(line, exc)
+        return None
+
+
+async def csv_tail_source(path, poll_interval=0.2, from_start=False, on_bad_line=None):
+    """Yield ticks appended to ``path``, like ``tail -f``.
+
+    Starts at the end of the file unless ``from_start``; a truncated or
+    replaced file is followed from its beginning. Malformed lines are
+    skipped and passed to ``on_bad_line(line, exc)`` (default: logged).
+    """
+    position = 0 if from_start or not os.path.exists(path) else os.path.getsize(path)
+    partial = ""
+    while True:
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size < position:
+            position, partial = 0, ""
+        if size == position:
+            await asyncio.sleep(poll_interval)
+            continue
+        with open(path, encoding="utf-8") as fh:
+            fh.seek(position)
+            chunk = fh.read()
+            position = fh.tell()
+        lines = (partial + chunk).split("\n")
+        partial = lines.pop()
+        for line in lines:
+            tick = _parse_line(line, on_bad_line)
+            if tick is not None:
+                yield tick
+
+
+async def socket_source(host="127.0.0.1", port=9009, reconnect_delay=1.0, on_bad_line=None):
+    """Yield ticks from newline-delimited lines on a TCP connection, reconnecting on drop.
+
+    Malformed lines are skipped as in :func:`csv_tail_source`.
+    """
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(reconnect_delay)
+            continue
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                tick = _parse_line(line.decode("utf-8", errors="replace"), on_bad_line)
+                if tick is not None:
+                    yield tick
+        finally:
+            writer.close()
+        await asyncio.sleep(reconnect_delay)
+
+
+class LiveFeed:
+    """Consume a tick source and publish per-symbol reports at most ``max_rate`` times a second.
+
+    ``dt`` fixes the report instant (its time of day is reused on later days
+    if the feed runs past midnight); ticks without a time are taken to be
+    on ``dt``'s date. ``symbols`` optionally restricts which
+    symbols are tracked. ``on_update(changed)`` is called from the feed's
+    event loop with ``{symbol: Report}`` for the symbols that ticked. Each
+    published price is also placed on a Square-of-Nine ladder from
+    :attr:`ladders`, reused until the price leaves its range.
+    """
+
+    def __init__(self, source, dt, market=INDIAN_MARKET, swing_range_multiplier=1.0, symbols=None,
+                 max_rate=4.0, on_update=None):
+        self.source = source
+        self.dt = dt
+        self.market = market
+        self.swing_range_multiplier = swing_range_multiplier
+        self.symbols = set(symbols) if symbols is not None else None
+        self.max_rate = max_rate
+        self.on_update = on_update
+
+        self._templates = {}
+        self._pending = {}
+        self._reports = {}
+        self._brackets = {}
+        self.ladders = LadderBook()
+        self._lock = threading.Lock()
+        self._loop = None
+        self._task = None
+        self._thread = None
+        self.version = 0
+        self.ticks = 0
+        self.publishes = 0
+        self.recomputes = 0
+        self.error = None
+
+    def template(self, day, rules=None):
+        """Report for ``day`` at the session time, built once per rule set and reused for every tick."""
+        rules = rules or get_rules()
+        report = self._templates.get((day, rules.key))
+        if report is None:
+            dt = datetime.combine(day, self.dt.time())
+            report = generate_report(dt, 0.0, "", self.market, self.swing_range_multiplier, now=dt, rules=rules)
+            self._templates = {(day, rules.key): report}  # one session day at a time
+        return report
+
+    def update(self, tick):
+        """Record a tick; the levels are recomputed on the next :meth:`flush`."""
+        if self.symbols is not None and tick.symbol not in self.symbols:
+            return
+        with self._lock:
+            self._pending[tick.symbol] = tick
+            self.ticks += 1
+
+    def flush(self, now=None):
+        """Recompute the swing levels for every symbol that ticked since the last flush."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return {}
+        changed, brackets = {}, {}
+        rules = get_rules()
+        for symbol, tick in pending.items():
+            stamp = _local(tick.time) or datetime.combine(self.dt.date(), (now or datetime.now()).time())
+            template = self.template(stamp.date(), rules)
+            changed[symbol] = template.with_cmp(tick.price, symbol, rules).with_now(stamp)
+            ladder = self.ladders.get(tick.price, template.positions, symbol)
+            brackets[symbol] = (ladder.nearest_below(tick.price), ladder.nearest_above(tick.price))
+        with self._lock:
+            self._reports.update(changed)
+            self._brackets.update(brackets)
+            self.recomputes += len(changed)
+            self.publishes += 1
+            self.version += 1
+        if self.on_update is not None:
+            self.on_update(changed)
+        return changed
+
+    def snapshot(self):
+        """``{symbol: Report}`` as of the last publish."""
+        with self._lock:
+            return dict(self._reports)
+
+    def brackets(self):
+        """``{symbol: (support, resistance)}`` Square-of-Nine levels around the last price."""
+        with self._lock:
+            return dict(self._brackets)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "ticks": self.ticks,
+                "publishes": self.publishes,
+                "recomputes": self.recomputes,
+                "symbols": len(self._reports),
+                "version": self.version,
+                "running": self._thread is not None and self._thread.is_alive(),
+                "error": repr(self.error) if self.error else None,
+            }
+
+    async def run(self):
+        """Consume the source until it ends, publishing at most ``max_rate`` times a second."""
+        async def consume():
+            async for tick in self.source:
+                self.update(tick)
+
+        consumer = asyncio.ensure_future(consume())
+        try:
+            while not consumer.done():
+                await asyncio.wait([consumer], timeout=1.0 / self.max_rate)
+                self.flush()
+            consumer.result()
+        finally:
+            consumer.cancel()
+            self.flush()
+
+    def start(self):
+        """Run the feed on a daemon thread with its own event loop."""
+        def target():
+            self._loop = asyncio.new_event_loop()
+            self._task = self._loop.create_task(self.run())
+            try:
+                self._loop.run_until_complete(self._task)
+            except asyncio.CancelledError:
+                pass
+            except Exception as exc:  # surfaced through stats()
+                self.error = exc
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=target, name="astro-gann-live-feed", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        if self._loop is not None and self._task is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._task.cancel)
+        if self._thread is not None:
+            self._thread.join(timeout)
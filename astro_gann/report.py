@@ -0,0 +1,345 @@
+"""Typed report objects and the single-instant report generator.
+
+:meth:`Report.to_frame` returns a typed columnar frame (:data:`REPORT_SCHEMA`):
+float levels and degrees, ``datetime64`` window bounds, categorical planet,
+nakshatra and nature, boolean flags. :func:`format_report_frame` turns such a
+frame into the display layout (:data:`REPORT_COLUMNS`) at render time.
+"""
+
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import List, Optional
+
+from .core import (
+    INDIAN_MARKET,
+    NAKSHATRAS,
+    PLANETS,
+    TRANSIT_NATURES,
+    adjust_timing_to_market,
+    calculate_gann_levels,
+    calculate_moon_nodes_transit,
+    calculate_planet_aspects,
+    calculate_timing,
+    get_important_planet,
+    get_nakshatra,
+    get_planetary_positions,
+    get_transit_nature,
+)
+from .diagnostics import stage
+from .rules import get_rules
+
+REPORT_COLUMNS = (
+    "Symbol", "CMP", "Swing Low", "Swing High", "Degree Range", "Key Planet",
+    "Timing (IST)", "Transit Nature", "Important", "Current Transit",
+)
+
+# Column -> dtype of the typed report frame; "category:<name>" columns use
+# the fixed category lists in REPORT_CATEGORIES.
+REPORT_SCHEMA = {
+    "symbol": "category",
+    "cmp": "float64",
+    "planet": "category:planet",
+    "nakshatra": "category:nakshatra",
+    "degree": "float64",
+    "swing_low": "float64",
+    "swing_high": "float64",
+    "degree_low": "float64",
+    "degree_high": "float64",
+    "window_start": "datetime64[ns]",
+    "window_end": "datetime64[ns]",
+    "transit_nature": "category:transit_nature",
+    "important": "bool",
+    "current_transit": "bool",
+}
+
+REPORT_CATEGORIES = {
+    "planet": PLANETS,
+    "nakshatra": NAKSHATRAS,
+    "transit_nature": TRANSIT_NATURES,
+}
+
+
+@dataclass(frozen=True)
+class ReportRow:
+    symbol: str
+    cmp: float
+    planet: str
+    degree: float
+    swing_low: float
+    swing_high: float
+    degree_low: float
+    degree_high: float
+    start: datetime
+    end: datetime
+    transit_nature: str
+    important: bool
+    current_transit: bool
+    nakshatra: Optional[str] = None
+
+    @property
+    def planet_display(self):
+        if self.nakshatra is not None:
+            return f"{self.planet} in {self.nakshatra}"
+        return self.planet
+
+    def to_record(self):
+        """Return the row in the display layout used by the Streamlit table."""
+        return {
+            "Symbol": self.symbol,
+            "CMP": f"₹{self.cmp:.2f}",
+            "Swing Low": f"₹{self.swing_low:.2f}",
+            "Swing High": f"₹{self.swing_high:.2f}",
+            "Degree Range": f"{self.degree_low:.2f}°–{self.degree_high:.2f}°",
+            "Key Planet": self.planet_display,
+            "Timing (IST)": f"{self.start.strftime('%I:%M %p')} – {self.end.strftime('%I:%M %p')}",
+            "Transit Nature": self.transit_nature,
+            "Important": "Yes" if self.important else "No",
+            "Current Transit": "Yes" if self.current_transit else "No",
+        }
+
+    def to_dict(self):
+        """JSON-ready typed row: numbers stay numbers, times are ISO strings."""
+        return {
+            "planet": self.planet,
+            "nakshatra": self.nakshatra,
+            "degree": self.degree,
+            "swing_low": self.swing_low,
+            "swing_high": self.swing_high,
+            "degree_low": self.degree_low,
+            "degree_high": self.degree_high,
+            "window_start": self.start.isoformat() if self.start is not None else None,
+            "window_end": self.end.isoformat() if self.end is not None else None,
+            "transit_nature": self.transit_nature,
+            "important": self.important,
+            "current_transit": self.current_transit,
+        }
+
+
+@dataclass(frozen=True)
+class Report:
+    symbol: str
+    cmp: float
+    dt: datetime
+    market: str
+    swing_range_multiplier: float
+    important_planet: str
+    positions: dict
+    moon_rahu_aspects: list
+    moon_ketu_aspects: list
+    rows: List[ReportRow] = field(default_factory=list)
+    planet_aspects: list = field(default_factory=list)
+    rule_version: Optional[str] = None
+
+    @property
+    def date(self) -> date:
+        return self.dt.date()
+
+    def to_records(self):
+        return [row.to_record() for row in self.rows]
+
+    def to_dict(self):
+        """JSON-ready typed report, as served by :mod:`astro_gann.api`."""
+        def aspects(items):
+            return [{**item, "time": item["time"].isoformat()} for item in items]
+
+        def periods(items):
+            return [{**item, **{key: item[key].isoformat() for key in ("start", "end", "peak")}} for item in items]
+
+        return {
+            "symbol": self.symbol,
+            "cmp": self.cmp,
+            "time": self.dt.isoformat(),
+            "market": self.market,
+            "swing_range_multiplier": self.swing_range_multiplier,
+            "rule_version": self.rule_version,
+            "important_planet": self.important_planet,
+            "positions": dict(self.positions),
+            "moon_rahu_aspects": aspects(self.moon_rahu_aspects),
+            "moon_ketu_aspects": aspects(self.moon_ketu_aspects),
+            "planet_aspects": periods(self.planet_aspects),
+            "rows": [row.to_dict() for row in self.rows],
+        }
+
+    def with_now(self, now):
+        """Copy of the report with ``current_transit`` re-evaluated at ``now``."""
+        rows = [replace(row, current_transit=row.start <= now <= row.end) for row in self.rows]
+        return replace(self, rows=rows)
+
+    def with_cmp(self, cmp, symbol=None, rules=None):
+        """Copy of the report at a new price; only the swing levels are recomputed.
+
+        Positions, timing windows, natures and nakshatra do not depend on the
+        CMP and are carried over as-is. ``symbol`` optionally relabels it.
+        ``rules`` should be the rule set the report was built with (default:
+        the active one).
+        """
+        symbol = self.symbol if symbol is None else symbol
+        rules = rules or get_rules()
+        rows = []
+        for row in self.rows:
+            swing_low, swing_high, _, _ = calculate_gann_levels(
+                cmp, row.degree, row.planet, self.swing_range_multiplier, rules)
+            rows.append(replace(row, symbol=symbol, cmp=cmp, swing_low=swing_low, swing_high=swing_high))
+        return replace(self, symbol=symbol, cmp=cmp, rows=rows)
+
+    def to_frame(self):
+        """Typed frame with the :data:`REPORT_SCHEMA` columns, one row per planet."""
+        return report_frame(self.rows)
+
+    def to_arrow(self):
+        """The typed frame as a ``pyarrow.Table`` (needs pyarrow)."""
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(self.to_frame(), preserve_index=False)
+
+
+def generate_report(dt, cmp, symbol="Nifty", market=INDIAN_MARKET,
+                    swing_range_multiplier=1.0, now=None, positions=None, timer=None, rules=None):
+    """Build the per-planet Astro-Gann report for the instant ``dt``.
+
+    ``now`` decides which rows are flagged as the current transit; it defaults
+    to the wall-clock time on ``dt``'s date, as the Streamlit page always did.
+    ``positions`` lets callers reporting many symbols at one instant share a
+    single ephemeris lookup. ``timer`` is an optional
+    :class:`~astro_gann.diagnostics.StageTimer` to record each stage in.
+    Every rule lookup uses one :class:`~astro_gann.rules.RuleSet` snapshot
+    (``rules``, default the active set), recorded as ``rule_version``.
+    """
+    rules = rules or get_rules()
+    if positions is None:
+        with stage(timer, "positions"):
+            positions = get_planetary_positions(dt)
+    important_planet = get_important_planet(dt.date(), rules)
+    with stage(timer, "moon_nodes"):
+        moon_rahu_aspects, moon_ketu_aspects = calculate_moon_nodes_transit(dt)
+    with stage(timer, "planet_aspects"):
+        planet_aspects = calculate_planet_aspects(dt)
+
+    if now is None:
+        now = datetime.combine(dt.date(), datetime.now().time())
+
+    with stage(timer, "planet_loop"):
+        rows = _planet_rows(dt, cmp, symbol, market, swing_range_multiplier, now, positions, important_planet, rules)
+
+    return Report(
+        symbol=symbol,
+        cmp=cmp,
+        dt=dt,
+        market=market,
+        swing_range_multiplier=swing_range_multiplier,
+        important_planet=important_planet,
+        positions=positions,
+        moon_rahu_aspects=moon_rahu_aspects,
+        moon_ketu_aspects=moon_ketu_aspects,
+        rows=rows,
+        planet_aspects=planet_aspects,
+        rule_version=rules.version,
+    )
+
+
+def _planet_rows(dt, cmp, symbol, market, swing_range_multiplier, now, positions, important_planet, rules):
+    rows = []
+    for planet, degree in positions.items():
+        swing_low, swing_high, degree_low, degree_high = calculate_gann_levels(
+            cmp, degree, planet, swing_range_multiplier, rules)
+        start_time, end_time = calculate_timing(dt, planet, market, rules)
+        adj_start_time, adj_end_time = adjust_timing_to_market(start_time, end_time, market)
+
+        if market == INDIAN_MARKET and (adj_start_time is None or adj_end_time is None):
+            continue
+
+        rows.append(ReportRow(
+            symbol=symbol,
+            cmp=cmp,
+            planet=planet,
+            degree=degree,
+            swing_low=swing_low,
+            swing_high=swing_high,
+            degree_low=degree_low,
+            degree_high=degree_high,
+            start=adj_start_time,
+            end=adj_end_time,
+            transit_nature=get_transit_nature(planet, degree, rules),
+            important=planet == important_planet,
+            current_transit=adj_start_time <= now <= adj_end_time,
+            nakshatra=get_nakshatra(degree) if planet == "Moon" else None,
+        ))
+
+    return rows
+
+
+def report_frame(rows):
+    """Build the typed report frame from any iterable of :class:`ReportRow`."""
+    import pandas as pd
+
+    rows = list(rows)
+    data = {
+        "symbol": [row.symbol for row in rows],
+        "cmp": [row.cmp for row in rows],
+        "planet": [row.planet for row in rows],
+        "nakshatra": [row.nakshatra for row in rows],
+        "degree": [row.degree for row in rows],
+        "swing_low": [row.swing_low for row in rows],
+        "swing_high": [row.swing_high for row in rows],
+        "degree_low": [row.degree_low for row in rows],
+        "degree_high": [row.degree_high for row in rows],
+        "window_start": [row.start for row in rows],
+        "window_end": [row.end for row in rows],
+        "transit_nature": [row.transit_nature for row in rows],
+        "important": [row.important for row in rows],
+        "current_transit": [row.current_transit for row in rows],
+    }
+    frame = pd.DataFrame(data)
+    for column, dtype in REPORT_SCHEMA.items():
+        if dtype.startswith("category:"):
+            categories = REPORT_CATEGORIES[dtype.split(":", 1)[1]]
+            frame[column] = pd.Categorical(frame[column], categories=categories)
+        else:
+            frame[column] = frame[column].astype(dtype)
+    return frame
+
+
+def _format_unique(values, formatter):
+    """Apply ``formatter`` to each distinct value once and broadcast back.
+
+    Report columns repeat heavily (one CMP per symbol, one window per
+    planet), so formatting the uniques is much cheaper than every row.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(values)
+    return np.asarray(formatter(uniques), dtype=object)[codes]
+
+
+def _money(series):
+    return _format_unique(series, lambda values: [f"₹{value:.2f}" for value in values])
+
+
+def format_report_frame(frame):
+    """Render a typed report frame in the display layout of :data:`REPORT_COLUMNS`."""
+    import numpy as np
+    import pandas as pd
+
+    nakshatra = frame["nakshatra"].astype(object)
+    planet = frame["planet"].astype(str)
+    key_planet = np.where(nakshatra.notna(), planet + " in " + nakshatra.fillna("").astype(str), planet)
+    timing = _format_unique(
+        pd.MultiIndex.from_arrays([frame["window_start"], frame["window_end"]]),
+        lambda pairs: [f"{start:%I:%M %p} – {end:%I:%M %p}" for start, end in pairs])
+    degree_range = _format_unique(
+        pd.MultiIndex.from_arrays([frame["degree_low"], frame["degree_high"]]),
+        lambda pairs: [f"{low:.2f}°–{high:.2f}°" for low, high in pairs])
+
+    return pd.DataFrame({
+        "Symbol": frame["symbol"].astype(str).to_numpy(),
+        "CMP": _money(frame["cmp"]),
+        "Swing Low": _money(frame["swing_low"]),
+        "Swing High": _money(frame["swing_high"]),
+        "Degree Range": degree_range,
+        "Key Planet": key_planet,
+        "Timing (IST)": timing,
+        "Transit Nature": frame["transit_nature"].astype(str).to_numpy(),
+        "Important": np.where(frame["important"], "Yes", "No"),
+        "Current Transit": np.where(frame["current_transit"], "Yes", "No"),
+    }, columns=list(REPORT_COLUMNS))
@@ -0,0 +1,183 @@
+"""Compiled astro rule tables, loaded from a versioned config and swappable at runtime.
+
+The rules are read from a local JSON file (``data/astro_rules.json`` by
+default, or ``ASTRO_GANN_RULES`` / :func:`use_rules`)::
+
+    {"version": "2025.1",
+     "day_rulers": ["Moon", "Mars", ...],                   # Monday first
+     "favorable_degrees": {"Sun": [[0, 30], ...], ...},
+     "unfavorable_degrees": {"Sun": [[90, 120], ...], ...},
+     "zodiac_volatility": [1.2, 0.8, ...],                  # Aries first
+     "planet_multipliers": {"Sun": 1.0, ...},
+     "base_duration": {"Sun": 30, ...}}
+
+A :class:`RuleSet` compiles them once into tuples indexed by planet ID (the
+position in :data:`~astro_gann.core.PLANETS`), sign ID and weekday, plus
+NumPy copies for the array paths. The active rule set is a single module
+reference: :func:`reload_rules` builds and validates the new tables first
+and only then swaps the reference, so a lookup sees either the old rules or
+the new ones, never a mix, and a bad file leaves the old rules in place.
+Callers that need several lookups to agree (a whole report) take one
+:func:`get_rules` snapshot and pass it down.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import NamedTuple
+
+from .core import (
+    BASE_DURATION,
+    DAY_RULERS,
+    FAVORABLE_DEGREES,
+    PLANET_IDS,
+    PLANET_MULTIPLIERS,
+    PLANETS,
+    UNFAVORABLE_DEGREES,
+    ZODIAC_VOLATILITY,
+    compile_transit_table,
+)
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "data", "astro_rules.json")
+
+
+class RuleArrays(NamedTuple):
+    zodiac_volatility: "np.ndarray"  # (12,) float64
+    planet_multipliers: "np.ndarray"  # (planets,) float64
+    nature_codes: "np.ndarray"  # (planets, bins) int8
+    base_duration: "np.ndarray"  # (planets,) int64
+
+
+def _by_planet(mapping, name, cast):
+    missing = [planet for planet in PLANETS if planet not in mapping]
+    if missing:
+        raise ValueError(f"{name}: missing planets {missing}")
+    unknown = sorted(set(mapping) - set(PLANETS))
+    if unknown:
+        raise ValueError(f"{name}: unknown planets {unknown}")
+    return tuple(cast(mapping[planet]) for planet in PLANETS)
+
+
+class RuleSet:
+    """One immutable, compiled version of the astro rules."""
+
+    def __init__(self, version, day_rulers, favorable_degrees, unfavorable_degrees,
+                 zodiac_volatility, planet_multipliers, base_duration, path=None):
+        if len(day_rulers) != 7:
+            raise ValueError(f"day_rulers: expected 7 weekdays, got {len(day_rulers)}")
+        unknown = sorted(set(day_rulers) - set(PLANETS))
+        if unknown:
+            raise ValueError(f"day_rulers: unknown planets {unknown}")
+        if len(zodiac_volatility) != 12:
+            raise ValueError(f"zodiac_volatility: expected 12 signs, got {len(zodiac_volatility)}")
+        for name, rules in (("favorable_degrees", favorable_degrees), ("unfavorable_degrees", unfavorable_degrees)):
+            for planet, ranges in rules.items():
+                if planet not in PLANET_IDS:
+                    raise ValueError(f"{name}: unknown planet {planet!r}")
+                for start, end in ranges:
+                    if not 0 <= start < end <= 360:
+                        raise ValueError(f"{name}: bad range [{start}, {end}) for {planet}")
+                    # The compiled table has whole-degree bins
+                    if start != int(start) or end != int(end):
+                        raise ValueError(f"{name}: range [{start}, {end}) for {planet} is not in whole degrees")
+
+        self.version = str(version)
+        self.path = path
+        self.day_rulers = tuple(PLANET_IDS[planet] for planet in day_rulers)
+        self.transit_bin_width, table = compile_transit_table(favorable_degrees, unfavorable_degrees)
+        self.transit_codes = tuple(table[planet] for planet in PLANETS)
+        self.zodiac_volatility = tuple(float(value) for value in zodiac_volatility)
+        self.planet_multipliers = _by_planet(planet_multipliers, "planet_multipliers", float)
+        self.base_duration = _by_planet(base_duration, "base_duration", int)
+        # Content hash of the compiled tables: caches key on it, so editing the
+        # file without bumping "version" still invalidates cached reports.
+        self.fingerprint = hashlib.sha1(repr((
+            self.day_rulers, self.transit_bin_width, self.transit_codes,
+            self.zodiac_volatility, self.planet_multipliers, self.base_duration,
+        )).encode()).hexdigest()[:12]
+        self._arrays = None
+
+    def __repr__(self):
+        return f"RuleSet(version={self.version!r}, fingerprint={self.fingerprint!r})"
+
+    @property
+    def key(self):
+        """Cache-key component identifying these exact tables."""
+        return f"{self.version}@{self.fingerprint}"
+
+    def important_planet(self, weekday):
+        return PLANETS[self.day_rulers[weekday]]
+
+    def arrays(self):
+        """The tables as :class:`RuleArrays` of NumPy arrays (built on first use)."""
+        if self._arrays is None:
+            import numpy as np
+
+            self._arrays = RuleArrays(
+                zodiac_volatility=np.array(self.zodiac_volatility, dtype=np.float64),
+                planet_multipliers=np.array(self.planet_multipliers, dtype=np.float64),
+                nature_codes=np.array(self.transit_codes, dtype=np.int8),
+                base_duration=np.array(self.base_duration, dtype=np.int64),
+            )
+        return self._arrays
+
+    @classmethod
+    def builtin(cls):
+        """The rule literals shipped in :mod:`astro_gann.core`."""
+        return cls("builtin", [DAY_RULERS[day] for day in range(7)], FAVORABLE_DEGREES, UNFAVORABLE_DEGREES,
+                   [ZODIAC_VOLATILITY[sign] for sign in range(12)], PLANET_MULTIPLIERS, BASE_DURATION)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        try:
+            return cls(
+                data["version"],
+                data["day_rulers"],
+                data["favorable_degrees"],
+                data["unfavorable_degrees"],
+                data["zodiac_volatility"],
+                data["planet_multipliers"],
+                data["base_duration"],
+                path=path,
+            )
+        except KeyError as exc:
+            raise ValueError(f"{path}: missing key {exc}") from exc
+        except ValueError as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+
+
+_rules = None
+_path = None
+_lock = threading.Lock()
+
+
+def use_rules(path):
+    """Compile the rules at ``path`` and make them active (``None``: builtin rules).
+
+    The previous rules stay active if loading or validation fails.
+    """
+    global _rules, _path
+    with _lock:
+        rules = RuleSet.load(path) if path is not None else RuleSet.builtin()
+        _rules, _path = rules, path
+    return rules
+
+
+def reload_rules():
+    """Re-read the active rules file and swap it in atomically."""
+    if _rules is None:
+        return get_rules()
+    return use_rules(_path)
+
+
+def get_rules():
+    """The active :class:`RuleSet`, loading ``ASTRO_GANN_RULES`` or the bundled file on first use."""
+    rules = _rules
+    if rules is None:
+        path = os.environ.get("ASTRO_GANN_RULES") or DEFAULT_RULES_PATH
+        rules = use_rules(path if os.path.exists(path) else None)
+    return rules
@@ -0,0 +1,189 @@
+"""Watchlist screener: rank a whole universe of symbols by proximity to active levels.
+
+A watchlist is a CSV/Parquet file with ``symbol`` and ``cmp`` columns and an
+optional ``volatility`` column, which scales that symbol's swing range (1.0
+when absent). :func:`screen` takes the planets whose timing window is active
+at ``now``, computes every symbol's swing levels for them in one array pass
+and measures how far each CMP is from the nearest Square-of-Nine level of
+each planet, in units of that planet's swing range. The score weights that
+proximity by transit nature and by the day's important planet, and each
+symbol is ranked on its best planet::
+
+    watchlist = load_watchlist("watchlist.csv")
+    screen(watchlist, datetime(2025, 3, 12, 11, 0), top=25)
+
+Positions, timing windows and natures are computed once per call, so a
+universe of thousands of symbols rescreens in milliseconds::
+
+    python -m astro_gann.screener --watchlist watchlist.csv --top 25 --every 60
+"""
+
+import argparse
+import os
+import time as clock
+from datetime import datetime
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .core import (
+    INDIAN_MARKET,
+    TRANSIT_NATURES,
+    adjust_timing_to_market,
+    calculate_timing,
+    get_important_planet,
+    get_planetary_positions,
+)
+from .ladder import nearest_levels
+from .levels import calculate_gann_levels_batch
+from .report import REPORT_CATEGORIES
+from .rules import get_rules
+from .transit import transit_nature_codes
+
+# Score weight of a level by the nature of its planet's transit: a
+# Favorable transit ranks first, a Negative one still above a Neutral one
+# (a level under an active, directional transit is the likelier to react).
+# Pass ``nature_weights`` to screen() to rank differently.
+NATURE_WEIGHTS = {"Neutral": 1.0, "Favorable": 1.5, "Negative": 1.25}
+IMPORTANT_WEIGHT = 1.5
+
+SCREEN_COLUMNS = ("rank", "symbol", "cmp", "volatility", "planet", "transit_nature", "important", "level",
+                  "angle", "distance", "distance_pct", "swing_low", "swing_high", "window_end", "score")
+
+
+class Watchlist(NamedTuple):
+    symbols: np.ndarray  # (symbols,) object
+    cmps: np.ndarray  # (symbols,) float64
+    volatility: np.ndarray  # (symbols,) float64
+
+    def __len__(self):
+        return len(self.symbols)
+
+
+def load_watchlist(source, name=None):
+    """Read a :class:`Watchlist` from a CSV/Parquet path or file object.
+
+    ``name`` picks the format for file objects without a ``name`` (Parquet
+    for ``.parquet``/``.pq``, CSV otherwise).
+    """
+    name = str(name or getattr(source, "name", source))
+    frame = pd.read_parquet(source) if name.endswith((".parquet", ".pq")) else pd.read_csv(source)
+    frame.columns = [str(c).strip().lower() for c in frame.columns]
+    missing = {"symbol", "cmp"} - set(frame.columns)
+    if missing:
+        raise ValueError(f"{name}: missing columns {sorted(missing)}")
+    cmps = pd.to_numeric(frame["cmp"], errors="coerce").to_numpy(dtype=np.float64)
+    bad = ~(cmps > 0)
+    if bad.any():
+        raise ValueError(f"{name}: invalid cmp for {frame['symbol'][bad].astype(str).tolist()[:5]}")
+    if "volatility" in frame.columns:
+        volatility = pd.to_numeric(frame["volatility"], errors="coerce").to_numpy(dtype=np.float64)
+        volatility = np.where(volatility > 0, volatility, 1.0)
+    else:
+        volatility = np.ones(len(cmps))
+    return Watchlist(frame["symbol"].astype(str).to_numpy(dtype=object), cmps, volatility)
+
+
+def active_planets(dt, market=INDIAN_MARKET, now=None, rules=None, positions=None):
+    """``(planets, window_ends)`` for the planets whose timing window contains ``now`` (default ``dt``).
+
+    ``positions`` are the planet longitudes at ``dt``, when already known.
+    """
+    now = dt if now is None else now
+    positions = get_planetary_positions(dt) if positions is None else positions
+    planets, ends = [], []
+    for planet in positions:
+        start, end = adjust_timing_to_market(*calculate_timing(dt, planet, market, rules), market)
+        if start is not None and start <= now <= end:
+            planets.append(planet)
+            ends.append(end)
+    return planets, ends
+
+
+def screen(watchlist, dt, market=INDIAN_MARKET, swing_range_multiplier=1.0, now=None, top=None, rules=None,
+           nature_weights=NATURE_WEIGHTS, important_weight=IMPORTANT_WEIGHT, harmonics=8):
+    """Rank ``watchlist`` at ``dt``; one row per symbol, best score first.
+
+    ``distance`` is how far the CMP is from the planet's nearest
+    Square-of-Nine level, and the score is ``weight / (1 + distance /
+    swing range)``, so a level inside the swing band scores above half its
+    weight. The frame is empty when no timing window is active at ``now``.
+    """
+    rules = rules or get_rules()
+    positions = get_planetary_positions(dt)
+    planets, ends = active_planets(dt, market, now, rules, positions)
+    if not planets or not len(watchlist):
+        return pd.DataFrame({column: [] for column in SCREEN_COLUMNS})
+
+    degrees = np.array([positions[planet] for planet in planets], dtype=np.float64)
+    cmps = watchlist.cmps
+    levels = calculate_gann_levels_batch(cmps, degrees, planets, swing_range_multiplier * watchlist.volatility,
+                                         rules)
+    ladder_levels, angles = nearest_levels(cmps, degrees, harmonics)
+    distance = np.abs(ladder_levels - cmps[:, None])
+    swing_range = levels.swing_high - cmps[:, None]
+
+    nature_codes = transit_nature_codes(degrees, planets, rules)
+    important = np.array(planets) == get_important_planet(dt.date(), rules)
+    weight = np.array([nature_weights[nature] for nature in TRANSIT_NATURES])[nature_codes]
+    weight = np.where(important, weight * important_weight, weight)
+    scores = weight / (1.0 + distance / swing_range)  # (symbols, planets)
+
+    best = scores.argmax(axis=1)
+    rows = np.arange(len(cmps))
+    order = np.argsort(-scores[rows, best], kind="stable")
+    if top is not None:
+        order = order[:top]
+    best = best[order]
+
+    def pick(values):
+        return values[order, best]
+
+    planet_arr = np.array(planets, dtype=object)
+    return pd.DataFrame({
+        "rank": np.arange(1, len(order) + 1),
+        "symbol": watchlist.symbols[order],
+        "cmp": cmps[order],
+        "volatility": watchlist.volatility[order],
+        "planet": pd.Categorical(planet_arr[best], categories=REPORT_CATEGORIES["planet"]),
+        "transit_nature": pd.Categorical.from_codes(nature_codes[best], categories=TRANSIT_NATURES),
+        "important": important[best],
+        "level": pick(ladder_levels),
+        "angle": pick(angles),
+        "distance": pick(distance),
+        "distance_pct": pick(distance) / cmps[order] * 100,
+        "swing_low": pick(levels.swing_low),
+        "swing_high": pick(levels.swing_high),
+        "window_end": np.array(ends, dtype="datetime64[ns]")[best],
+        "score": pick(scores),
+    }, columns=list(SCREEN_COLUMNS))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank a watchlist by proximity to the active planets' levels.")
+    parser.add_argument("--watchlist", required=True, help="CSV/Parquet file with symbol,cmp[,volatility] columns")
+    parser.add_argument("--at", type=datetime.fromisoformat, default=None, help="IST time to screen (default: now)")
+    parser.add_argument("--market", default=INDIAN_MARKET, choices=[INDIAN_MARKET, "Global Market"])
+    parser.add_argument("--multiplier", type=float, default=1.0, help="swing range multiplier")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--every", type=float, default=None, help="rescreen every N seconds (needs no --at)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.watchlist):
+        parser.error(f"{args.watchlist}: no such file")
+    watchlist = load_watchlist(args.watchlist)
+    while True:
+        dt = args.at or datetime.now().replace(second=0, microsecond=0)
+        started = clock.perf_counter()
+        result = screen(watchlist, dt, args.market, args.multiplier, top=args.top)
+        elapsed = clock.perf_counter() - started
+        print(f"{dt:%Y-%m-%d %H:%M}  {len(watchlist)} symbols screened in {elapsed * 1000:.1f} ms")
+        print(result.to_string(index=False) if len(result) else "no active timing windows")
+        if args.every is None or args.at is not None:
+            break
+        clock.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
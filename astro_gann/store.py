@@ -0,0 +1,304 @@
+"""Indexed SQLite history of generated reports.
+
+Every report row is one row of ``report_rows``, keyed on (symbol, planet,
+report time, CMP, market, multiplier, rule version): regenerating a report
+replaces its rows instead of duplicating them, while the same instant at a
+new CMP is kept as history alongside the old one. A store skips reports it
+has already added (same key), so callers can add on every regeneration and
+only real changes are written. ``current_transit`` is not part of the key:
+a stored row keeps the flag as evaluated when the report was first added,
+not as of any later ``now``. Secondary indexes cover the report time,
+planet + nature, nature, and the ``important`` and ``current_transit``
+flags (partial indexes), so questions such as "all Favorable Mars windows
+for Nifty in 2025" are index range scans::
+
+    store = ReportStore("reports.sqlite")
+    store.add(reports)                       # batched executemany, one transaction
+    store.query(symbol="Nifty", planet="Mars", transit_nature="Favorable",
+                start=date(2025, 1, 1), end=date(2025, 12, 31))
+
+Times are stored as ``YYYY-MM-DD HH:MM:SS`` text (naive IST), which sorts
+and range-compares like the datetimes themselves. :func:`store_from_env`
+opens the store in the user's data directory unless ``ASTRO_GANN_STORE``
+names another path (or ``off``).
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
+
+from .report import REPORT_CATEGORIES
+
+
+def _user_data_dir():
+    """Per-user data directory: ``%LOCALAPPDATA%`` on Windows, ``$XDG_DATA_HOME`` or ``~/.local/share`` elsewhere."""
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        return os.environ["LOCALAPPDATA"]
+    return os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+
+
+# Outside the source tree, so the app and the API never write into a checkout
+DEFAULT_STORE_PATH = os.path.join(_user_data_dir(), "astro_gann", "reports.sqlite")
+
+STORE_COLUMNS = ("report_time", "symbol", "cmp", "market", "swing_range_multiplier", "rule_version", "planet",
+                 "nakshatra", "degree", "swing_low", "swing_high", "degree_low", "degree_high", "window_start",
+                 "window_end", "transit_nature", "important", "current_transit")
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS report_rows (
+        report_time TEXT NOT NULL,
+        symbol TEXT NOT NULL,
+        cmp REAL NOT NULL,
+        market TEXT NOT NULL,
+        swing_range_multiplier REAL NOT NULL,
+        rule_version TEXT NOT NULL,
+        planet TEXT NOT NULL,
+        nakshatra TEXT,
+        degree REAL,
+        swing_low REAL,
+        swing_high REAL,
+        degree_low REAL,
+        degree_high REAL,
+        window_start TEXT,
+        window_end TEXT,
+        transit_nature TEXT NOT NULL,
+        important INTEGER NOT NULL,
+        current_transit INTEGER NOT NULL,
+        PRIMARY KEY (symbol, planet, report_time, cmp, market, swing_range_multiplier, rule_version)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS ix_report_rows_time ON report_rows (report_time)",
+    "CREATE INDEX IF NOT EXISTS ix_report_rows_planet ON report_rows (planet, transit_nature, report_time)",
+    "CREATE INDEX IF NOT EXISTS ix_report_rows_nature ON report_rows (transit_nature, report_time)",
+    "CREATE INDEX IF NOT EXISTS ix_report_rows_important ON report_rows (report_time) WHERE important = 1",
+    "CREATE INDEX IF NOT EXISTS ix_report_rows_current ON report_rows (report_time) WHERE current_transit = 1",
+)
+
+# ``PRAGMA user_version`` of the current layout; version 1 keyed rows without the CMP
+STORE_VERSION = 2
+
+_CODES = {name: {value: code for code, value in enumerate(values)} for name, values in REPORT_CATEGORIES.items()}
+
+_INSERT = (f"INSERT OR REPLACE INTO report_rows ({', '.join(STORE_COLUMNS)}) "
+           f"VALUES ({', '.join('?' * len(STORE_COLUMNS))})")
+
+
+@lru_cache(maxsize=4096)
+def _text(dt):
+    # Cached: the reports of one instant share their timing windows
+    return dt.isoformat(sep=" ", timespec="seconds") if dt is not None else None
+
+
+def _report_key(report):
+    return (report.symbol, _text(report.dt), report.cmp, report.market, report.swing_range_multiplier,
+            report.rule_version or "")
+
+
+def _report_rows(report):
+    report_time = _text(report.dt)
+    rule_version = report.rule_version or ""
+    for row in report.rows:
+        yield (report_time, report.symbol, row.cmp, report.market, report.swing_range_multiplier, rule_version,
+               row.planet, row.nakshatra, row.degree, row.swing_low, row.swing_high, row.degree_low,
+               row.degree_high, _text(row.start), _text(row.end), row.transit_nature, int(row.important),
+               int(row.current_transit))
+
+
+def _as_bound(value):
+    """``value`` as a date or datetime; ISO strings without a time are dates."""
+    if isinstance(value, (date, datetime)):
+        return value
+    value = str(value)
+    return date.fromisoformat(value) if len(value) == 10 else datetime.fromisoformat(value)
+
+
+def _values(value):
+    return [value] if isinstance(value, str) else list(value)
+
+
+class ReportStore:
+    """Thread-safe SQLite store of report rows.
+
+    ``batch_size`` rows go to each ``executemany`` call; one :meth:`add` is
+    one transaction however many batches it takes. The keys of the last
+    ``recent_reports`` added reports are remembered so re-adding them (the
+    same report regenerated for a later ``now``) is skipped without a write.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, batch_size=5000, recent_reports=4096):
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            exists = self._db.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'report_rows'").fetchone()
+            if exists and version < STORE_VERSION:
+                # Older key: rebuild the table under the current one, keeping the rows
+                self._db.execute("ALTER TABLE report_rows RENAME TO report_rows_old")
+                for name, in self._db.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'report_rows_old' "
+                        "AND sql IS NOT NULL").fetchall():
+                    self._db.execute(f"DROP INDEX {name}")
+            for statement in _SCHEMA:
+                self._db.execute(statement)
+            if exists and version < STORE_VERSION:
+                self._db.execute(f"INSERT OR REPLACE INTO report_rows ({', '.join(STORE_COLUMNS)}) "
+                                 f"SELECT {', '.join(STORE_COLUMNS)} FROM report_rows_old")
+                self._db.execute("DROP TABLE report_rows_old")
+            self._db.execute(f"PRAGMA user_version = {STORE_VERSION}")
+        self.recent_reports = recent_reports
+        self._recent = OrderedDict()
+        self.inserted = 0
+        self.skipped = 0
+
+    def add(self, reports):
+        """Insert (or replace) every row of ``reports``; returns the row count.
+
+        Reports this store added recently are skipped and not counted, so
+        their stored ``current_transit`` flags stay as first inserted.
+        """
+        count = 0
+        added = {}
+        with self._lock:
+            with self._db:
+                batch = []
+                for report in reports:
+                    key = _report_key(report)
+                    if key in self._recent or key in added:
+                        if key in self._recent:
+                            self._recent.move_to_end(key)
+                        self.skipped += 1
+                        continue
+                    added[key] = None
+                    batch.extend(_report_rows(report))
+                    if len(batch) >= self.batch_size:
+                        self._db.executemany(_INSERT, batch)
+                        count += len(batch)
+                        batch = []
+                if batch:
+                    self._db.executemany(_INSERT, batch)
+                    count += len(batch)
+            # Remembered only once the transaction has committed
+            self._recent.update(added)
+            while len(self._recent) > self.recent_reports:
+                self._recent.popitem(last=False)
+            self.inserted += count
+        return count
+
+    def _where(self, start=None, end=None, symbol=None, planet=None, transit_nature=None, important=None,
+               current_transit=None, market=None, rule_version=None):
+        clauses, params = [], []
+        for column, value in (("symbol", symbol), ("planet", planet), ("transit_nature", transit_nature),
+                              ("market", market), ("rule_version", rule_version)):
+            if value is not None:
+                values = _values(value)
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        if start is not None:
+            start = _as_bound(start)
+            clauses.append("report_time >= ?")
+            params.append(_text(start) if isinstance(start, datetime) else start.isoformat())
+        if end is not None:
+            end = _as_bound(end)
+            # A date covers its whole day; a datetime is an inclusive bound
+            if isinstance(end, datetime):
+                clauses.append("report_time <= ?")
+                params.append(_text(end))
+            else:
+                clauses.append("report_time < ?")
+                params.append((end + timedelta(days=1)).isoformat())
+        # Literal flags so SQLite can pick the partial indexes
+        for column, value in (("important", important), ("current_transit", current_transit)):
+            if value is not None:
+                clauses.append(f"{column} = {int(bool(value))}")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, start=None, end=None, symbol=None, planet=None, transit_nature=None, important=None,
+              current_transit=None, market=None, rule_version=None, limit=None):
+        """Typed frame (:data:`STORE_COLUMNS`) of the matching rows, oldest first.
+
+        ``start``/``end`` are dates (inclusive whole days), datetimes or ISO
+        strings; ``symbol``, ``planet``, ``transit_nature``, ``market`` and
+        ``rule_version`` take one value or a list; the flags filter when not
+        ``None``.
+        """
+        import pandas as pd
+
+        where, params = self._where(start, end, symbol, planet, transit_nature, important, current_transit,
+                                    market, rule_version)
+        sql = f"SELECT {', '.join(STORE_COLUMNS)} FROM report_rows{where} ORDER BY report_time, symbol, planet"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+
+        # Columns are typed straight from the fetched tuples: one constructor
+        # call is much cheaper than converting an object frame column by column
+        columns = dict(zip(STORE_COLUMNS, zip(*rows))) if rows else dict.fromkeys(STORE_COLUMNS, ())
+        data = {}
+        for column, values in columns.items():
+            if column in _CODES:
+                codes = _CODES[column]
+                data[column] = pd.Categorical.from_codes(
+                    np.fromiter((codes.get(value, -1) for value in values), dtype=np.int8, count=len(values)),
+                    categories=REPORT_CATEGORIES[column])
+            elif column in ("symbol", "market", "rule_version"):
+                data[column] = pd.Categorical(values)
+            elif column in ("report_time", "window_start", "window_end"):
+                data[column] = np.array(values, dtype="datetime64[s]").astype("datetime64[ns]")
+            elif column in ("important", "current_transit"):
+                data[column] = np.array(values, dtype=bool)
+            else:
+                data[column] = np.array(values, dtype=np.float64)
+        return pd.DataFrame(data, columns=list(STORE_COLUMNS))
+
+    def count(self, **filters):
+        """Number of rows matching the :meth:`query` filters."""
+        where, params = self._where(**filters)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM report_rows{where}", params).fetchone()[0]
+
+    def symbols(self):
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT DISTINCT symbol FROM report_rows ORDER BY symbol")]
+
+    def stats(self):
+        with self._lock:
+            rows, first, last = self._db.execute(
+                "SELECT COUNT(*), MIN(report_time), MAX(report_time) FROM report_rows").fetchone()
+        return {
+            "path": self.path,
+            "rows": rows,
+            "first": first,
+            "last": last,
+            "inserted": self.inserted,
+            "skipped": self.skipped,
+            "bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+        }
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM report_rows")
+            self._recent.clear()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def store_from_env():
+    """The store at ``ASTRO_GANN_STORE`` (default :data:`DEFAULT_STORE_PATH`); ``None`` when it is ``off``."""
+    path = os.environ.get("ASTRO_GANN_STORE") or DEFAULT_STORE_PATH
+    if path.lower() == "off":
+        return None
+    return ReportStore(path)
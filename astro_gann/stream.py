@@ -0,0 +1,127 @@
+"""Date-range report generation that streams one chunk per trading day.
+
+Chunks are typed report frames (see :data:`~astro_gann.report.REPORT_SCHEMA`)
+for columnar sinks such as Parquet, or display-formatted frames for CSV,
+Excel and PDF.
+"""
+
+from datetime import timedelta
+
+from .core import INDIAN_MARKET, get_planetary_positions, is_trading_day
+from .report import REPORT_COLUMNS, format_report_frame, generate_report, report_frame
+
+RANGE_COLUMNS = ("Date",) + REPORT_COLUMNS
+
+
+def _as_step(step):
+    if isinstance(step, timedelta):
+        return step
+    return timedelta(days=step)
+
+
+def iter_instants(start, end, step=1, market=INDIAN_MARKET):
+    """Yield each ``start + k * step`` up to ``end`` that falls on a trading day."""
+    step = _as_step(step)
+    if step <= timedelta(0):
+        raise ValueError("step must be positive")
+    dt = start
+    while dt <= end:
+        if is_trading_day(dt.date(), market):
+            yield dt
+        dt += step
+
+
+def iter_reports(start, end, symbols, step=1, market=INDIAN_MARKET,
+                 swing_range_multiplier=1.0, now=None):
+    """Yield ``(dt, [Report, ...])`` for every trading instant in the range.
+
+    ``start``/``end`` are datetimes (the time of day is the report instant),
+    ``symbols`` maps symbol to CMP and ``step`` is a day count or timedelta.
+    Only one instant's reports are alive at a time, so memory stays flat no
+    matter how long the range is.
+    """
+    symbols = dict(symbols)
+    for dt in iter_instants(start, end, step, market):
+        positions = get_planetary_positions(dt)
+        yield dt, [
+            generate_report(dt, cmp, symbol, market, swing_range_multiplier, now=now, positions=positions)
+            for symbol, cmp in symbols.items()
+        ]
+
+
+def iter_report_frames(start, end, symbols, step=1, market=INDIAN_MARKET,
+                       swing_range_multiplier=1.0, now=None, display=True, store=None):
+    """Like :func:`iter_reports` but yields one DataFrame per instant.
+
+    With ``display`` the frames use :data:`RANGE_COLUMNS` (formatted strings
+    behind a ``Date`` column); otherwise they are typed report frames with a
+    ``report_time`` column in front. Each instant's reports are also added
+    to ``store`` (a :class:`~astro_gann.store.ReportStore`) when given.
+    """
+    for dt, reports in iter_reports(start, end, symbols, step, market, swing_range_multiplier, now):
+        if store is not None:
+            store.add(reports)
+        frame = report_frame(row for report in reports for row in report.rows)
+        if display:
+            frame = format_report_frame(frame)
+            frame.insert(0, "Date", dt.strftime("%Y-%m-%d"))
+        else:
+            frame.insert(0, "report_time", dt)
+            frame["report_time"] = frame["report_time"].astype("datetime64[ns]")
+        yield frame
+
+
+def write_csv(frames, path_or_buffer):
+    """Append each frame to a CSV file as it arrives; returns the row count."""
+    if isinstance(path_or_buffer, str):
+        with open(path_or_buffer, "w", newline="", encoding="utf-8") as fh:
+            return write_csv(frames, fh)
+
+    rows = 0
+    header = True
+    for frame in frames:
+        frame.to_csv(path_or_buffer, index=False, header=header)
+        header = False
+        rows += len(frame)
+    return rows
+
+
+def write_parquet(frames, path):
+    """Write each frame as its own Parquet row group; returns the row count.
+
+    Needs ``pyarrow``, which is only imported when this function is called.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow") from exc
+
+    rows = 0
+    writer = None
+    try:
+        for frame in frames:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(frame)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def parse_symbols(text):
+    """Parse ``"Nifty:24574, BankNifty:52000"`` (commas or newlines) into ``{symbol: cmp}``."""
+    symbols = {}
+    for item in text.replace("\n", ",").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        symbol, sep, cmp = item.partition(":")
+        if not sep:
+            raise ValueError(f"expected SYMBOL:CMP, got {item!r}")
+        symbols[symbol.strip()] = float(cmp)
+    return symbols
+
@@ -0,0 +1,112 @@
+"""Row highlight rules shared by the Streamlit table and the file exports.
+
+:func:`highlight_rows` is the per-row ``Styler.apply`` callback; for large
+frames :func:`style_frame` computes the whole style matrix at once from the
+flag columns and :func:`frame_page` slices out one page to render.
+"""
+
+# Checked in this order; the first matching category colours the row.
+HIGHLIGHT_CATEGORIES = ("important_current", "current", "important", "favorable", "negative")
+
+HIGHLIGHTS = {
+    "important_current": {"background": "#ff9800", "border": "#f44336", "border_side": "box", "bold": True},
+    "current": {"background": "#ffeb3b", "border": "#ff9800", "border_side": "box", "bold": False},
+    "important": {"background": "#4caf50", "border": None, "border_side": None, "bold": True},
+    "favorable": {"background": "#c8e6c9", "border": "#4caf50", "border_side": "left", "bold": False},
+    "negative": {"background": "#ffcdd2", "border": "#f44336", "border_side": "left", "bold": False},
+}
+
+
+def _css(spec):
+    parts = [f"background-color: {spec['background']};"]
+    if spec["bold"]:
+        parts.append("font-weight: bold;")
+    if spec["border_side"] == "box":
+        parts.append(f"border: 2px solid {spec['border']};")
+    elif spec["border_side"] == "left":
+        parts.append(f"border-left: 4px solid {spec['border']};")
+    return " ".join(parts)
+
+
+HIGHLIGHT_CSS = {category: _css(spec) for category, spec in HIGHLIGHTS.items()}
+
+
+def highlight_category(important, current_transit, transit_nature):
+    """Name of the highlight for a row, or ``None`` for an unstyled row."""
+    if important and current_transit:
+        return "important_current"
+    if current_transit:
+        return "current"
+    if important:
+        return "important"
+    if transit_nature == "Favorable":
+        return "favorable"
+    if transit_nature == "Negative":
+        return "negative"
+    return None
+
+
+def row_category(row):
+    """:func:`highlight_category` for a display-layout row (``"Yes"``/``"No"`` flags)."""
+    return highlight_category(row["Important"] == "Yes", row["Current Transit"] == "Yes", row["Transit Nature"])
+
+
+def highlight_rows(row):
+    """``Styler.apply(axis=1)`` callback colouring a whole row by its category."""
+    category = row_category(row)
+    return [HIGHLIGHT_CSS[category] if category else ""] * len(row)
+
+
+def _flag(column):
+    if column.dtype == bool:
+        return column.to_numpy()
+    return (column == "Yes").to_numpy()
+
+
+def row_categories(frame):
+    """Vectorized :func:`highlight_category`: index into ``HIGHLIGHT_CATEGORIES`` per row, -1 if unstyled.
+
+    The flag columns may hold booleans or ``"Yes"``/``"No"`` strings.
+    """
+    import numpy as np
+
+    important = _flag(frame["Important"])
+    current = _flag(frame["Current Transit"])
+    nature = frame["Transit Nature"].to_numpy()
+    conditions = [
+        important & current,
+        current,
+        important,
+        nature == "Favorable",
+        nature == "Negative",
+    ]
+    return np.select(conditions, range(len(HIGHLIGHT_CATEGORIES)), default=-1).astype(np.int8)
+
+
+# Indexed by row_categories(); the trailing "" is picked up by -1.
+_CSS_BY_CODE = tuple(HIGHLIGHT_CSS[category] for category in HIGHLIGHT_CATEGORIES) + ("",)
+
+
+def style_matrix(frame):
+    """CSS for every cell of ``frame``, for ``Styler.apply(style_matrix, axis=None)``."""
+    import numpy as np
+    import pandas as pd
+
+    css = np.array(_CSS_BY_CODE, dtype=object)[row_categories(frame)]
+    cells = np.broadcast_to(css[:, None], (len(frame), len(frame.columns)))
+    return pd.DataFrame(cells, index=frame.index, columns=frame.columns)
+
+
+def style_frame(frame):
+    """``frame.style`` with the highlights applied in one vectorized pass."""
+    return frame.style.apply(style_matrix, axis=None)
+
+
+def page_count(frame, page_size):
+    return max(1, -(-len(frame) // page_size))
+
+
+def frame_page(frame, page, page_size):
+    """Rows of the 1-based ``page``; only this slice needs to be styled and sent to the browser."""
+    start = (page - 1) * page_size
+    return frame.iloc[start:start + page_size]
@@ -0,0 +1,226 @@
+"""Trading-calendar index: per-market sessions, exchange holidays and special sessions.
+
+The calendar is read from a local JSON file (``data/trading_calendar.json``
+by default, or ``ASTRO_GANN_CALENDAR`` / :func:`use_calendar`)::
+
+    {"version": "...", "markets": {"Indian Market": {
+        "open": "09:15", "close": "15:15", "weekend": [5, 6], "clip_windows": true,
+        "holidays": {"2025-03-14": "Holi", ...},
+        "special_sessions": {"2025-10-21": {"name": "Muhurat Trading", "open": "13:45", "close": "14:45"}}}}}
+
+A special session overrides a holiday or weekend on the same date and may
+omit ``open``/``close`` to use the regular hours. For every year the file
+mentions, each market's session open/close minute is precomputed per day,
+so day and minute checks are a list lookup; dates outside those years fall
+back to the weekend rule and regular hours. :meth:`MarketCalendar.clip`
+is the array form of :func:`~astro_gann.core.adjust_timing_to_market`.
+"""
+
+import json
+import os
+from array import array
+from datetime import date, time, timedelta
+
+from .core import INDIAN_MARKET, MARKET_HOURS
+
+DEFAULT_CALENDAR_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                     "data", "trading_calendar.json")
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_CLOSED = -1
+
+
+def _parse_time(value):
+    return value if isinstance(value, time) else time.fromisoformat(value)
+
+
+def _minute(value):
+    return value.hour * 60 + value.minute
+
+
+class MarketCalendar:
+    """Sessions of one market, indexed by day."""
+
+    def __init__(self, name, open, close, weekend=(), clip_windows=True, holidays=None, special_sessions=None):
+        self.name = name
+        self.open = _parse_time(open)
+        self.close = _parse_time(close)
+        self.weekend = frozenset(weekend)
+        self.clip_windows = clip_windows
+        self.holidays = {date.fromisoformat(str(day)): label for day, label in (holidays or {}).items()}
+        self.special_sessions = {}
+        for day, spec in (special_sessions or {}).items():
+            self.special_sessions[date.fromisoformat(str(day))] = (
+                spec.get("name", "Special Session"),
+                _parse_time(spec.get("open", self.open)),
+                _parse_time(spec.get("close", self.close)),
+            )
+
+        listed = list(self.holidays) + list(self.special_sessions)
+        self._first = date(min(listed).year, 1, 1) if listed else None
+        last = date(max(listed).year, 12, 31) if listed else None
+        self._base = self._first.toordinal() if listed else 0
+        self._opens = array("h")
+        self._closes = array("h")
+        day = self._first
+        while listed and day <= last:
+            opens, closes = self._session_minutes_uncached(day)
+            self._opens.append(opens)
+            self._closes.append(closes)
+            day += timedelta(days=1)
+        self._arrays = None
+
+    def _session_minutes_uncached(self, day):
+        special = self.special_sessions.get(day)
+        if special is not None:
+            return _minute(special[1]), _minute(special[2])
+        if day in self.holidays or day.weekday() in self.weekend:
+            return _CLOSED, _CLOSED
+        return _minute(self.open), _minute(self.close)
+
+    def session_minutes(self, day):
+        """``(open, close)`` minutes after midnight for ``day``, or ``(-1, -1)`` when closed."""
+        index = day.toordinal() - self._base
+        if 0 <= index < len(self._opens):
+            return self._opens[index], self._closes[index]
+        if day.weekday() in self.weekend:
+            return _CLOSED, _CLOSED
+        return _minute(self.open), _minute(self.close)
+
+    def session(self, day):
+        """``(open, close)`` times for ``day``, or ``None`` when the market is closed."""
+        opens, closes = self.session_minutes(day)
+        if opens == _CLOSED:
+            return None
+        return time(opens // 60, opens % 60), time(closes // 60, closes % 60)
+
+    def is_trading_day(self, day):
+        return self.session_minutes(day)[0] != _CLOSED
+
+    def is_trading_minute(self, dt):
+        opens, closes = self.session_minutes(dt.date())
+        return opens != _CLOSED and opens <= dt.hour * 60 + dt.minute <= closes
+
+    def holiday_name(self, day):
+        """Why ``day`` is closed (holiday name or ``"Weekend"``), ``None`` if it trades."""
+        if self.is_trading_day(day):
+            return None
+        return self.holidays.get(day, "Weekend")
+
+    def special_session_name(self, day):
+        special = self.special_sessions.get(day)
+        return special[0] if special is not None else None
+
+    def session_arrays(self, days):
+        """Vectorized :meth:`session_minutes` for a ``datetime64[D]``-compatible array."""
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = (np.frombuffer(self._opens, dtype=np.int16).astype(np.int32),
+                            np.frombuffer(self._closes, dtype=np.int16).astype(np.int32))
+        opens_table, closes_table = self._arrays
+        epoch_days = np.asarray(days, dtype="datetime64[D]").astype(np.int64)
+        index = epoch_days - (self._base - _EPOCH_ORDINAL)
+        inside = (index >= 0) & (index < len(opens_table))
+
+        weekday = (epoch_days + 3) % 7  # 1970-01-01 was a Thursday
+        closed = np.isin(weekday, list(self.weekend))
+        opens = np.where(closed, _CLOSED, _minute(self.open))
+        closes = np.where(closed, _CLOSED, _minute(self.close))
+        if inside.any():
+            safe = np.where(inside, index, 0)
+            opens = np.where(inside, opens_table[safe], opens)
+            closes = np.where(inside, closes_table[safe], closes)
+        return opens, closes
+
+    def clip(self, starts, ends):
+        """Clip timing windows to their sessions in one pass.
+
+        ``starts``/``ends`` are ``datetime64`` arrays. As in
+        :func:`~astro_gann.core.adjust_timing_to_market`, the start is moved
+        up to its day's open and the end back to its day's close; windows
+        that end up empty, or fall on a closed day, become ``NaT``. Markets
+        with ``clip_windows`` off are returned unchanged.
+        """
+        import numpy as np
+
+        starts = np.asarray(starts, dtype="datetime64[ns]")
+        ends = np.asarray(ends, dtype="datetime64[ns]")
+        if not self.clip_windows:
+            return starts, ends
+        start_days = starts.astype("datetime64[D]")
+        end_days = ends.astype("datetime64[D]")
+        opens, _ = self.session_arrays(start_days)
+        _, closes = self.session_arrays(end_days)
+        minute = np.timedelta64(1, "m")
+        clipped_starts = np.maximum(starts, start_days + opens * minute)
+        clipped_ends = np.minimum(ends, end_days + closes * minute)
+        empty = (opens == _CLOSED) | (closes == _CLOSED) | ~(clipped_starts < clipped_ends)
+        nat = np.datetime64("NaT", "ns")
+        return np.where(empty, nat, clipped_starts), np.where(empty, nat, clipped_ends)
+
+
+class TradingCalendar:
+    """All markets' :class:`MarketCalendar` objects plus the file's version tag."""
+
+    def __init__(self, markets, version=None, path=None):
+        self.markets = dict(markets)
+        self.version = version
+        self.path = path
+
+    @classmethod
+    def from_market_hours(cls):
+        """Regular hours only, with the Saturday/Sunday rule for the Indian market."""
+        return cls({
+            name: MarketCalendar(name, open_, close, weekend=(5, 6) if name == INDIAN_MARKET else (),
+                                 clip_windows=name == INDIAN_MARKET)
+            for name, (open_, close) in MARKET_HOURS.items()
+        }, version="builtin")
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        markets = {name: MarketCalendar(name, **spec) for name, spec in data["markets"].items()}
+        fallback = cls.from_market_hours().markets
+        for name, market in fallback.items():
+            markets.setdefault(name, market)
+        return cls(markets, version=data.get("version"), path=path)
+
+    def __getitem__(self, market):
+        return self.markets[market]
+
+    def is_trading_day(self, day, market):
+        return self.markets[market].is_trading_day(day)
+
+    def is_trading_minute(self, dt, market):
+        return self.markets[market].is_trading_minute(dt)
+
+    def session(self, day, market):
+        return self.markets[market].session(day)
+
+    def clip(self, starts, ends, market):
+        return self.markets[market].clip(starts, ends)
+
+
+_calendar = None
+
+
+def use_calendar(path):
+    """Load the calendar at ``path`` for every lookup (``None``: regular hours, no holidays)."""
+    global _calendar
+    _calendar = TradingCalendar.load(path) if path is not None else TradingCalendar.from_market_hours()
+    return _calendar
+
+
+def get_calendar():
+    """The active calendar, loading ``ASTRO_GANN_CALENDAR`` or the bundled file on first use."""
+    if _calendar is None:
+        path = os.environ.get("ASTRO_GANN_CALENDAR") or DEFAULT_CALENDAR_PATH
+        use_calendar(path if os.path.exists(path) else None)
+    return _calendar
+
+
+def clip_to_sessions(starts, ends, market):
+    """Vectorized :func:`~astro_gann.core.adjust_timing_to_market` against the active calendar."""
+    return get_calendar().clip(starts, ends, market)
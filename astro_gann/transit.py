@@ -0,0 +1,46 @@
+"""Array classification of transit nature from the compiled rule table.
+
+Ranges are half-open ``[start, end)`` and degrees are taken modulo 360, so
+boundaries resolve the same way for scalars and arrays:
+
+>>> from astro_gann.transit import transit_natures
+>>> transit_natures([0.0, 29.999, 30.0, 330.0, 360.0], "Sun").tolist()
+['Favorable', 'Favorable', 'Neutral', 'Negative', 'Favorable']
+>>> transit_natures([[120.0, 120.0]], ("Sun", "Moon")).tolist()
+[['Favorable', 'Negative']]
+"""
+
+import numpy as np
+
+from .core import PLANETS, TRANSIT_NATURES
+from .rules import PLANET_IDS, get_rules
+
+NATURE_LABELS = np.array(TRANSIT_NATURES)
+PLANET_INDEX = PLANET_IDS
+
+
+def _planet_rows(planets):
+    if isinstance(planets, str):
+        return PLANET_INDEX[planets]
+    return np.array([PLANET_INDEX[planet] for planet in planets], dtype=np.intp)
+
+
+def transit_nature_codes(degrees, planets=PLANETS, rules=None):
+    """Nature codes (indices into ``TRANSIT_NATURES``) for ``degrees``.
+
+    ``planets`` is a single planet name, classifying every element of
+    ``degrees`` for that planet, or a sequence of names matching the last
+    axis of ``degrees`` -- e.g. a ``(minutes, planets)`` position grid.
+    The ``(planets, bins)`` code table comes from ``rules`` (default: the
+    active :class:`~astro_gann.rules.RuleSet`).
+    """
+    rules = rules or get_rules()
+    nature_codes = rules.arrays().nature_codes
+    degrees = np.asarray(degrees, dtype=np.float64)
+    bins = (np.mod(degrees, 360.0) // rules.transit_bin_width).astype(np.intp) % nature_codes.shape[1]
+    return nature_codes[_planet_rows(planets), bins]
+
+
+def transit_natures(degrees, planets=PLANETS, rules=None):
+    """Like :func:`transit_nature_codes` but returns the nature labels."""
+    return NATURE_LABELS[transit_nature_codes(degrees, planets, rules)]
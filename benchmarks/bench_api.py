@@ -0,0 +1,152 @@
+"""Open-loop load test of the HTTP API: p50/p99 latency at a fixed request rate.
+
+Starts ``python -m astro_gann.api`` in a subprocess, then sends ``GET
+/report`` requests on a fixed schedule (``--rate`` per second) over a pool
+of keep-alive connections. Latency is measured from each request's
+scheduled send time, so queueing behind a slow response counts against the
+server rather than being hidden. Requests are drawn from ``--keys``
+distinct (date, symbol, CMP) combinations, so a realistic share of them hit
+the result cache or coalesce with an identical in-flight request. A
+``--warmup`` phase at the same rate runs first and is reported separately,
+since every engine entry (positions, Moon nodes; ~5 ms each) is a miss on a
+cold server.
+
+Run from the repository root::
+
+    python benchmarks/bench_api.py --rate 300 --duration 10 --keys 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Connection:
+    """Minimal HTTP/1.1 keep-alive client, enough for JSON GETs."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def get(self, path):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\n\r\n".encode())
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split()[1])
+        headers = dict(line.split(": ", 1) for line in lines[1:] if ": " in line)
+        body = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        return status, body
+
+
+async def wait_healthy(host, port, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            status, _ = await Connection(host, port).get("/health")
+            if status == 200:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("server did not come up")
+
+
+def request_paths(keys, seed=0):
+    rng = np.random.default_rng(seed)
+    days = [date(2025, 1, 1) + timedelta(days=int(d)) for d in rng.integers(0, 365, keys)]
+    cmps = rng.uniform(100, 50000, keys).round(2)
+    return [f"/report?date={day}&time=11:00&symbol=S{i % 500}&cmp={cmp}&now={day}T11:30"
+            for i, (day, cmp) in enumerate(zip(days, cmps))]
+
+
+async def load(host, port, paths, rate, duration, connections, seed=1):
+    rng = np.random.default_rng(seed)
+    pool = asyncio.Queue()
+    for _ in range(connections):
+        pool.put_nowait(Connection(host, port))
+    latencies, errors = [], 0
+    total = int(rate * duration)
+    picks = rng.integers(0, len(paths), total)
+
+    async def one(path, scheduled):
+        nonlocal errors
+        connection = await pool.get()
+        try:
+            status, _ = await connection.get(path)
+            if status != 200:
+                errors += 1
+        except (OSError, asyncio.IncompleteReadError):
+            errors += 1
+            connection = Connection(host, port)
+        finally:
+            pool.put_nowait(connection)
+        latencies.append(time.perf_counter() - scheduled)
+
+    start = time.perf_counter()
+    tasks = []
+    for i, pick in enumerate(picks):
+        scheduled = start + i / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(one(paths[pick], scheduled)))
+    await asyncio.gather(*tasks)
+    return latencies, errors, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=300.0, help="requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of measured load")
+    parser.add_argument("--warmup", type=float, default=5.0, help="seconds of load before measuring")
+    parser.add_argument("--keys", type=int, default=2000, help="distinct requests to draw from")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    host = "127.0.0.1"
+    server = subprocess.Popen([sys.executable, "-m", "astro_gann.api", "--host", host, "--port", str(args.port)],
+                              cwd=ROOT)
+    try:
+        asyncio.run(wait_healthy(host, args.port))
+        paths = request_paths(args.keys)
+        phases = []
+        for name, seconds, seed in (("warmup", args.warmup, 1), ("measured", args.duration, 2)):
+            if seconds <= 0:
+                continue
+            phases.append((name, *asyncio.run(
+                load(host, args.port, paths, args.rate, seconds, args.connections, seed))))
+        status, body = asyncio.run(Connection(host, args.port).get("/stats"))
+        stats = json.loads(body)
+    finally:
+        server.terminate()
+        server.wait()
+
+    failed = 0
+    for name, latencies, errors, elapsed in phases:
+        ms = np.array(latencies) * 1e3
+        failed += errors
+        print(f"{name}: {len(ms)} requests in {elapsed:.1f}s ({len(ms) / elapsed:.0f} req/s, "
+              f"target {args.rate:g}), {errors} errors")
+        print(f"  latency p50 {np.percentile(ms, 50):.2f} ms  p90 {np.percentile(ms, 90):.2f} ms  "
+              f"p99 {np.percentile(ms, 99):.2f} ms  max {ms.max():.2f} ms  mean {statistics.fmean(ms):.2f} ms")
+    print(f"server: {stats['computed']} computed, {stats['result_hits']} result-cache hits, "
+          f"{stats['coalesced']} coalesced, engine cache hit rate {stats['engine_cache']['hit_rate']:.0%}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""End-to-end backtest throughput on synthetic minute bars.
+
+Writes random-walk minute OHLC for each symbol to Parquet in a temporary
+directory, then times :func:`astro_gann.backtest.run_backtest` over them.
+Run from the repository root::
+
+    python benchmarks/bench_backtest.py --symbols 50 --years 10 --workers 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astro_gann.backtest import hit_rates, run_backtest  # noqa: E402
+
+
+def synthetic_minutes(symbol, years, seed):
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2015-01-01", periods=int(years * 250))
+    minutes = pd.timedelta_range("09:15:00", "15:29:00", freq="1min")
+    stamps = (days.values[:, None] + minutes.values[None, :]).ravel()
+    close = 1000 * np.exp(np.cumsum(rng.normal(0, 0.0008, len(stamps))))
+    spread = np.abs(rng.normal(0, 0.0005, len(stamps))) * close
+    return pd.DataFrame({
+        "symbol": symbol,
+        "timestamp": stamps,
+        "open": np.r_[close[0], close[:-1]],
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=4)
+    parser.add_argument("--years", type=float, default=2)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.symbols):
+            path = os.path.join(tmp, f"SYM{i}.parquet")
+            synthetic_minutes(f"SYM{i}", args.years, i).to_parquet(path, index=False)
+            paths.append(path)
+        bars = args.symbols * int(args.years * 250) * 375
+
+        start = time.perf_counter()
+        results = run_backtest(paths, workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+    print(f"{args.symbols} symbols x {args.years:g} years = {bars:,} minute bars, {len(results):,} result rows")
+    print(f"backtest    : {elapsed:.2f} s ({bars / elapsed:,.0f} bars/s, workers={args.workers or os.cpu_count()})")
+    print(hit_rates(results, "transit_nature").round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
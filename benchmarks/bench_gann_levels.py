@@ -0,0 +1,63 @@
+"""Throughput of the batch Gann level engine against the per-scalar loop.
+
+Run from the repository root::
+
+    python benchmarks/bench_gann_levels.py --symbols 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astro_gann.core import PLANETS, calculate_gann_levels  # noqa: E402
+from astro_gann.levels import calculate_gann_levels_batch  # noqa: E402
+
+
+def scalar_loop(cmps, degrees, multiplier):
+    out = np.empty((len(cmps), len(PLANETS), 4))
+    for i, cmp in enumerate(cmps):
+        for j, planet in enumerate(PLANETS):
+            out[i, j] = calculate_gann_levels(cmp, degrees[i, j], planet, multiplier)
+    return out
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--multiplier", type=float, default=1.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    cmps = rng.uniform(50, 50000, args.symbols)
+    degrees = rng.uniform(0, 360, (args.symbols, len(PLANETS)))
+    cells = args.symbols * len(PLANETS)
+
+    loop_time, expected = best_of(lambda: scalar_loop(cmps, degrees, args.multiplier), max(1, args.repeat // 2))
+    batch_time, levels = best_of(
+        lambda: calculate_gann_levels_batch(cmps, degrees, swing_range_multiplier=args.multiplier), args.repeat)
+
+    np.testing.assert_allclose(np.stack(levels, axis=-1), expected, rtol=1e-12)
+
+    print(f"{args.symbols} symbols x {len(PLANETS)} planets = {cells} levels")
+    print(f"scalar loop : {loop_time * 1e3:9.2f} ms  ({cells / loop_time:,.0f} levels/s)")
+    print(f"batch       : {batch_time * 1e3:9.2f} ms  ({cells / batch_time:,.0f} levels/s)")
+    print(f"speedup     : {loop_time / batch_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Per-tick cost of the live feed against regenerating the full report.
+
+A tick only moves the CMP, so :class:`~astro_gann.live.LiveFeed` reuses the
+session template (positions, nakshatra, timing windows) and recomputes the
+swing levels alone. The second half replays a burst of ticks through the
+feed to show how many are coalesced into each publish.
+
+Run from the repository root::
+
+    python benchmarks/bench_live.py --ticks 20000 --symbols 50 --rate 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astro_gann.live import LiveFeed, Tick  # noqa: E402
+from astro_gann.report import generate_report  # noqa: E402
+
+SESSION = datetime(2025, 3, 12, 11, 0)
+
+
+async def replay(ticks, duration, burst=100):
+    """Yield ``ticks`` in bursts spread evenly over ``duration`` seconds."""
+    pause = duration / max(len(ticks) // burst, 1)
+    for i, tick in enumerate(ticks, 1):
+        yield tick
+        if i % burst == 0:
+            await asyncio.sleep(pause)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=4.0, help="max UI updates per second")
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds to spread the replay over")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    prices = 24574.0 + rng.normal(0, 20, args.ticks).cumsum()
+    ticks = [Tick(f"S{i % args.symbols}", float(price), SESSION) for i, price in enumerate(prices)]
+
+    sample = ticks[:2000]
+    start = time.perf_counter()
+    for tick in sample:
+        generate_report(SESSION, tick.price, tick.symbol, now=tick.time)
+    full = (time.perf_counter() - start) / len(sample)
+
+    feed = LiveFeed(iter(()), SESSION)
+    template = feed.template(SESSION.date())
+    start = time.perf_counter()
+    for tick in sample:
+        template.with_cmp(tick.price, tick.symbol).with_now(tick.time)
+    incremental = (time.perf_counter() - start) / len(sample)
+    print(f"full report per tick   {full * 1e6:>9.1f} us")
+    print(f"levels-only per tick   {incremental * 1e6:>9.1f} us  ({full / incremental:.0f}x faster)")
+
+    feed = LiveFeed(replay(ticks, args.duration), SESSION, max_rate=args.rate)
+    start = time.perf_counter()
+    asyncio.run(feed.run())
+    elapsed = time.perf_counter() - start
+    stats = feed.stats()
+    print(f"replayed {stats['ticks']} ticks in {elapsed:.2f}s: {stats['publishes']} UI updates "
+          f"({stats['publishes'] / elapsed:.1f}/s, cap {args.rate:g}/s), {stats['recomputes']} symbol recomputes "
+          f"({stats['ticks'] / max(stats['recomputes'], 1):.1f} ticks coalesced each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Size, time and peak memory of the streaming PDF export over many trading days.
+
+Run from the repository root::
+
+    python benchmarks/bench_pdf_export.py --days 250
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import reportlab.platypus  # noqa: F401  (import cost excluded from the measurement)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astro_gann.export import write_pdf  # noqa: E402
+from astro_gann.stream import iter_instants, iter_report_frames  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=250, help="trading days to export")
+    parser.add_argument("--symbols", type=int, default=1)
+    parser.add_argument("--start", default="2025-01-01T11:00")
+    args = parser.parse_args()
+
+    start = datetime.fromisoformat(args.start)
+    instants = list(iter_instants(start, start.replace(year=start.year + 2)))[:args.days]
+    end = instants[-1]
+    symbols = {f"SYM{i}": float(v) for i, v in enumerate(np.linspace(100, 50000, args.symbols))}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "report.pdf")
+        began = time.perf_counter()
+        rows = write_pdf(iter_report_frames(start, end, symbols), path)
+        elapsed = time.perf_counter() - began
+        size = os.path.getsize(path)
+
+        tracemalloc.start()
+        write_pdf(iter_report_frames(start, end, symbols), path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    print(f"{len(instants)} trading days x {args.symbols} symbol(s) = {rows} rows")
+    print(f"time        : {elapsed:8.2f} s")
+    print(f"file size   : {size / 1024:8.1f} KiB ({size / max(rows, 1):.0f} B/row)")
+    print(f"peak memory : {peak / 1024 / 1024:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Streamlit rerun latency after each kind of widget change, measured headlessly.
+
+Drives ``app.py`` through ``streamlit.testing.v1.AppTest``: generate the
+single-day report once, then change one widget at a time and time the
+rerun. Cosmetic widgets (font size, table colour) only re-render from the
+cached stages; a CMP change recomputes the levels, frames and exports; a
+time change also reruns the engine (positions, Moon nodes, timing). The
+baseline is the same cosmetic rerun with every cache cleared first, which
+is what each widget change cost before the stages were cached.
+
+Two numbers are reported per change: the report section's own wall time,
+read from the ``astro_gann.diagnostics`` log line the app emits, and the
+full AppTest round trip, which adds a fixed polling overhead.
+
+Run from the repository root::
+
+    python benchmarks/bench_rerun.py --repeat 9
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+class SectionTimes(logging.Handler):
+    """Collects ``wall_seconds`` from the app's per-run diagnostics line."""
+
+    def __init__(self):
+        super().__init__()
+        self.seconds = []
+
+    def emit(self, record):
+        self.seconds.append(json.loads(record.getMessage())["wall_seconds"])
+
+
+SECTION = SectionTimes()
+
+
+def timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return SECTION.seconds[-1], time.perf_counter() - start
+
+
+def medians(samples):
+    return tuple(statistics.median(column) for column in zip(*samples))
+
+
+def clear_caches():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=9)
+    args = parser.parse_args()
+
+    logger = logging.getLogger("astro_gann.diagnostics")
+    logger.addHandler(SECTION)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    at.sidebar.date_input[0].set_value(datetime.date(2025, 3, 12))
+    at.sidebar.time_input[0].set_value(datetime.time(11, 0))
+    at.run()
+    at.button[0].click()
+    cold_section, cold = timed_run(at)
+
+    font = at.sidebar.slider[0]
+    colour = at.sidebar.color_picker[0]
+    cmp = at.sidebar.number_input[0]
+    clock = at.sidebar.time_input[0]
+    changes = {
+        "font_size": lambda i: font.set_value(13 + i % 10),
+        "box_bg_color": lambda i: colour.set_value(f"#e8ea{i % 10:02d}"),
+        "cmp": lambda i: cmp.set_value(24000.0 + 10 * i),
+        "time": lambda i: clock.set_value(datetime.time(10, i % 60)),
+    }
+    samples = []
+    for i in range(args.repeat):
+        font.set_value(13 + i % 10)
+        clear_caches()
+        samples.append(timed_run(at))
+    uncached, uncached_trip = medians(samples)
+
+    print(f"{'':<28} {'section':>9}    {'round trip':>10}")
+    print(f"{'first generate':<28} {cold_section * 1e3:>9.1f} ms {cold * 1e3:>10.1f} ms  (includes imports)")
+    print(f"{'font_size rerun, uncached':<28} {uncached * 1e3:>9.1f} ms {uncached_trip * 1e3:>10.1f} ms  (baseline)")
+    for name, change in changes.items():
+        samples = []
+        for i in range(args.repeat):
+            change(i + 1)
+            samples.append(timed_run(at))
+        section, trip = medians(samples)
+        print(f"{name + ' rerun':<28} {section * 1e3:>9.1f} ms {trip * 1e3:>10.1f} ms  "
+              f"({uncached / section:.1f}x faster section)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
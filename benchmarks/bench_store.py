@@ -0,0 +1,64 @@
+"""Report store bulk-insert and query latency.
+
+Generates a year of daily reports for a set of symbols, bulk-inserts them
+into a fresh :class:`astro_gann.store.ReportStore` in a temporary directory
+and times a few typical history queries. Run from the repository root::
+
+    python benchmarks/bench_store.py --symbols 20 --days 365
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astro_gann.store import ReportStore  # noqa: E402
+from astro_gann.stream import iter_reports  # noqa: E402
+
+QUERIES = {
+    "Favorable Mars for Nifty in 2025": dict(symbol="Nifty", planet="Mars", transit_nature="Favorable",
+                                             start=date(2025, 1, 1), end=date(2025, 12, 31)),
+    "important planet in March": dict(important=True, start=date(2025, 3, 1), end=date(2025, 3, 31)),
+    "Negative Sun/Moon, all symbols": dict(planet=["Sun", "Moon"], transit_nature="Negative"),
+    "one symbol, one day": dict(symbol="Nifty", start=date(2025, 6, 2), end=date(2025, 6, 2)),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=20)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    symbols = {"Nifty": 24574.0, **{f"SYM{i}": 100.0 + 37.0 * i for i in range(args.symbols - 1)}}
+    start = datetime(2025, 1, 1, 11, 0)
+    reports = [report for _, batch in iter_reports(start, start + timedelta(days=args.days - 1), symbols)
+               for report in batch]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReportStore(os.path.join(tmp, "reports.sqlite"))
+        started = time.perf_counter()
+        rows = store.add(reports)
+        elapsed = time.perf_counter() - started
+        print(f"{len(reports):,} reports, {rows:,} rows inserted in {elapsed:.2f} s ({rows / elapsed:,.0f} rows/s)")
+
+        store.query(symbol="Nifty", limit=1)  # warm up pandas
+        for name, filters in QUERIES.items():
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                found = store.query(**filters)
+                timings.append(time.perf_counter() - started)
+            print(f"{name:36s} {len(found):6,} rows  median {statistics.median(timings) * 1000:7.2f} ms")
+        print(f"store size  : {store.stats()['bytes'] / 1e6:.1f} MB")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
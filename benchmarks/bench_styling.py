@@ -0,0 +1,65 @@
+"""Render time of the per-row highlight callback against the vectorized style matrix.
+
+Styler still parses the CSS of every cell it is given, so past a few
+thousand rows only paging (styling and rendering one page) keeps the
+render time flat; the "page html" column is that path.
+
+Run from the repository root::
+
+    python benchmarks/bench_styling.py --rows 1000 10000 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astro_gann.report import REPORT_COLUMNS  # noqa: E402
+from astro_gann.styles import frame_page, highlight_rows, style_frame, style_matrix  # noqa: E402
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({column: ["x"] * rows for column in REPORT_COLUMNS})
+    frame["Transit Nature"] = rng.choice(["Favorable", "Negative", "Neutral"], rows)
+    frame["Important"] = rng.choice(["Yes", "No"], rows, p=[0.15, 0.85])
+    frame["Current Transit"] = rng.choice(["Yes", "No"], rows, p=[0.1, 0.9])
+    return frame
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'style matrix':>13} {'per-row Styler':>15} {'vector Styler':>14} {'speedup':>8} "
+          f"{'full html':>10} {'page html':>10}")
+    for rows in args.rows:
+        frame = make_frame(rows)
+        per_row, expected = timed(lambda: frame.style.apply(highlight_rows, axis=1)._compute().ctx)
+        vector, actual = timed(lambda: style_frame(frame)._compute().ctx)
+        assert expected == actual
+        matrix, _ = timed(lambda: style_matrix(frame))
+
+        full_html = float("nan")
+        if rows <= 10000:
+            full_html, _ = timed(lambda: style_frame(frame).to_html())
+        page_html, _ = timed(lambda: style_frame(frame_page(frame, 1, args.page_size)).to_html())
+        print(f"{rows:>8} {matrix * 1e3:>10.1f} ms {per_row * 1e3:>12.1f} ms {vector * 1e3:>11.1f} ms {per_row / vector:>7.1f}x "
+              f"{full_html * 1e3:>7.0f} ms {page_html * 1e3:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""Benchmark suite covering every compute and export path at 1, 1k and 100k inputs.
+
+Run from the repository root::
+
+    python benchmarks/suite.py --out bench_results.json
+    python benchmarks/suite.py --baseline bench_results.json --threshold 0.25
+
+Each case times the best of a few runs per input size and the results are
+written as JSON. With ``--baseline`` every case/size is compared against a
+previous run and the script exits non-zero when any of them got slower by
+more than ``--threshold`` (a fraction; 0.25 = 25%).
+
+Scalar paths costing a millisecond or more per call (positions, Moon-node
+search, full reports) stop at 1k inputs; their vectorized counterparts
+(``positions_array``, ``find_moon_node_events``) cover the 100k size.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from astro_gann import core  # noqa: E402
+from astro_gann.aspects import find_moon_node_events, find_orb_events  # noqa: E402
+from astro_gann.ephemeris import positions_array  # noqa: E402
+from astro_gann.export import write_excel  # noqa: E402
+from astro_gann.intraday import downsample, grid_at  # noqa: E402
+from astro_gann.ladder import PriceLadder  # noqa: E402
+from astro_gann.levels import calculate_gann_levels_batch  # noqa: E402
+from astro_gann.report import format_report_frame, generate_report, report_frame  # noqa: E402
+from astro_gann.screener import Watchlist, screen  # noqa: E402
+from astro_gann.trading_calendar import clip_to_sessions  # noqa: E402
+from astro_gann.transit import transit_natures  # noqa: E402
+
+DEFAULT_SIZES = (1, 1000, 100000)
+START = datetime(2025, 1, 6, 9, 15)
+NOW = datetime(2025, 1, 6, 12, 0)
+
+CASES = {}
+
+
+def case(name, max_size=None):
+    """Register ``setup(n) -> callable`` as a benchmark; ``max_size`` caps slow scalar paths."""
+    def register(setup):
+        CASES[name] = (setup, max_size)
+        return setup
+    return register
+
+
+def _instants(n):
+    return [START + timedelta(minutes=15 * i) for i in range(n)]
+
+
+def _degrees(n, seed=0):
+    return np.random.default_rng(seed).uniform(0, 360, n)
+
+
+def _report_frame(n):
+    report = generate_report(START + timedelta(hours=2), 24574.0, now=NOW)
+    records = report.to_records()
+    return pd.DataFrame([records[i % len(records)] for i in range(n)])
+
+
+@case("get_planetary_positions", max_size=1000)
+def _positions(n):
+    instants = _instants(n)
+    return lambda: [core.get_planetary_positions(dt) for dt in instants]
+
+
+@case("positions_array")
+def _positions_array(n):
+    stamps = np.array(_instants(n), dtype="datetime64[m]")
+    return lambda: positions_array(stamps, core.PLANETS)
+
+
+@case("get_nakshatra")
+def _nakshatra(n):
+    degrees = _degrees(n).tolist()
+    return lambda: [core.get_nakshatra(d) for d in degrees]
+
+
+@case("get_transit_nature")
+def _transit_nature(n):
+    degrees = _degrees(n).tolist()
+    planets = [core.PLANETS[i % 7] for i in range(n)]
+    return lambda: [core.get_transit_nature(p, d) for p, d in zip(planets, degrees)]
+
+
+@case("transit_natures")
+def _transit_natures(n):
+    degrees = _degrees(n)
+    return lambda: transit_natures(degrees, "Mars")
+
+
+@case("calculate_gann_levels")
+def _gann_levels(n):
+    degrees = _degrees(n).tolist()
+    planets = [core.PLANETS[i % 7] for i in range(n)]
+    return lambda: [core.calculate_gann_levels(24574.0, d, p, 1.0) for p, d in zip(planets, degrees)]
+
+
+@case("calculate_gann_levels_batch")
+def _gann_levels_batch(n):
+    cmps = np.random.default_rng(1).uniform(50, 50000, n)
+    degrees = _degrees(7)
+    return lambda: calculate_gann_levels_batch(cmps, degrees)
+
+
+@case("calculate_timing+adjust_timing_to_market")
+def _timing(n):
+    instants = _instants(n)
+    planets = [core.PLANETS[i % 7] for i in range(n)]
+
+    def run():
+        for dt, planet in zip(instants, planets):
+            start, end = core.calculate_timing(dt, planet, core.INDIAN_MARKET)
+            core.adjust_timing_to_market(start, end, core.INDIAN_MARKET)
+    return run
+
+
+@case("clip_to_sessions")
+def _clip(n):
+    starts = np.array(_instants(n), dtype="datetime64[ns]")
+    ends = starts + np.timedelta64(3, "h")
+    return lambda: clip_to_sessions(starts, ends, core.INDIAN_MARKET)
+
+
+@case("intraday grid_at[minutes]")
+def _intraday(n):
+    minutes = np.datetime64("2025-03-12T09:15") + np.arange(n).astype("timedelta64[m]")
+    return lambda: grid_at(minutes, 22500.0)
+
+
+@case("intraday downsample+to_frame")
+def _intraday_downsample(n):
+    grid = grid_at(np.datetime64("2025-03-12T09:15") + np.arange(n).astype("timedelta64[m]"), 22500.0)
+    return lambda: downsample(grid, 240).to_frame()
+
+
+@case("PriceLadder bracket[prices]")
+def _ladder_bracket(n):
+    ladder = PriceLadder(24500.0, _degrees(len(core.PLANETS)))
+    prices = np.random.default_rng(0).uniform(ladder.low, ladder.high, n)
+    return lambda: ladder.bracket(prices)
+
+
+@case("screen[symbols]")
+def _screen(n):
+    rng = np.random.default_rng(0)
+    watchlist = Watchlist(np.array([f"SYM{i}" for i in range(n)], dtype=object), rng.uniform(20, 60000, n),
+                          rng.uniform(0.5, 2.0, n))
+    return lambda: screen(watchlist, START)
+
+
+@case("calculate_moon_nodes_transit", max_size=1000)
+def _moon_nodes(n):
+    days = [START + timedelta(days=i) for i in range(n)]
+    return lambda: [core.calculate_moon_nodes_transit(dt) for dt in days]
+
+
+@case("find_moon_node_events[hours]")
+def _moon_node_events(n):
+    return lambda: find_moon_node_events(START, START + timedelta(hours=max(n, 1)))
+
+
+@case("find_orb_events[hours]")
+def _orb_events(n):
+    return lambda: find_orb_events(START, START + timedelta(hours=max(n, 1)))
+
+
+@case("generate_report", max_size=1000)
+def _generate_report(n):
+    instants = _instants(n)
+    return lambda: [generate_report(dt, 24574.0, now=NOW) for dt in instants]
+
+
+@case("DataFrame(records)")
+def _dataframe(n):
+    records = _report_frame(n).to_dict("records")
+    return lambda: pd.DataFrame(records)
+
+
+def _report_rows(n):
+    rows = generate_report(START + timedelta(hours=2), 24574.0, now=NOW).rows
+    return [rows[i % len(rows)] for i in range(n)]
+
+
+@case("report_frame")
+def _typed_frame(n):
+    rows = _report_rows(n)
+    return lambda: report_frame(rows)
+
+
+@case("format_report_frame")
+def _format_frame(n):
+    frame = report_frame(_report_rows(n))
+    return lambda: format_report_frame(frame)
+
+
+@case("to_parquet[typed]")
+def _to_parquet(n):
+    frame = report_frame(_report_rows(n))
+    path = os.path.join(tempfile.gettempdir(), "astro_gann_bench.parquet")
+    return lambda: frame.to_parquet(path, index=False)
+
+
+@case("to_csv")
+def _to_csv(n):
+    frame = _report_frame(n)
+    return lambda: frame.to_csv(index=False)
+
+
+@case("write_excel")
+def _excel(n):
+    frame = _report_frame(n)
+    path = os.path.join(tempfile.gettempdir(), "astro_gann_bench.xlsx")
+    return lambda: write_excel([frame], path)
+
+
+def measure(func, repeat, budget=1.0):
+    """Best wall time of up to ``repeat`` runs, stopping early once ``budget`` seconds are spent."""
+    best = float("inf")
+    spent = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent > budget:
+            break
+    return best
+
+
+def run_suite(names, sizes, repeat):
+    results = []
+    for name in names:
+        setup, max_size = CASES[name]
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+            func = setup(size)
+            func()  # warm-up: imports, caches, first-call allocation
+            seconds = measure(func, repeat)
+            results.append({
+                "case": name,
+                "size": size,
+                "seconds": seconds,
+                "per_item_us": seconds / size * 1e6,
+                "items_per_second": size / seconds if seconds else float("inf"),
+            })
+            print(f"{name:<44} {size:>7} {seconds * 1e3:>11.3f} ms {seconds / size * 1e6:>11.3f} us/item",
+                  flush=True)
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold, min_delta=0.0):
+    """Return ``(case, size, old, new)`` for every measurement slower than ``threshold``.
+
+    ``min_delta`` seconds of absolute slack keep timer noise on microsecond
+    cases from counting as a regression.
+    """
+    previous = {(r["case"], r["size"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["case"], result["size"]))
+        if old and result["seconds"] > old * (1.0 + threshold) + min_delta:
+            regressions.append((result["case"], result["size"], old, result["seconds"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="bench_results.json", help="where to write the JSON results")
+    parser.add_argument("--baseline", help="previous results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown fraction")
+    parser.add_argument("--min-delta", type=float, default=0.0002,
+                        help="absolute slowdown in seconds ignored as noise")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+
+    results = run_suite(args.cases, args.sizes, args.repeat)
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(args.out, "w") as fh:
+        json.dump(payload, fh, indent=2)
+    print(f"wrote {args.out}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for name, size, old, new in regressions:
+            print(f"REGRESSION {name} @ {size}: {old * 1e3:.3f} ms -> {new * 1e3:.3f} ms "
+                  f"(+{(new / old - 1) * 100:.0f}%)")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
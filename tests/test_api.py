@@ -0,0 +1,90 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from astro_gann.api import ReportService, create_app, parse_report_params
+from astro_gann.cache import ReportCache
+from astro_gann.store import ReportStore
+
+pytest.importorskip("starlette")
+
+
+def _request(app, method, path, body=None, query=""):
+    """Drive the ASGI app directly; returns ``(status, json_body)``."""
+    payload = json.dumps(body).encode() if body is not None else b""
+    scope = {"type": "http", "method": method, "path": path, "query_string": query.encode(), "root_path": "",
+             "headers": [(b"content-type", b"application/json")], "scheme": "http", "server": ("test", 80),
+             "http_version": "1.1", "client": ("test", 1)}
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    status = next(m["status"] for m in sent if m["type"] == "http.response.start")
+    data = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    return status, json.loads(data)
+
+
+@pytest.fixture
+def app(tmp_path):
+    service = ReportService(cache=ReportCache(), store=ReportStore(str(tmp_path / "reports.sqlite")), workers=1)
+    yield create_app(service)
+    service.close()
+
+
+def test_report_round_trip(app):
+    status, body = _request(app, "GET", "/report", query="date=2025-03-12&time=11:00&cmp=24574")
+    assert status == 200
+    assert body["symbol"] == "Nifty" and len(body["rows"]) == 7
+
+
+@pytest.mark.parametrize("requests, message", [
+    ([1], "request 0: expected an object"),
+    ([{"date": "2025-03-12"}], "request 0: missing parameter 'cmp'"),
+    ("nope", "expected a list"),
+])
+def test_bad_batch_entries_are_client_errors(app, requests, message):
+    status, body = _request(app, "POST", "/batch", {"requests": requests})
+    assert status == 400
+    assert message in body["error"]
+
+
+def test_bad_report_parameters_are_client_errors(app):
+    status, body = _request(app, "GET", "/report", query="date=2025-03-12&cmp=abc")
+    assert status == 400
+    status, body = _request(app, "GET", "/report", query="date=2025-03-12&cmp=1&market=Moon")
+    assert status == 400 and "unknown market" in body["error"]
+
+
+def test_stream_rejects_unknown_market(app):
+    status, body = _request(app, "GET", "/stream", query="start=2025-03-10&end=2025-03-11&symbols=N:100&market=Moon")
+    assert status == 400 and "unknown market 'Moon'" in body["error"]
+
+
+def test_offset_aware_times_become_naive_ist():
+    dt, _, _, _, _, now = parse_report_params({
+        "date": "2025-03-12", "time": "05:30+00:00", "cmp": 1, "now": "2025-03-12T05:45:00+00:00"})
+    assert dt == datetime(2025, 3, 12, 11, 0)
+    assert now == datetime(2025, 3, 12, 11, 15)
+
+
+def test_tz_aware_now_in_request(app):
+    status, body = _request(app, "GET", "/report",
+                            query="date=2025-03-12&time=11:00&cmp=1&now=2025-03-12T05:30:00%2B00:00")
+    assert status == 200
+    assert any(row["current_transit"] for row in body["rows"])
+
+
+def test_history_reads_the_store(app):
+    _request(app, "GET", "/report", query="date=2025-03-12&time=11:00&cmp=24574&symbol=Nifty")
+    status, body = _request(app, "GET", "/history", query="symbol=Nifty&planet=Mars")
+    assert status == 200 and [row["planet"] for row in body["rows"]] == ["Mars"]
+    status, body = _request(app, "GET", "/history", query="limit=0")
+    assert status == 400
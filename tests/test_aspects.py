@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from astro_gann.aspects import (
+    find_aspect_events,
+    find_moon_node_events,
+    find_orb_events,
+    moon_nodes_transit,
+    planet_aspects,
+)
+from astro_gann.ephemeris import from_unix_seconds, positions_array, to_unix_seconds
+
+START = datetime(2025, 3, 1)
+
+
+def _separation(t, body_a, body_b):
+    lon = positions_array(np.atleast_1d(t), (body_a, body_b))
+    return (lon[:, 0] - lon[:, 1]) % 360.0
+
+
+def test_events_are_exact():
+    events = find_aspect_events(START, START + timedelta(days=30), [("Moon", "Rahu"), ("Sun", "Moon")],
+                                aspects=(0, 60, 90, 120, 180))
+    assert len(events) > 10
+    assert np.all(np.diff(events["time"]) >= 0)
+    for event in events:
+        separation = _separation(event["time"], event["body_a"], event["body_b"])[0]
+        error = min(abs((separation - target + 180) % 360 - 180) for target in (event["aspect"], -event["aspect"]))
+        assert error < 1e-4, (event, separation)
+
+
+def test_events_match_a_minute_scan():
+    end = START + timedelta(days=30)
+    t = np.arange(to_unix_seconds(START), to_unix_seconds(end), 60.0)
+    separation = _separation(t, "Moon", "Rahu")
+    expected = 0
+    for target in (60.0, 300.0):
+        f = (separation - target + 180) % 360 - 180
+        expected += np.count_nonzero((np.sign(f[:-1]) != np.sign(f[1:])) & (np.abs(f[1:] - f[:-1]) < 180))
+    events = find_aspect_events(START, end, [("Moon", "Rahu")], aspects=(60,))
+    assert len(events) == expected > 0
+
+
+def test_moon_nodes_transit_splits_rahu_and_ketu():
+    first = find_moon_node_events(START, START + timedelta(days=10))[0]
+    day = from_unix_seconds(first["time"]).replace(hour=0, minute=0, second=0, microsecond=0)
+    rahu, ketu = moon_nodes_transit(day)
+    assert rahu or ketu
+    for entries, node in ((rahu, "Rahu"), (ketu, "Ketu")):
+        for entry in entries:
+            assert entry["aspect"] == f"Moon-{node} {entry['angle']:g}°"
+            assert entry["time"].date() == day.date()
+
+    # ``hours`` searches forward from the given instant instead of the whole day
+    event_time = (rahu + ketu)[0]["time"]
+    window_rahu, window_ketu = moon_nodes_transit(event_time - timedelta(hours=1), hours=2)
+    # Rahu and Ketu are opposite, so one Moon aspect to each can coincide
+    assert window_rahu + window_ketu
+    assert all(abs(entry["time"] - event_time) < timedelta(seconds=1) for entry in window_rahu + window_ketu)
+    assert moon_nodes_transit(event_time + timedelta(hours=1), hours=2) == ([], [])
+
+
+def _minute_runs(start, end, bodies, aspect, orb):
+    """Brute force: in-orb runs of every pair from a minute-by-minute scan."""
+    t = np.arange(to_unix_seconds(start), to_unix_seconds(end) + 1, 60.0)
+    lon = positions_array(t, bodies)
+    runs = {}
+    for i, body_a in enumerate(bodies):
+        for body_b in bodies[i + 1:]:
+            separation = np.abs((lon[:, i] - lon[:, bodies.index(body_b)] + 180) % 360 - 180)
+            within = np.abs(separation - aspect) <= orb
+            edges = np.diff(np.concatenate([[0], within.astype(np.int8), [0]]))
+            runs[(body_a, body_b)] = list(zip(t[edges[:-1] == 1], t[np.flatnonzero(edges == -1) - 1]))
+    return runs
+
+
+def test_orb_events_match_a_minute_scan():
+    bodies = ("Sun", "Moon", "Mercury", "Venus", "Mars")
+    start, end = START, START + timedelta(days=4)
+    events = find_orb_events(start, end, bodies, aspects=(90,), orbs=4.0, step_minutes=20.0)
+    found = {}
+    for event in events:
+        found.setdefault((event["body_a"], event["body_b"]), []).append((event["start"], event["end"]))
+    expected = {pair: runs for pair, runs in _minute_runs(start, end, bodies, 90.0, 4.0).items() if runs}
+    assert expected and found.keys() == expected.keys()
+    for pair, runs in expected.items():
+        assert len(found[pair]) == len(runs)
+        # Edges are interpolated between 20-minute samples
+        np.testing.assert_allclose(found[pair], runs, atol=120.0)
+    assert np.all((events["orb"] <= 4.0) & (events["start"] <= events["peak"]) & (events["peak"] <= events["end"]))
+
+
+def test_cached_day_aspects_are_not_shared():
+    day = datetime(2025, 3, 12, 11, 0)
+    first = planet_aspects(day)
+    assert first
+    first[0]["aspect"] = "corrupted"
+    first.clear()
+    assert planet_aspects(day)[0]["aspect"] != "corrupted"
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from astro_gann.backtest import load_ohlc, run_backtest
+
+
+def _bars(symbol, offset=""):
+    stamps = pd.date_range("2025-03-12 09:15", "2025-03-12 15:15", freq="5min")
+    close = pd.Series(100.0, index=range(len(stamps)))
+    high = close + 0.1
+    high[1] = 105.0  # day's high at 09:20 IST, inside the Sun's 09:15-09:30 window
+    return pd.DataFrame({
+        "symbol": symbol,
+        "timestamp": [f"{stamp:%Y-%m-%d %H:%M:%S}{offset}" for stamp in stamps],
+        "open": close, "high": high, "low": close - 0.1, "close": close,
+    })
+
+
+def test_offset_aware_timestamps_are_converted_to_ist(tmp_path):
+    path = tmp_path / "bars.csv"
+    _bars("NIFTY", "+05:30").to_csv(path, index=False)
+    bars = load_ohlc(str(path))
+    assert bars["timestamp"].iloc[0] == pd.Timestamp("2025-03-12 09:15")
+
+    results = run_backtest([str(path)], workers=1)
+    sun = results[results["planet"] == "Sun"].iloc[0]
+    assert sun["extreme_in_window"] == 1
+
+
+def test_mixed_offsets_are_normalised(tmp_path):
+    path = tmp_path / "bars.csv"
+    frame = _bars("NIFTY", "+05:30")
+    frame.loc[0, "timestamp"] = "2025-03-12 03:45:00+00:00"
+    frame.to_csv(path, index=False)
+    assert load_ohlc(str(path))["timestamp"].iloc[0] == pd.Timestamp("2025-03-12 09:15")
+
+
+def test_multi_symbol_file_fans_out_per_symbol(tmp_path):
+    path = tmp_path / "universe.csv"
+    pd.concat([_bars("NIFTY"), _bars("BANK")]).to_csv(path, index=False)
+    serial = run_backtest([str(path)], workers=1)
+    parallel = run_backtest([str(path)], workers=2)
+    assert sorted(serial["symbol"].unique()) == ["BANK", "NIFTY"]
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_missing_columns_are_reported(tmp_path):
+    path = tmp_path / "bad.csv"
+    pd.DataFrame({"timestamp": ["2025-03-12 09:15"], "open": [1.0]}).to_csv(path, index=False)
+    with pytest.raises(ValueError, match="missing OHLC columns"):
+        load_ohlc(str(path))
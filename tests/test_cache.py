@@ -0,0 +1,47 @@
+import sqlite3
+from datetime import datetime
+
+from astro_gann import cache as cache_module
+from astro_gann.cache import ReportCache, engine_key
+
+DT = datetime(2025, 3, 12, 11, 0)
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ReportCache(disk_path=path)
+    report = cache.get_report(DT, 24574.0, now=DT)
+    cache.close()
+
+    cache = ReportCache(disk_path=path)
+    assert cache.get_report(DT, 24574.0, now=DT) == report
+    assert cache.stats()["disk_hits"] == 1
+    cache.close()
+
+
+def test_other_schema_versions_are_dropped(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ReportCache(disk_path=path)
+    cache.get_engine(DT)
+    cache.close()
+    with sqlite3.connect(path) as db:
+        db.execute("INSERT INTO reports VALUES ('2025-03-12T11:00|Indian Market|1.0000|', x'00')")
+
+    monkeypatch.setattr(cache_module, "CACHE_SCHEMA", cache_module.CACHE_SCHEMA + 1)
+    cache = ReportCache(disk_path=path)
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT COUNT(*) FROM reports").fetchone()[0] == 0
+    assert engine_key(DT, "Indian Market", 1.0).startswith(f"v{cache_module.CACHE_SCHEMA}|")
+    cache.get_engine(DT)
+    assert cache.stats()["misses"] == 1
+    cache.close()
+
+
+def test_unreadable_disk_entry_is_a_miss(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ReportCache(disk_path=path)
+    with sqlite3.connect(path) as db:
+        db.execute("INSERT INTO reports VALUES (?, x'00')", (engine_key(DT, "Indian Market", 1.0, "k"),))
+    assert cache.get(engine_key(DT, "Indian Market", 1.0, "k")) is None
+    assert cache.stats()["misses"] == 1
+    cache.close()
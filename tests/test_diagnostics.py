@@ -0,0 +1,49 @@
+import tracemalloc
+
+from astro_gann.diagnostics import StageTimer
+
+MB = 1024 * 1024
+
+
+def _records(timer):
+    return {record["stage"]: record for record in timer.stages}
+
+
+def test_nested_stage_keeps_the_outer_peak():
+    timer = StageTimer(trace_memory=True)
+    with timer.stage("outer"):
+        buffer = bytearray(8 * MB)
+        del buffer
+        with timer.stage("inner"):
+            small = bytearray(MB)
+        del small
+    timer.finish()
+    records = _records(timer)
+    assert records["outer"]["peak_bytes"] >= 8 * MB
+    assert MB <= records["inner"]["peak_bytes"] < 2 * MB
+    assert not records["outer"]["memory_shared"]
+
+
+def test_overlapping_timers_are_flagged_and_share_tracing():
+    assert not tracemalloc.is_tracing()
+    first = StageTimer(trace_memory=True)
+    second = StageTimer(trace_memory=True)
+    with first.stage("a"):
+        pass
+    first.finish()
+    assert tracemalloc.is_tracing()  # still used by the second timer
+    with second.stage("b"):
+        pass
+    second.finish()
+    assert not tracemalloc.is_tracing()
+    assert first.stages[0]["memory_shared"] and not second.stages[0]["memory_shared"]
+
+
+def test_wall_time_only_without_trace_memory():
+    timer = StageTimer()
+    with timer.stage("outer"):
+        with timer.stage("inner"):
+            pass
+    assert [record["depth"] for record in timer.stages] == [1, 0]
+    assert "peak_bytes" not in timer.stages[0]
+    assert timer.total_seconds == timer.stages[1]["seconds"]
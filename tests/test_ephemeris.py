@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from astro_gann import ephemeris
+from astro_gann.ephemeris import (
+    BODIES,
+    EphemerisTable,
+    build_table,
+    compute_longitudes,
+    from_unix_seconds,
+    positions_array,
+    to_unix_seconds,
+)
+
+START, END = datetime(2025, 3, 1), datetime(2025, 4, 5)
+# Hourly samples, linearly interpolated: the Moon's curvature over one hour
+# keeps the error well under a hundredth of a degree
+TOLERANCE = 0.01
+
+
+def _angle_error(a, b):
+    return np.abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    return EphemerisTable(build_table(str(tmp_path_factory.mktemp("eph") / "ephemeris"), START, END))
+
+
+def test_table_matches_the_analytic_model(table):
+    t = np.linspace(to_unix_seconds(START), to_unix_seconds(END), 5001)
+    looked_up = table.longitudes(t)
+    computed = compute_longitudes(t)
+    assert looked_up.shape == (len(t), len(BODIES))
+    assert _angle_error(looked_up, computed).max() < TOLERANCE
+    assert looked_up.min() >= 0 and looked_up.max() < 360
+
+
+def test_interpolation_across_the_wrap(table):
+    moon = BODIES.index("Moon")
+    t = to_unix_seconds(START) + 3600.0 * np.arange(len(table))
+    lon = compute_longitudes(t)[:, moon]
+    crossing = np.flatnonzero(np.diff(lon) < -180)  # 359.x -> 0.x between samples
+    assert len(crossing)
+    mid = t[crossing] + 1800.0
+    looked_up = table.longitudes(mid, ("Moon",))[:, 0]
+    assert _angle_error(looked_up, compute_longitudes(mid, ("Moon",))[:, 0]).max() < TOLERANCE
+    assert np.all((looked_up < 1.0) | (looked_up > 359.0))
+
+
+def test_outside_the_table_falls_back_to_the_model(table, monkeypatch):
+    monkeypatch.setattr(ephemeris, "_table", table)
+    inside = np.array([datetime(2025, 3, 10, 11, 0)], dtype="datetime64[m]")
+    outside = np.array([datetime(2024, 12, 31, 11, 0), datetime(2025, 6, 1, 11, 0)], dtype="datetime64[m]")
+    np.testing.assert_array_equal(positions_array(outside), compute_longitudes(to_unix_seconds(outside)))
+    np.testing.assert_array_equal(positions_array(inside), table.longitudes(to_unix_seconds(inside)))
+    with pytest.raises(ValueError, match="outside ephemeris range"):
+        table.longitudes(to_unix_seconds(outside))
+
+
+def test_timestamp_conversions():
+    utc = datetime(2025, 3, 12, 5, 30, tzinfo=timezone.utc).timestamp()
+    assert to_unix_seconds(datetime(2025, 3, 12, 11, 0)) == utc  # naive is IST
+    assert to_unix_seconds(datetime(2025, 3, 12, 5, 30, tzinfo=timezone.utc)) == utc
+    assert to_unix_seconds(np.datetime64("2025-03-12T11:00"))[()] == utc
+    np.testing.assert_array_equal(to_unix_seconds(np.array(["2025-03-12T11:00"], dtype="datetime64[m]")), [utc])
+    np.testing.assert_array_equal(to_unix_seconds(np.array([datetime(2025, 3, 12, 11, 0)], dtype=object)), [utc])
+    assert from_unix_seconds(utc) == datetime(2025, 3, 12, 11, 0)
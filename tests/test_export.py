@@ -0,0 +1,80 @@
+import base64
+import io
+import re
+import zlib
+from datetime import datetime
+
+import pytest
+
+from astro_gann.export import write_excel, write_pdf
+from astro_gann.stream import iter_report_frames
+from astro_gann.styles import HIGHLIGHTS
+
+START, END = datetime(2025, 3, 10, 11, 0), datetime(2025, 3, 12, 11, 0)
+SYMBOLS = {"Nifty": 24574.0, "BankNifty": 52000.0}
+
+
+def _frames(symbols=SYMBOLS):
+    return iter_report_frames(START, END, symbols, now=END)
+
+
+def _pdf_text(data):
+    """Decoded page content streams (reportlab writes them ASCII85 + Flate encoded)."""
+    streams = re.findall(rb"stream\r?\n(.*?)endstream", data, re.S)
+    return b"".join(zlib.decompress(base64.a85decode(stream.strip().removesuffix(b"~>"))) for stream in streams)
+
+
+def test_pdf_holds_every_row():
+    pytest.importorskip("reportlab")
+    buffer = io.BytesIO()
+    assert write_pdf(_frames(), buffer, title="Range") == 42
+    data = buffer.getvalue()
+    assert data.startswith(b"%PDF")
+    text = _pdf_text(data)
+    assert text.count(b"(Nifty) Tj") == text.count(b"(BankNifty) Tj") == 21
+    assert re.findall(rb"\((\d{4}-\d\d-\d\d) \\227 14 rows\) Tj", text) == [b"2025-03-10", b"2025-03-11",
+                                                                             b"2025-03-12"]
+
+
+def test_pdf_streams_across_pages():
+    pytest.importorskip("reportlab")
+    symbols = {f"S{i:02d}": 100.0 + i for i in range(30)}
+    buffer = io.BytesIO()
+    assert write_pdf(_frames(symbols), buffer) == 3 * 30 * 7
+    data = buffer.getvalue()
+    pages = len(re.findall(rb"/Type /Page\b", data))
+    assert pages > 3
+    text = _pdf_text(data)
+    assert sum(text.count(f"({symbol}) Tj".encode()) for symbol in symbols) == 3 * 30 * 7
+
+
+def test_excel_has_a_sheet_per_symbol_with_highlight_rules():
+    openpyxl = pytest.importorskip("openpyxl")
+    buffer = io.BytesIO()
+    assert write_excel(_frames(), buffer, sheet_by="Symbol") == 42
+    workbook = openpyxl.load_workbook(io.BytesIO(buffer.getvalue()))
+    assert workbook.sheetnames == ["Nifty", "BankNifty"]
+    for name in workbook.sheetnames:
+        sheet = workbook[name]
+        assert sheet.max_row == 1 + 21
+        header = [cell.value for cell in sheet[1]]
+        assert header[:2] == ["Date", "Symbol"]
+        assert {cell.value for cell in sheet["B"][1:]} == {name}
+
+        rules = {str(cell_range.sqref): [rule.formula[0] for rule in cell_range.rules]
+                 for cell_range in sheet.conditional_formatting}
+        last_column = openpyxl.utils.get_column_letter(len(header))
+        row_rules = rules[f"A2:{last_column}22"]
+        assert len(row_rules) == len(HIGHLIGHTS)
+        important = openpyxl.utils.get_column_letter(header.index("Important") + 1)
+        assert f'${important}2="Yes"' in row_rules
+        left_borders = sum(spec["border_side"] == "left" for spec in HIGHLIGHTS.values())
+        assert len(rules["A2:A22"]) == left_borders
+
+
+def test_excel_single_sheet():
+    openpyxl = pytest.importorskip("openpyxl")
+    buffer = io.BytesIO()
+    assert write_excel(_frames(), buffer) == 42
+    workbook = openpyxl.load_workbook(io.BytesIO(buffer.getvalue()))
+    assert workbook.sheetnames == ["Report"] and workbook["Report"].max_row == 43
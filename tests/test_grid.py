@@ -0,0 +1,66 @@
+import os
+from datetime import date
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from astro_gann.grid import run_grid  # noqa: E402
+
+SYMBOLS = {"Nifty": 24574.0, "BankNifty": 52000.0}
+START, END = date(2025, 3, 10), date(2025, 3, 12)
+
+
+def test_resume_skips_days_written_with_the_same_parameters(tmp_path):
+    out = str(tmp_path / "grid")
+    first = run_grid(SYMBOLS, START, END, [1.0, 1.5], out, workers=1)
+    assert first["computed"] == 3
+    again = run_grid(SYMBOLS, START, END, [1.0, 1.5], out, workers=1)
+    assert again["computed"] == 0 and again["skipped"] == 3
+    assert len(pd.read_parquet(out)) == first["rows"]
+
+
+@pytest.mark.parametrize("symbols, multipliers, changed", [
+    ({**SYMBOLS, "Sensex": 81000.0}, [1.0, 1.5], "symbols"),
+    ({"Nifty": 25000.0, "BankNifty": 52000.0}, [1.0, 1.5], "symbols"),
+    (SYMBOLS, [1.0], "multipliers"),
+])
+def test_resume_refuses_different_parameters(tmp_path, symbols, multipliers, changed):
+    out = str(tmp_path / "grid")
+    run_grid(SYMBOLS, START, END, [1.0, 1.5], out, workers=1)
+    with pytest.raises(ValueError, match=f"different {changed}"):
+        run_grid(symbols, START, END, multipliers, out, workers=1)
+
+    summary = run_grid(symbols, START, END, multipliers, out, workers=1, resume=False)
+    assert summary["computed"] == 3
+    frame = pd.read_parquet(out)
+    assert set(frame["symbol"]) == set(symbols)
+    assert sorted(set(frame["swing_range_multiplier"])) == multipliers
+    assert run_grid(symbols, START, END, multipliers, out, workers=1)["skipped"] == 3
+
+
+def test_resume_refuses_a_grid_without_manifest(tmp_path):
+    out = str(tmp_path / "grid")
+    run_grid(SYMBOLS, START, END, [1.0], out, workers=1)
+    os.remove(os.path.join(out, "_manifest.json"))
+    with pytest.raises(ValueError, match="no manifest"):
+        run_grid(SYMBOLS, START, END, [1.0], out, workers=1)
+
+
+def test_recompute_with_new_parameters_drops_old_days(tmp_path):
+    out = str(tmp_path / "grid")
+    run_grid(SYMBOLS, date(2025, 3, 3), END, [1.0], out, workers=1)
+    summary = run_grid({"Nifty": 25000.0}, START, END, [1.0], out, workers=1, resume=False)
+    assert summary["computed"] == 3
+    frame = pd.read_parquet(out)
+    assert len(frame) == summary["rows"]
+    assert set(frame["symbol"]) == {"Nifty"} and set(frame["cmp"]) == {25000.0}
+    assert frame["report_time"].min().date() == START
+
+
+def test_recompute_with_the_same_parameters_keeps_other_days(tmp_path):
+    out = str(tmp_path / "grid")
+    first = run_grid(SYMBOLS, date(2025, 3, 3), END, [1.0], out, workers=1)
+    assert run_grid(SYMBOLS, START, END, [1.0], out, workers=1, resume=False)["computed"] == 3
+    assert len(pd.read_parquet(out)) == first["rows"]
@@ -0,0 +1,43 @@
+from datetime import date, datetime
+
+import pytest
+
+from astro_gann.core import INDIAN_MARKET, PLANETS, calculate_gann_levels, get_market_hours, get_transit_nature
+from astro_gann.ephemeris import get_planetary_positions
+from astro_gann.intraday import downsample, intraday_grid
+from astro_gann.rules import RuleSet
+
+RULES = RuleSet.builtin()
+DAY = date(2025, 3, 12)
+
+
+def test_grid_matches_the_scalar_path():
+    grid = intraday_grid(DAY, 24574.0, swing_range_multiplier=1.5, rules=RULES)
+    opens, closes = get_market_hours(INDIAN_MARKET)
+    assert grid.minutes[0].item() == datetime.combine(DAY, opens)
+    assert grid.minutes[-1].item() == datetime.combine(DAY, closes)
+    for index in (0, 137, len(grid) - 1):
+        dt = grid.minutes[index].astype(datetime)
+        positions = get_planetary_positions(dt)
+        for row, planet in enumerate(PLANETS):
+            assert grid.degrees[row, index] == pytest.approx(positions[planet], abs=1e-9)
+            low, high, _, _ = calculate_gann_levels(24574.0, grid.degrees[row, index], planet, 1.5, RULES)
+            assert (grid.swing_low[row, index], grid.swing_high[row, index]) == pytest.approx((low, high))
+            nature = get_transit_nature(planet, grid.degrees[row, index], RULES)
+            assert ("Neutral", "Favorable", "Negative")[grid.nature_codes[row, index]] == nature
+
+
+def test_downsample_keeps_every_change():
+    grid = intraday_grid(DAY, 24574.0, rules=RULES)
+    thin = downsample(grid, max_points=40)
+    assert len(thin) < len(grid)
+    assert thin.minutes[0] == grid.minutes[0] and thin.minutes[-1] == grid.minutes[-1]
+    kept = set(thin.minutes.tolist())
+    for index in grid.changes():
+        assert grid.minutes[index - 1].item() in kept and grid.minutes[index].item() in kept
+    assert downsample(grid, max_points=len(grid)) is grid
+
+
+def test_closed_day_raises():
+    with pytest.raises(ValueError, match="no session"):
+        intraday_grid(date(2025, 3, 15), 24574.0)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from astro_gann.core import PLANETS
+from astro_gann.ladder import LadderBook, PriceLadder, nearest_levels
+
+DEGREES = [333.2, 12.5, 88.0, 201.7, 4.25, 270.0, 26.9]
+
+
+def test_levels_sit_on_the_square_of_nine():
+    ladder = PriceLadder(24574.0, DEGREES)
+    assert len(ladder) == len(PLANETS) * 8 * 7
+    assert np.all(np.diff(ladder.prices) >= 0)
+    angles = (np.sqrt(ladder.prices) % 2) * 180
+    planet_degrees = np.array(DEGREES)[ladder.planet_codes]
+    np.testing.assert_allclose((angles - planet_degrees - ladder.angles + 180) % 360 - 180, 0, atol=1e-6)
+
+
+def test_neighbours_are_strict():
+    ladder = PriceLadder(24574.0, DEGREES)
+    level = ladder.prices[100]
+    assert ladder.nearest_below(level).price < level < ladder.nearest_above(level).price
+    below, above = ladder.bracket([level, 24574.0])
+    assert below[0] == ladder.nearest_below(level).price and above[0] == ladder.nearest_above(level).price
+    assert below[1] <= 24574.0 <= above[1]
+    assert ladder.nearest_below(ladder.prices[0]) is None
+    assert np.isnan(ladder.bracket([ladder.prices[-1] + 1])[1][0])
+    with pytest.raises(ValueError):
+        PriceLadder(100.0, DEGREES, rotations=0)
+
+
+def test_nearest_levels_matches_the_ladders():
+    rng = np.random.default_rng(3)
+    prices = rng.uniform(50, 80000, 200)
+    levels, angles = nearest_levels(prices, DEGREES)
+    for i, price in enumerate(prices):
+        ladder = PriceLadder(price, DEGREES)
+        for j, planet in enumerate(PLANETS):
+            own = ladder.for_planet(planet)
+            best = own.prices[np.argmin(np.abs(own.prices - price))]
+            assert levels[i, j] == pytest.approx(best, rel=1e-9)
+            assert abs(levels[i, j] - price) <= abs(best - price) + 1e-6
+
+
+def test_book_reuses_ladders_within_a_degree_bucket():
+    book = LadderBook(degree_step=0.25)
+    first = book.get(24574.0, DEGREES, "Nifty")
+    assert book.get(24580.0, [d + 0.01 for d in DEGREES], "Nifty") is first
+    assert book.get(24580.0, [d + 0.3 for d in DEGREES], "Nifty") is not first
+    assert book.get(52000.0, DEGREES, "BankNifty") is not first
+    assert book.stats() == {"symbols": 2, "hits": 1, "builds": 3}
+
+
+@pytest.mark.parametrize("price", [0.5, 1.0, 9.0, 15.9])
+def test_low_prices_are_covered(price):
+    ladder = PriceLadder(price, DEGREES)
+    assert ladder.low == 0.0 and ladder.covers(price)
+    assert ladder.nearest_above(price).price > price
+    book = LadderBook()
+    first = book.get(price, DEGREES, "PENNY")
+    assert book.get(price * 1.01, DEGREES, "PENNY") is first
+    assert book.stats()["builds"] == 1
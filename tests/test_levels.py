@@ -0,0 +1,31 @@
+import numpy as np
+
+from astro_gann.core import PLANETS, calculate_gann_levels
+from astro_gann.levels import calculate_gann_levels_batch
+from astro_gann.rules import RuleSet
+
+RULES = RuleSet.builtin()
+
+
+def _scalar(cmps, degrees, multipliers):
+    return np.array([[calculate_gann_levels(cmp, degree, planet, multiplier, RULES)
+                      for degree, planet in zip(row, PLANETS)]
+                     for cmp, row, multiplier in zip(cmps, degrees, multipliers)])  # (symbols, planets, 4)
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(11)
+    cmps = rng.uniform(10, 60000, 50)
+    degrees = rng.uniform(0, 360, (50, len(PLANETS)))
+    degrees[:5] = [0.0, 5.0, 25.0, 29.999, 30.0, 359.9, 180.0]  # cusps and sign edges
+    levels = calculate_gann_levels_batch(cmps, degrees, PLANETS, 1.5, RULES)
+    np.testing.assert_allclose(np.stack(levels, axis=-1), _scalar(cmps, degrees, [1.5] * 50), rtol=1e-12)
+
+
+def test_shared_chart_and_per_symbol_multipliers():
+    cmps = np.array([24574.0, 52000.0, 150.0])
+    degrees = np.array([333.0, 12.5, 88.0, 201.0, 4.0, 270.0, 26.0])
+    multipliers = np.array([0.5, 1.0, 2.0])
+    levels = calculate_gann_levels_batch(cmps, degrees, PLANETS, multipliers, RULES)
+    assert levels.swing_low.shape == (3, len(PLANETS))
+    np.testing.assert_allclose(np.stack(levels, axis=-1), _scalar(cmps, [degrees] * 3, multipliers), rtol=1e-12)
@@ -0,0 +1,67 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+from astro_gann.live import LiveFeed, Tick, csv_tail_source, parse_tick
+
+
+async def _collect(source, count):
+    ticks = []
+    async for tick in source:
+        ticks.append(tick)
+        if len(ticks) == count:
+            break
+    return ticks
+
+
+def test_csv_source_skips_malformed_lines(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text('symbol,price\nNIFTY,24500\nBANK,oops\n{"symbol": "X"}\n{broken\nNIFTY,24600\n')
+    bad = []
+    source = csv_tail_source(str(path), poll_interval=0.01, from_start=True,
+                             on_bad_line=lambda line, exc: bad.append(line))
+    ticks = asyncio.run(asyncio.wait_for(_collect(source, 2), timeout=5))
+    assert [tick.price for tick in ticks] == [24500.0, 24600.0]
+    assert bad == ["BANK,oops", '{"symbol": "X"}', "{broken"]
+
+
+def test_feed_keeps_running_after_bad_line(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text("NIFTY,24500\nBANK,oops\n")
+    feed = LiveFeed(csv_tail_source(str(path), poll_interval=0.01, from_start=True,
+                                    on_bad_line=lambda line, exc: None),
+                    datetime(2025, 3, 12, 11, 0), max_rate=50).start()
+    try:
+        with open(path, "a") as fh:
+            fh.write("BANK,52000\n")
+        for _ in range(200):
+            if feed.stats()["symbols"] == 2:
+                break
+            asyncio.run(asyncio.sleep(0.02))
+        stats = feed.stats()
+        assert stats["running"] and stats["error"] is None
+        assert set(feed.snapshot()) == {"NIFTY", "BANK"}
+    finally:
+        feed.stop()
+
+
+def test_untimed_tick_uses_feed_date():
+    dt = datetime(2025, 3, 15, 11, 0)  # a Saturday replayed on another day
+    feed = LiveFeed(None, dt, market="Global Market")
+    feed.update(Tick("NIFTY", 24500.0))
+    report = feed.flush(now=datetime(2026, 1, 7, 11, 0))["NIFTY"]
+    assert report.date == dt.date()
+    assert report.rows
+
+
+def test_offset_stamped_tick_is_published_in_ist():
+    tick = parse_tick('{"symbol": "NIFTY", "price": 24500, "time": "2025-03-12T05:30:00+00:00"}')
+    assert tick.time == datetime(2025, 3, 12, 11, 0)
+    assert parse_tick("NIFTY,24500,2025-03-11T20:00:00Z").time == datetime(2025, 3, 12, 1, 30)
+
+    feed = LiveFeed(None, datetime(2025, 3, 12, 11, 0))
+    feed.update(Tick("NIFTY", 24500.0, datetime(2025, 3, 11, 20, 0, tzinfo=timezone.utc)))
+    feed.update(tick._replace(symbol="BANK"))
+    changed = feed.flush()
+    assert changed["NIFTY"].date == date(2025, 3, 12)
+    assert changed["BANK"].date == date(2025, 3, 12)
+    assert any(row.current_transit for row in changed["BANK"].rows)
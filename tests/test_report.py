@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from astro_gann.report import REPORT_CATEGORIES, REPORT_COLUMNS, REPORT_SCHEMA, format_report_frame, generate_report
+from astro_gann.stream import iter_report_frames, write_parquet
+
+pa = pytest.importorskip("pyarrow")
+
+DT = datetime(2025, 3, 12, 11, 0)
+
+
+def _assert_schema(frame):
+    for column, dtype in REPORT_SCHEMA.items():
+        if dtype.startswith("category:"):
+            assert isinstance(frame[column].dtype, pd.CategoricalDtype), column
+            assert list(frame[column].cat.categories) == list(REPORT_CATEGORIES[dtype.split(":", 1)[1]])
+        elif dtype == "category":
+            assert isinstance(frame[column].dtype, pd.CategoricalDtype), column
+        else:
+            assert frame[column].dtype == pd.Series(dtype=dtype).dtype, column
+
+
+def test_typed_frame_follows_the_schema():
+    report = generate_report(DT, 24574.0, now=DT)
+    frame = report.to_frame()
+    assert list(frame.columns) == list(REPORT_SCHEMA)
+    assert len(frame) == len(report.rows)
+    _assert_schema(frame)
+
+
+def test_parquet_round_trip_keeps_the_schema(tmp_path):
+    frames = list(iter_report_frames(datetime(2025, 3, 10, 11, 0), DT, {"Nifty": 24574.0, "BankNifty": 52000.0},
+                                     now=DT, display=False))
+    path = str(tmp_path / "range.parquet")
+    assert write_parquet(iter(frames), path) == sum(len(frame) for frame in frames)
+    back = pd.read_parquet(path)
+    _assert_schema(back)
+    assert back["report_time"].dtype == "datetime64[ns]"
+    expected = pd.concat(frames, ignore_index=True)
+    pd.testing.assert_frame_equal(back[list(REPORT_SCHEMA)], expected[list(REPORT_SCHEMA)], check_categorical=False)
+
+
+def test_arrow_table_matches_the_frame():
+    report = generate_report(DT, 24574.0, now=DT)
+    table = report.to_arrow()
+    assert table.num_rows == len(report.rows)
+    assert pa.types.is_dictionary(table.schema.field("planet").type)
+    assert table.schema.field("swing_low").type == pa.float64()
+    pd.testing.assert_frame_equal(table.to_pandas(), report.to_frame())
+
+
+def test_display_layout():
+    report = generate_report(DT, 24574.0, now=DT)
+    display = format_report_frame(report.to_frame())
+    assert list(display.columns) == list(REPORT_COLUMNS)
+    for row, (_, shown) in zip(report.rows, display.iterrows()):
+        assert shown["CMP"] == "₹24574.00"
+        assert shown["Swing Low"] == f"₹{row.swing_low:.2f}"
+        assert shown["Degree Range"] == f"{row.degree_low:.2f}°–{row.degree_high:.2f}°"
+        assert shown["Key Planet"] == (f"{row.planet} in {row.nakshatra}" if row.nakshatra else row.planet)
+        assert shown["Timing (IST)"] == f"{row.start:%I:%M %p} – {row.end:%I:%M %p}"
+        assert shown["Transit Nature"] == row.transit_nature
+        assert (shown["Important"], shown["Current Transit"]) == (
+            "Yes" if row.important else "No", "Yes" if row.current_transit else "No")
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from astro_gann.core import (
+    BASE_DURATION,
+    DAY_RULERS,
+    FAVORABLE_DEGREES,
+    PLANET_MULTIPLIERS,
+    UNFAVORABLE_DEGREES,
+    ZODIAC_VOLATILITY,
+    compile_transit_table,
+)
+from astro_gann.rules import RuleSet
+from astro_gann.transit import transit_natures
+
+
+def _rules(favorable=FAVORABLE_DEGREES, unfavorable=UNFAVORABLE_DEGREES):
+    return RuleSet("test", [DAY_RULERS[day] for day in range(7)], favorable, unfavorable,
+                   [ZODIAC_VOLATILITY[sign] for sign in range(12)], PLANET_MULTIPLIERS, BASE_DURATION)
+
+
+def test_fractional_bounds_are_rejected():
+    with pytest.raises(ValueError, match=r"favorable_degrees: range \[22.5, 45\) for Mars is not in whole degrees"):
+        _rules(favorable={**FAVORABLE_DEGREES, "Mars": [[22.5, 45]]})
+    with pytest.raises(ValueError, match="not in whole degrees"):
+        compile_transit_table({"Mars": [[0, 10.25]]}, {})
+
+
+def test_rules_file_reports_fractional_bounds(tmp_path):
+    rules = RuleSet.builtin()
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({
+        "version": "bad",
+        "day_rulers": [DAY_RULERS[day] for day in range(7)],
+        "favorable_degrees": {"Mars": [[22.5, 45]]},
+        "unfavorable_degrees": {},
+        "zodiac_volatility": list(rules.zodiac_volatility),
+        "planet_multipliers": PLANET_MULTIPLIERS,
+        "base_duration": BASE_DURATION,
+    }))
+    with pytest.raises(ValueError, match=f"{path}: favorable_degrees"):
+        RuleSet.load(str(path))
+
+
+def test_whole_degree_bounds_compile_to_their_gcd():
+    rules = _rules(favorable={"Mars": [[22, 45]]}, unfavorable={"Mars": [[300, 330]]})
+    assert rules.transit_bin_width == 1
+    assert list(transit_natures([21.99, 22.0, 44.99, 45.0, 299.5, 300.0, 329.99, 330.0], "Mars", rules)) == [
+        "Neutral", "Favorable", "Favorable", "Neutral", "Neutral", "Negative", "Negative", "Neutral"]
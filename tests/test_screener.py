@@ -0,0 +1,65 @@
+import io
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from astro_gann import screener
+from astro_gann.screener import (
+    IMPORTANT_WEIGHT,
+    NATURE_WEIGHTS,
+    SCREEN_COLUMNS,
+    Watchlist,
+    active_planets,
+    load_watchlist,
+    screen,
+)
+
+DT = datetime(2025, 3, 12, 11, 0)
+WATCHLIST = Watchlist(np.array(["A", "B", "C", "D"], dtype=object), np.array([24574.0, 52000.0, 1450.0, 88.5]),
+                      np.array([1.0, 2.0, 1.0, 0.5]))
+
+
+def test_load_watchlist():
+    watchlist = load_watchlist(io.StringIO(" Symbol ,CMP,Volatility\nA,100,\nB,200,1.5\n"), name="w.csv")
+    assert list(watchlist.symbols) == ["A", "B"]
+    assert list(watchlist.volatility) == [1.0, 1.5]
+    with pytest.raises(ValueError, match="missing columns"):
+        load_watchlist(io.StringIO("symbol\nA\n"), name="w.csv")
+    with pytest.raises(ValueError, match=r"invalid cmp for \['B'\]"):
+        load_watchlist(io.StringIO("symbol,cmp\nA,100\nB,-1\n"), name="w.csv")
+
+
+def test_symbols_rank_on_their_best_active_planet():
+    planets, _ = active_planets(DT)
+    assert planets
+    result = screen(WATCHLIST, DT)
+    assert list(result.columns) == list(SCREEN_COLUMNS)
+    assert sorted(result["symbol"]) == ["A", "B", "C", "D"]
+    assert list(result["rank"]) == [1, 2, 3, 4]
+    assert np.all(np.diff(result["score"]) <= 0)
+    assert set(result["planet"].astype(str)) <= set(planets)
+    np.testing.assert_allclose(result["distance"], np.abs(result["level"] - result["cmp"]))
+    assert list(screen(WATCHLIST, DT, top=2)["symbol"]) == list(result["symbol"][:2])
+
+
+def test_nothing_active_gives_an_empty_frame():
+    result = screen(WATCHLIST, DT, now=datetime(2025, 3, 12, 23, 0))
+    assert result.empty and list(result.columns) == list(SCREEN_COLUMNS)
+
+
+def test_score_weights_nature_and_important_planet():
+    result = screen(WATCHLIST, DT)
+    weight = result["transit_nature"].astype(str).map(NATURE_WEIGHTS) * np.where(result["important"],
+                                                                                  IMPORTANT_WEIGHT, 1.0)
+    swing_range = result["swing_high"] - result["cmp"]
+    np.testing.assert_allclose(result["score"], weight / (1 + result["distance"] / swing_range))
+    assert NATURE_WEIGHTS["Favorable"] > NATURE_WEIGHTS["Negative"] > NATURE_WEIGHTS["Neutral"]
+
+
+def test_positions_are_computed_once(monkeypatch):
+    calls = []
+    original = screener.get_planetary_positions
+    monkeypatch.setattr(screener, "get_planetary_positions", lambda dt: calls.append(dt) or original(dt))
+    screen(WATCHLIST, DT)
+    assert calls == [DT]
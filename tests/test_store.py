@@ -0,0 +1,96 @@
+import os
+import sqlite3
+from datetime import date, datetime
+
+import pytest
+
+from astro_gann.report import generate_report
+from astro_gann.store import (DEFAULT_STORE_PATH, STORE_COLUMNS, STORE_VERSION, ReportStore,
+                               _user_data_dir, store_from_env)
+
+DT = datetime(2025, 3, 12, 11, 0)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ReportStore(str(tmp_path / "reports.sqlite"))
+    yield store
+    store.close()
+
+
+def test_new_cmp_keeps_history(store):
+    assert store.add([generate_report(DT, 24574.0, now=DT)]) == 7
+    assert store.add([generate_report(DT, 24600.0, now=DT)]) == 7
+    assert sorted(set(store.query(symbol="Nifty")["cmp"])) == [24574.0, 24600.0]
+
+
+def test_regenerated_report_is_not_rewritten(store):
+    store.add([generate_report(DT, 24574.0, now=DT)])
+    later = generate_report(DT, 24574.0, now=datetime(2025, 3, 12, 11, 1))
+    assert store.add([later, later]) == 0
+    assert store.count() == 7
+    assert store.stats()["skipped"] == 2
+
+
+def test_query_filters(store):
+    store.add([generate_report(datetime(2025, 3, day, 11, 0), 24574.0, symbol=symbol, now=DT)
+               for day in (10, 11, 12) for symbol in ("Nifty", "BankNifty")])
+    assert store.count() == 42
+    assert store.symbols() == ["BankNifty", "Nifty"]
+
+    day = store.query(symbol="Nifty", start=date(2025, 3, 11), end=date(2025, 3, 11))
+    assert list(day.columns) == list(STORE_COLUMNS)
+    assert len(day) == 7 and set(day["report_time"].dt.day) == {11}
+
+    mars = store.query(planet="Mars", transit_nature=["Favorable", "Negative", "Neutral"])
+    assert len(mars) == 6 and set(mars["planet"]) == {"Mars"}
+    assert store.count(important=True) == 6
+    assert len(store.query(end=datetime(2025, 3, 10, 11, 0))) == 14
+    assert len(store.query(limit=5)) == 5
+
+
+def test_version_1_store_is_migrated(tmp_path):
+    path = str(tmp_path / "old.sqlite")
+    store = ReportStore(path)
+    store.add([generate_report(DT, 24574.0, now=DT)])
+    store.close()
+    # Rebuild the table with the old key, which did not include the CMP
+    with sqlite3.connect(path) as db:
+        sql = db.execute("SELECT sql FROM sqlite_master WHERE name = 'report_rows'").fetchone()[0]
+        db.execute("ALTER TABLE report_rows RENAME TO tmp")
+        db.execute(sql.replace("report_time, cmp, market", "report_time, market"))
+        db.execute("INSERT INTO report_rows SELECT * FROM tmp")
+        db.execute("DROP TABLE tmp")
+        db.execute("PRAGMA user_version = 1")
+
+    store = ReportStore(path)
+    assert store.count() == 7
+    store.add([generate_report(DT, 24600.0, now=DT)])
+    assert store.count() == 14
+    store.close()
+    with sqlite3.connect(path) as db:
+        assert db.execute("PRAGMA user_version").fetchone()[0] == STORE_VERSION
+
+
+def test_current_transit_is_kept_from_first_add(store):
+    first = generate_report(DT, 24574.0, now=DT)
+    store.add([first])
+    store.add([generate_report(DT, 24574.0, now=datetime(2025, 3, 20, 11, 0))])
+    assert store.count() == 7
+    assert store.count(current_transit=True) == sum(row.current_transit for row in first.rows) > 0
+
+
+def test_store_from_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("ASTRO_GANN_STORE", "off")
+    assert store_from_env() is None
+    monkeypatch.setenv("ASTRO_GANN_STORE", str(tmp_path / "env.sqlite"))
+    store = store_from_env()
+    store.close()
+    assert (tmp_path / "env.sqlite").exists()
+
+
+def test_default_path_is_outside_the_checkout(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    assert _user_data_dir() == str(tmp_path)
+    checkout = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert not os.path.abspath(DEFAULT_STORE_PATH).startswith(checkout + os.sep)
@@ -0,0 +1,56 @@
+import io
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from astro_gann.report import REPORT_CATEGORIES, REPORT_SCHEMA
+from astro_gann.stream import RANGE_COLUMNS, iter_instants, iter_report_frames, parse_symbols, write_csv
+
+SYMBOLS = {"Nifty": 24574.0, "BankNifty": 52000.0}
+START, END = datetime(2025, 3, 7, 11, 0), datetime(2025, 3, 12, 11, 0)
+NOW = datetime(2025, 3, 12, 11, 0)
+
+
+def test_instants_skip_non_trading_days():
+    days = [dt.date() for dt in iter_instants(START, END)]
+    assert days == [date(2025, 3, 7), date(2025, 3, 10), date(2025, 3, 11), date(2025, 3, 12)]
+    assert len(list(iter_instants(START, END, timedelta(hours=12)))) == 7
+    with pytest.raises(ValueError):
+        next(iter_instants(START, END, 0))
+
+
+def test_parse_symbols():
+    assert parse_symbols("Nifty:24574, BankNifty:52000\nSensex: 81000") == {
+        "Nifty": 24574.0, "BankNifty": 52000.0, "Sensex": 81000.0}
+    with pytest.raises(ValueError, match="expected SYMBOL:CMP"):
+        parse_symbols("Nifty")
+
+
+def test_display_csv_has_one_header_and_every_row():
+    buffer = io.StringIO()
+    rows = write_csv(iter_report_frames(START, END, SYMBOLS, now=NOW), buffer)
+    frame = pd.read_csv(io.StringIO(buffer.getvalue()))
+    assert rows == len(frame) == 4 * len(SYMBOLS) * 7
+    assert list(frame.columns) == list(RANGE_COLUMNS)
+    assert list(frame["Date"].unique()) == ["2025-03-07", "2025-03-10", "2025-03-11", "2025-03-12"]
+
+
+def test_typed_csv_reads_back_to_the_schema(tmp_path):
+    frames = list(iter_report_frames(START, END, SYMBOLS, now=NOW, display=False))
+    path = str(tmp_path / "range.csv")
+    assert write_csv(iter(frames), path) == sum(len(frame) for frame in frames)
+
+    dates = ["report_time", "window_start", "window_end"]
+    back = pd.read_csv(path, parse_dates=dates)
+    for column, dtype in REPORT_SCHEMA.items():
+        if dtype.startswith("category:"):
+            back[column] = pd.Categorical(back[column], categories=REPORT_CATEGORIES[dtype.split(":", 1)[1]])
+        elif dtype == "category":
+            back[column] = back[column].astype("category")
+        else:
+            back[column] = back[column].astype(dtype)
+    back[dates] = back[dates].astype("datetime64[ns]")
+    expected = pd.concat(frames, ignore_index=True)
+    expected["symbol"] = expected["symbol"].astype(str).astype("category")
+    pd.testing.assert_frame_equal(back, expected, check_categorical=False)
@@ -0,0 +1,49 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from astro_gann.styles import (
+    HIGHLIGHT_CATEGORIES,
+    HIGHLIGHT_CSS,
+    frame_page,
+    highlight_rows,
+    page_count,
+    row_categories,
+    style_matrix,
+)
+
+
+def _frame(flags="Yes/No"):
+    combos = list(itertools.product((True, False), (True, False), ("Favorable", "Negative", "Neutral")))
+    important, current, nature = map(list, zip(*combos))
+    if flags == "Yes/No":
+        important = ["Yes" if value else "No" for value in important]
+        current = ["Yes" if value else "No" for value in current]
+    return pd.DataFrame({"Symbol": "Nifty", "Transit Nature": nature, "Important": important,
+                         "Current Transit": current})
+
+
+def test_row_categories_agree_with_highlight_rows():
+    frame = _frame()
+    codes = row_categories(frame)
+    for code, (_, row) in zip(codes, frame.iterrows()):
+        expected = HIGHLIGHT_CSS[HIGHLIGHT_CATEGORIES[code]] if code >= 0 else ""
+        assert highlight_rows(row) == [expected] * len(frame.columns)
+    assert set(codes) == {-1, *range(len(HIGHLIGHT_CATEGORIES))}
+    np.testing.assert_array_equal(row_categories(_frame(flags="bool")), codes)
+
+
+def test_style_matrix_matches_the_row_callback():
+    frame = _frame()
+    matrix = style_matrix(frame)
+    assert matrix.shape == frame.shape
+    expected = frame.apply(highlight_rows, axis=1, result_type="expand")
+    assert matrix.to_numpy().tolist() == expected.to_numpy().tolist()
+
+
+def test_pages():
+    frame = pd.DataFrame({"x": range(25)})
+    assert page_count(frame, 10) == 3 and page_count(frame.iloc[:0], 10) == 1
+    assert list(frame_page(frame, 3, 10)["x"]) == [20, 21, 22, 23, 24]
+    assert frame_page(frame, 4, 10).empty
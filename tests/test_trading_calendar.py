@@ -0,0 +1,43 @@
+from datetime import date, datetime, time, timedelta
+
+import numpy as np
+
+from astro_gann import INDIAN_MARKET, adjust_timing_to_market, calculate_timing, generate_report
+from astro_gann.trading_calendar import clip_to_sessions, get_calendar
+
+
+def test_special_session_overrides_holiday_hours():
+    calendar = get_calendar()[INDIAN_MARKET]
+    assert calendar.session(date(2024, 11, 1)) == (time(18, 0), time(19, 0))
+    assert calendar.special_session_name(date(2024, 11, 1)) == "Muhurat Trading"
+    assert calendar.holiday_name(date(2025, 3, 14)) == "Holi"
+    assert calendar.holiday_name(date(2025, 3, 15)) == "Weekend"
+    assert calendar.is_trading_day(date(2024, 1, 20))  # special Saturday session
+
+
+def test_timing_windows_centre_on_special_session():
+    dt = datetime(2024, 11, 1, 18, 30)
+    start, end = calculate_timing(dt, "Sun", INDIAN_MARKET)
+    assert start < dt < end
+    report = generate_report(dt, 100.0)
+    assert len(report.rows) == 7
+    assert all(time(18, 0) <= row.start.time() and row.end.time() <= time(19, 0) for row in report.rows)
+
+
+def test_closed_day_has_no_windows():
+    assert generate_report(datetime(2025, 3, 14, 11, 0), 100.0).rows == []
+
+
+def test_clip_to_sessions_matches_scalar_path():
+    rng = np.random.default_rng(0)
+    base = datetime(2024, 10, 28)
+    starts = [base + timedelta(minutes=int(m)) for m in rng.integers(0, 60 * 24 * 10, 500)]
+    ends = [start + timedelta(minutes=int(m)) for start, m in zip(starts, rng.integers(1, 600, 500))]
+    clipped_starts, clipped_ends = clip_to_sessions(np.array(starts, dtype="datetime64[ns]"),
+                                                    np.array(ends, dtype="datetime64[ns]"), INDIAN_MARKET)
+    for start, end, clipped_start, clipped_end in zip(starts, ends, clipped_starts, clipped_ends):
+        expected = adjust_timing_to_market(start, end, INDIAN_MARKET)
+        if expected == (None, None):
+            assert np.isnat(clipped_start) and np.isnat(clipped_end)
+        else:
+            assert (clipped_start, clipped_end) == tuple(np.datetime64(value, "ns") for value in expected)
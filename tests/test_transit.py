@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from astro_gann.core import FAVORABLE_DEGREES, PLANETS, UNFAVORABLE_DEGREES, get_transit_nature
+from astro_gann.rules import RuleSet
+from astro_gann.transit import transit_natures
+
+RULES = RuleSet.builtin()
+
+
+def _reference(planet, degree):
+    degree %= 360
+    if any(start <= degree < end for start, end in FAVORABLE_DEGREES[planet]):
+        return "Favorable"
+    if any(start <= degree < end for start, end in UNFAVORABLE_DEGREES[planet]):
+        return "Negative"
+    return "Neutral"
+
+
+@pytest.mark.parametrize("planet", PLANETS)
+def test_ranges_are_half_open(planet):
+    bounds = {value for ranges in (FAVORABLE_DEGREES[planet], UNFAVORABLE_DEGREES[planet])
+              for pair in ranges for value in pair}
+    degrees = sorted({d for bound in bounds for d in (bound - 1e-9, bound, bound + 1e-9)} | {-0.5, 359.5, 360.0})
+    expected = [_reference(planet, degree) for degree in degrees]
+    assert [get_transit_nature(planet, degree, RULES) for degree in degrees] == expected
+    assert list(transit_natures(degrees, planet, RULES)) == expected
+
+
+def test_sun_boundaries():
+    assert get_transit_nature("Sun", 29.999, RULES) == "Favorable"
+    assert get_transit_nature("Sun", 30.0, RULES) == "Neutral"
+    assert get_transit_nature("Sun", 330.0, RULES) == "Negative"
+    assert get_transit_nature("Sun", 360.0, RULES) == "Favorable"  # wraps to 0°
+
+
+def test_vectorized_grid_matches_scalar():
+    rng = np.random.default_rng(7)
+    degrees = rng.uniform(0, 360, size=(200, len(PLANETS)))
+    natures = transit_natures(degrees, PLANETS, RULES)
+    for row, planet_degrees in zip(natures, degrees):
+        assert list(row) == [get_transit_nature(p, d, RULES) for p, d in zip(PLANETS, planet_degrees)]